@@ -0,0 +1,899 @@
+def f0():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f1():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示。'
+
+def f2():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f3():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f4():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速，'
+
+def f5():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f6():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示？一般贸易进出口增长迅速！'
+
+def f7():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f8():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f9():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示！'
+
+def f10():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，一般贸易进出口增长迅速？中国对外贸易形势报告显示？'
+
+def f11():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示？'
+
+def f12():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f13():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！'
+
+def f14():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f15():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f16():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示，'
+
+def f17():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f18():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！'
+
+def f19():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f20():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f21():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f22():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f23():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f24():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f25():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？一般贸易进出口增长迅速！一般贸易进出口增长迅速！'
+
+def f26():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f27():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f28():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f29():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速。一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示？'
+
+def f30():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f31():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f32():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示！中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f33():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f34():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f35():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f36():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速？一般贸易进出口增长迅速，'
+
+def f37():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f38():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f39():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速，中国对外贸易形势报告显示，一般贸易进出口增长迅速！中国对外贸易形势报告显示。'
+
+def f40():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示！中国对外贸易形势报告显示？'
+
+def f41():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，一般贸易进出口增长迅速？中国对外贸易形势报告显示，一般贸易进出口增长迅速，'
+
+def f42():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f43():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示，一般贸易进出口增长迅速，'
+
+def f44():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。'
+
+def f45():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f46():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f47():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。'
+
+def f48():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示？'
+
+def f49():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示！一般贸易进出口增长迅速。一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f50():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？一般贸易进出口增长迅速，一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f51():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示？一般贸易进出口增长迅速！一般贸易进出口增长迅速。'
+
+def f52():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。中国对外贸易形势报告显示，'
+
+def f53():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，一般贸易进出口增长迅速，'
+
+def f54():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f55():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f56():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速！一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f57():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。'
+
+def f58():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f59():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，一般贸易进出口增长迅速。一般贸易进出口增长迅速，'
+
+def f60():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f61():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？一般贸易进出口增长迅速。一般贸易进出口增长迅速。'
+
+def f62():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f63():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示？'
+
+def f64():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，中国对外贸易形势报告显示！一般贸易进出口增长迅速！'
+
+def f65():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。一般贸易进出口增长迅速。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f66():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？一般贸易进出口增长迅速，'
+
+def f67():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f68():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f69():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f70():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示，一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f71():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f72():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f73():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f74():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f75():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。中国对外贸易形势报告显示！'
+
+def f76():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f77():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速。一般贸易进出口增长迅速，中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f78():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f79():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f80():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速？中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f81():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速？'
+
+def f82():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？'
+
+def f83():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？一般贸易进出口增长迅速，一般贸易进出口增长迅速，一般贸易进出口增长迅速！'
+
+def f84():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！'
+
+def f85():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！'
+
+def f86():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，'
+
+def f87():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f88():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f89():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f90():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！'
+
+def f91():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！'
+
+def f92():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f93():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速？'
+
+def f94():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示，'
+
+def f95():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速，'
+
+def f96():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f97():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f98():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f99():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f100():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。一般贸易进出口增长迅速，'
+
+def f101():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f102():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f103():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
+
+def f104():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？'
+
+def f105():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f106():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，中国对外贸易形势报告显示？一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f107():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f108():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。中国对外贸易形势报告显示，一般贸易进出口增长迅速？'
+
+def f109():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？'
+
+def f110():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f111():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f112():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，一般贸易进出口增长迅速！一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f113():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f114():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f115():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示。'
+
+def f116():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f117():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f118():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f119():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f120():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f121():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f122():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速。一般贸易进出口增长迅速？'
+
+def f123():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！一般贸易进出口增长迅速？一般贸易进出口增长迅速，'
+
+def f124():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示。一般贸易进出口增长迅速！'
+
+def f125():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f126():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f127():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示，一般贸易进出口增长迅速！中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f128():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示？一般贸易进出口增长迅速？一般贸易进出口增长迅速？'
+
+def f129():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f130():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f131():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f132():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f133():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f134():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f135():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。'
+
+def f136():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f137():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示！'
+
+def f138():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，'
+
+def f139():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，'
+
+def f140():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速！'
+
+def f141():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f142():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f143():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f144():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f145():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f146():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f147():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f148():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f149():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？'
+
+def f150():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。一般贸易进出口增长迅速！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f151():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速？一般贸易进出口增长迅速。'
+
+def f152():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f153():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示。'
+
+def f154():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f155():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f156():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f157():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。'
+
+def f158():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f159():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示。一般贸易进出口增长迅速！一般贸易进出口增长迅速！'
+
+def f160():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！'
+
+def f161():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示？'
+
+def f162():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！'
+
+def f163():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f164():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？'
+
+def f165():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！'
+
+def f166():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f167():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f168():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f169():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f170():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f171():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！'
+
+def f172():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f173():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。'
+
+def f174():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f175():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f176():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示？'
+
+def f177():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f178():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？一般贸易进出口增长迅速，'
+
+def f179():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f180():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速！中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f181():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f182():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速？'
+
+def f183():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f184():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f185():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f186():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f187():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f188():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f189():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f190():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示，中国对外贸易形势报告显示！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f191():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f192():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f193():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f194():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示？一般贸易进出口增长迅速！'
+
+def f195():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。'
+
+def f196():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速，中国对外贸易形势报告显示？'
+
+def f197():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示！中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f198():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f199():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f200():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f201():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。'
+
+def f202():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速。'
+
+def f203():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，'
+
+def f204():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f205():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f206():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，一般贸易进出口增长迅速？一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f207():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f208():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。'
+
+def f209():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示！'
+
+def f210():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f211():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示？'
+
+def f212():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f213():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示，'
+
+def f214():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f215():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。'
+
+def f216():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f217():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f218():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速？'
+
+def f219():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f220():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速，'
+
+def f221():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。'
+
+def f222():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f223():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f224():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f225():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
+
+def f226():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。一般贸易进出口增长迅速。一般贸易进出口增长迅速，中国对外贸易形势报告显示？'
+
+def f227():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f228():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f229():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f230():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f231():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f232():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f233():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！'
+
+def f234():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。'
+
+def f235():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f236():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！'
+
+def f237():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f238():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！'
+
+def f239():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f240():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f241():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f242():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示。'
+
+def f243():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f244():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示！'
+
+def f245():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？'
+
+def f246():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速，'
+
+def f247():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f248():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速！'
+
+def f249():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示。中国对外贸易形势报告显示，'
+
+def f250():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f251():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f252():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f253():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速！中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速，'
+
+def f254():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速！'
+
+def f255():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？'
+
+def f256():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，'
+
+def f257():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，一般贸易进出口增长迅速，'
+
+def f258():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f259():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f260():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f261():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f262():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，一般贸易进出口增长迅速？'
+
+def f263():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？中国对外贸易形势报告显示。'
+
+def f264():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f265():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f266():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速，一般贸易进出口增长迅速。一般贸易进出口增长迅速？'
+
+def f267():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示！中国对外贸易形势报告显示。中国对外贸易形势报告显示。一般贸易进出口增长迅速？'
+
+def f268():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f269():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f270():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示，'
+
+def f271():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f272():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f273():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f274():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速。一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f275():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速，一般贸易进出口增长迅速，一般贸易进出口增长迅速？'
+
+def f276():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f277():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速！'
+
+def f278():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。'
+
+def f279():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f280():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f281():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f282():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f283():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f284():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示！一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f285():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f286():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。一般贸易进出口增长迅速。一般贸易进出口增长迅速。'
+
+def f287():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f288():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f289():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f290():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！一般贸易进出口增长迅速。一般贸易进出口增长迅速。'
+
+def f291():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示？一般贸易进出口增长迅速，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f292():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f293():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f294():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f295():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f296():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f297():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。一般贸易进出口增长迅速，'
+
+def f298():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f299():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
@@ -0,0 +1,899 @@
+def f0():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示，中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f1():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f2():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f3():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f4():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。一般贸易进出口增长迅速，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f5():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速。中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f6():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f7():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f8():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示。'
+
+def f9():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。'
+
+def f10():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速！一般贸易进出口增长迅速。'
+
+def f11():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速！中国对外贸易形势报告显示！'
+
+def f12():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f13():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f14():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f15():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f16():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f17():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，一般贸易进出口增长迅速？'
+
+def f18():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？一般贸易进出口增长迅速，中国对外贸易形势报告显示？'
+
+def f19():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f20():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f21():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速！中国对外贸易形势报告显示。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f22():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！中国对外贸易形势报告显示？'
+
+def f23():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f24():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f25():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f26():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速，'
+
+def f27():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示？'
+
+def f28():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，一般贸易进出口增长迅速。中国对外贸易形势报告显示！一般贸易进出口增长迅速。'
+
+def f29():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f30():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f31():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示！'
+
+def f32():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f33():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速。一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f34():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。中国对外贸易形势报告显示！中国对外贸易形势报告显示。中国对外贸易形势报告显示。'
+
+def f35():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f36():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f37():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f38():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示，中国对外贸易形势报告显示？'
+
+def f39():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f40():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f41():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f42():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f43():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速。一般贸易进出口增长迅速？'
+
+def f44():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f45():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f46():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f47():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f48():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！'
+
+def f49():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速！中国对外贸易形势报告显示？'
+
+def f50():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f51():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，'
+
+def f52():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f53():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示！'
+
+def f54():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示。一般贸易进出口增长迅速。'
+
+def f55():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。'
+
+def f56():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f57():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，一般贸易进出口增长迅速？'
+
+def f58():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速。'
+
+def f59():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速。中国对外贸易形势报告显示？'
+
+def f60():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f61():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f62():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示，'
+
+def f63():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示！一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f64():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f65():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f66():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f67():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f68():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示？一般贸易进出口增长迅速，'
+
+def f69():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，一般贸易进出口增长迅速。一般贸易进出口增长迅速。'
+
+def f70():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f71():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f72():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f73():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速！中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示！'
+
+def f74():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！中国对外贸易形势报告显示。'
+
+def f75():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f76():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！'
+
+def f77():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。中国对外贸易形势报告显示，'
+
+def f78():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？'
+
+def f79():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f80():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f81():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示。'
+
+def f82():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f83():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速！一般贸易进出口增长迅速。中国对外贸易形势报告显示，'
+
+def f84():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f85():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f86():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f87():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f88():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f89():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f90():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示！一般贸易进出口增长迅速。一般贸易进出口增长迅速？一般贸易进出口增长迅速？'
+
+def f91():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速！一般贸易进出口增长迅速！中国对外贸易形势报告显示。'
+
+def f92():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f93():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f94():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f95():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f96():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。'
+
+def f97():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！中国对外贸易形势报告显示？中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f98():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示？'
+
+def f99():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f100():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f101():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f102():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速？一般贸易进出口增长迅速？'
+
+def f103():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示？一般贸易进出口增长迅速。'
+
+def f104():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f105():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f106():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。一般贸易进出口增长迅速！中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f107():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速？中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f108():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速！'
+
+def f109():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，一般贸易进出口增长迅速，'
+
+def f110():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，'
+
+def f111():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？一般贸易进出口增长迅速，中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f112():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示，中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示，'
+
+def f113():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f114():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速？中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f115():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f116():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。'
+
+def f117():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，'
+
+def f118():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速，中国对外贸易形势报告显示？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f119():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
+
+def f120():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示，一般贸易进出口增长迅速？'
+
+def f121():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速？'
+
+def f122():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f123():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f124():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f125():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示？'
+
+def f126():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f127():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示，'
+
+def f128():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！'
+
+def f129():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f130():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f131():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？一般贸易进出口增长迅速。中国对外贸易形势报告显示！'
+
+def f132():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
+
+def f133():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f134():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示？一般贸易进出口增长迅速，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f135():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。'
+
+def f136():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f137():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。'
+
+def f138():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速？'
+
+def f139():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f140():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f141():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f142():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示？一般贸易进出口增长迅速，'
+
+def f143():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！一般贸易进出口增长迅速。'
+
+def f144():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f145():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速！'
+
+def f146():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速！中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速。'
+
+def f147():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f148():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速！一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速，'
+
+def f149():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f150():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f151():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f152():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？'
+
+def f153():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速，一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f154():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f155():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f156():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f157():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f158():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f159():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速？中国对外贸易形势报告显示！'
+
+def f160():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速，'
+
+def f161():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示！一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f162():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！'
+
+def f163():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f164():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。'
+
+def f165():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f166():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示。'
+
+def f167():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示！中国对外贸易形势报告显示？'
+
+def f168():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f169():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f170():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f171():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f172():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速，中国对外贸易形势报告显示，中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f173():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f174():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。中国对外贸易形势报告显示。一般贸易进出口增长迅速，'
+
+def f175():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f176():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示？'
+
+def f177():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f178():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示，'
+
+def f179():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f180():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示？'
+
+def f181():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f182():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示。一般贸易进出口增长迅速，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f183():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示。'
+
+def f184():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f185():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，一般贸易进出口增长迅速！一般贸易进出口增长迅速。'
+
+def f186():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速！中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f187():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示？一般贸易进出口增长迅速。'
+
+def f188():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！'
+
+def f189():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。中国对外贸易形势报告显示。'
+
+def f190():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f191():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f192():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？一般贸易进出口增长迅速，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f193():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。中国对外贸易形势报告显示，'
+
+def f194():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f195():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？中国对外贸易形势报告显示！一般贸易进出口增长迅速？'
+
+def f196():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f197():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速。中国对外贸易形势报告显示。一般贸易进出口增长迅速，中国对外贸易形势报告显示？'
+
+def f198():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f199():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f200():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f201():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f202():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。'
+
+def f203():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f204():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？一般贸易进出口增长迅速。'
+
+def f205():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f206():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f207():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！'
+
+def f208():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？'
+
+def f209():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f210():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，'
+
+def f211():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？'
+
+def f212():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f213():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f214():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f215():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f216():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f217():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？'
+
+def f218():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示，'
+
+def f219():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f220():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！'
+
+def f221():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。一般贸易进出口增长迅速？一般贸易进出口增长迅速，'
+
+def f222():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速！'
+
+def f223():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！'
+
+def f224():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。'
+
+def f225():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。'
+
+def f226():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f227():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f228():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f229():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f230():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！'
+
+def f231():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，'
+
+def f232():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f233():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示？中国对外贸易形势报告显示。中国对外贸易形势报告显示。一般贸易进出口增长迅速？'
+
+def f234():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f235():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f236():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？一般贸易进出口增长迅速？'
+
+def f237():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f238():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f239():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f240():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f241():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示。一般贸易进出口增长迅速？'
+
+def f242():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f243():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f244():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！'
+
+def f245():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！中国对外贸易形势报告显示，'
+
+def f246():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f247():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f248():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f249():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f250():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示。一般贸易进出口增长迅速？'
+
+def f251():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示？中国对外贸易形势报告显示。一般贸易进出口增长迅速。'
+
+def f252():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f253():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f254():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f255():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，'
+
+def f256():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。'
+
+def f257():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f258():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f259():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f260():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f261():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速！中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f262():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，中国对外贸易形势报告显示？'
+
+def f263():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f264():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速！中国对外贸易形势报告显示。'
+
+def f265():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！'
+
+def f266():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f267():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示，一般贸易进出口增长迅速。'
+
+def f268():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f269():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。'
+
+def f270():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f271():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。一般贸易进出口增长迅速。'
+
+def f272():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！'
+
+def f273():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速。'
+
+def f274():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示！中国对外贸易形势报告显示！一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f275():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！一般贸易进出口增长迅速！'
+
+def f276():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，中国对外贸易形势报告显示！一般贸易进出口增长迅速。'
+
+def f277():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示。一般贸易进出口增长迅速，'
+
+def f278():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f279():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f280():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f281():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f282():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。中国对外贸易形势报告显示。'
+
+def f283():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！'
+
+def f284():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f285():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。一般贸易进出口增长迅速，中国对外贸易形势报告显示，'
+
+def f286():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示？中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f287():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f288():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f289():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f290():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示！'
+
+def f291():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示，'
+
+def f292():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速。'
+
+def f293():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f294():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！'
+
+def f295():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f296():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f297():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f298():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f299():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
@@ -0,0 +1,899 @@
+def f0():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速。'
+
+def f1():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。一般贸易进出口增长迅速！中国对外贸易形势报告显示！'
+
+def f2():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f3():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f4():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f5():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f6():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？中国对外贸易形势报告显示，'
+
+def f7():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f8():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！'
+
+def f9():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！'
+
+def f10():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示，'
+
+def f11():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速，一般贸易进出口增长迅速！中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f12():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f13():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f14():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f15():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示！一般贸易进出口增长迅速！'
+
+def f16():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f17():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f18():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f19():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f20():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f21():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f22():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。中国对外贸易形势报告显示。'
+
+def f23():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示，一般贸易进出口增长迅速！'
+
+def f24():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f25():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f26():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f27():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示，中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f28():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速！中国对外贸易形势报告显示。一般贸易进出口增长迅速！一般贸易进出口增长迅速。'
+
+def f29():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f30():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f31():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示！中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f32():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？中国对外贸易形势报告显示，'
+
+def f33():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速，一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f34():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示！'
+
+def f35():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f36():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f37():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f38():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f39():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f40():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f41():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？'
+
+def f42():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f43():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。中国对外贸易形势报告显示？'
+
+def f44():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f45():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？'
+
+def f46():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。'
+
+def f47():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示。'
+
+def f48():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f49():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f50():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f51():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f52():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f53():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f54():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f55():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f56():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f57():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，'
+
+def f58():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f59():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？'
+
+def f60():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f61():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示，'
+
+def f62():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！一般贸易进出口增长迅速。'
+
+def f63():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，一般贸易进出口增长迅速！'
+
+def f64():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f65():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f66():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，中国对外贸易形势报告显示？一般贸易进出口增长迅速，'
+
+def f67():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。中国对外贸易形势报告显示，一般贸易进出口增长迅速？'
+
+def f68():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示！一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示！'
+
+def f69():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f70():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。'
+
+def f71():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f72():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？'
+
+def f73():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示？中国对外贸易形势报告显示！中国对外贸易形势报告显示！中国对外贸易形势报告显示，'
+
+def f74():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f75():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f76():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速，一般贸易进出口增长迅速！'
+
+def f77():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f78():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，'
+
+def f79():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f80():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f81():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f82():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f83():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！'
+
+def f84():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，一般贸易进出口增长迅速，一般贸易进出口增长迅速。'
+
+def f85():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速？'
+
+def f86():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示？一般贸易进出口增长迅速！中国对外贸易形势报告显示？'
+
+def f87():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f88():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。'
+
+def f89():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速。中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f90():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f91():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速。'
+
+def f92():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。一般贸易进出口增长迅速，一般贸易进出口增长迅速？一般贸易进出口增长迅速。'
+
+def f93():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示！一般贸易进出口增长迅速！中国对外贸易形势报告显示，'
+
+def f94():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示！'
+
+def f95():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f96():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f97():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速，'
+
+def f98():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f99():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f100():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。'
+
+def f101():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？一般贸易进出口增长迅速。一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f102():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速？'
+
+def f103():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f104():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f105():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f106():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f107():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f108():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？中国对外贸易形势报告显示？'
+
+def f109():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速。中国对外贸易形势报告显示！'
+
+def f110():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f111():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，中国对外贸易形势报告显示。中国对外贸易形势报告显示，'
+
+def f112():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f113():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速！'
+
+def f114():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！一般贸易进出口增长迅速，中国对外贸易形势报告显示？'
+
+def f115():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示。中国对外贸易形势报告显示？一般贸易进出口增长迅速！'
+
+def f116():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。'
+
+def f117():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？一般贸易进出口增长迅速！'
+
+def f118():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f119():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f120():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速？中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f121():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f122():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f123():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速。一般贸易进出口增长迅速。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f124():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示？'
+
+def f125():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。一般贸易进出口增长迅速。'
+
+def f126():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示？中国对外贸易形势报告显示。'
+
+def f127():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f128():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示！一般贸易进出口增长迅速！中国对外贸易形势报告显示，一般贸易进出口增长迅速！'
+
+def f129():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f130():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f131():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速。'
+
+def f132():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f133():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速！一般贸易进出口增长迅速！'
+
+def f134():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f135():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速！中国对外贸易形势报告显示。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f136():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。'
+
+def f137():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f138():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f139():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f140():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f141():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，一般贸易进出口增长迅速！'
+
+def f142():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f143():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示。'
+
+def f144():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f145():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f146():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。'
+
+def f147():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f148():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速，一般贸易进出口增长迅速？中国对外贸易形势报告显示！'
+
+def f149():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？'
+
+def f150():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速。'
+
+def f151():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f152():
+    return '中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f153():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f154():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f155():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速！中国对外贸易形势报告显示！'
+
+def f156():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，一般贸易进出口增长迅速。'
+
+def f157():
+    return '一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。中国对外贸易形势报告显示。一般贸易进出口增长迅速。'
+
+def f158():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f159():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f160():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
+
+def f161():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f162():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示。一般贸易进出口增长迅速！一般贸易进出口增长迅速！中国对外贸易形势报告显示，'
+
+def f163():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f164():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速，'
+
+def f165():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f166():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f167():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！'
+
+def f168():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速！一般贸易进出口增长迅速，中国对外贸易形势报告显示？'
+
+def f169():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f170():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示？'
+
+def f171():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，'
+
+def f172():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f173():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！'
+
+def f174():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速。中国对外贸易形势报告显示？'
+
+def f175():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f176():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示。'
+
+def f177():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！'
+
+def f178():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示。'
+
+def f179():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f180():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示，'
+
+def f181():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？一般贸易进出口增长迅速，'
+
+def f182():
+    return '中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！中国对外贸易形势报告显示？'
+
+def f183():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！'
+
+def f184():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。中国对外贸易形势报告显示，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f185():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？一般贸易进出口增长迅速？一般贸易进出口增长迅速。'
+
+def f186():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。'
+
+def f187():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f188():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示！中国对外贸易形势报告显示，一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f189():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！'
+
+def f190():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示，中国对外贸易形势报告显示，'
+
+def f191():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f192():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f193():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速！中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。'
+
+def f194():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f195():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示？一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f196():
+    return '一般贸易进出口增长迅速，中国对外贸易形势报告显示，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f197():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。'
+
+def f198():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
+
+def f199():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f200():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，'
+
+def f201():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f202():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f203():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？中国对外贸易形势报告显示，'
+
+def f204():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f205():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f206():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。'
+
+def f207():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示？中国对外贸易形势报告显示。中国对外贸易形势报告显示！'
+
+def f208():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速！一般贸易进出口增长迅速，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f209():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f210():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速，'
+
+def f211():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。一般贸易进出口增长迅速？'
+
+def f212():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f213():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示。一般贸易进出口增长迅速！'
+
+def f214():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示。'
+
+def f215():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，中国对外贸易形势报告显示，'
+
+def f216():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f217():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f218():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f219():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速。中国对外贸易形势报告显示，'
+
+def f220():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示。'
+
+def f221():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f222():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，'
+
+def f223():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！中国对外贸易形势报告显示，'
+
+def f224():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f225():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？一般贸易进出口增长迅速！'
+
+def f226():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f227():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f228():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示！一般贸易进出口增长迅速？一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f229():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示。一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f230():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示！'
+
+def f231():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f232():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示！中国对外贸易形势报告显示！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f233():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示。一般贸易进出口增长迅速！中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f234():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示，中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f235():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？中国对外贸易形势报告显示？一般贸易进出口增长迅速。一般贸易进出口增长迅速。'
+
+def f236():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f237():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f238():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f239():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f240():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示。一般贸易进出口增长迅速。一般贸易进出口增长迅速？'
+
+def f241():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示。'
+
+def f242():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f243():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f244():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f245():
+    return '一般贸易进出口增长迅速？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。一般贸易进出口增长迅速，'
+
+def f246():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？中国对外贸易形势报告显示！一般贸易进出口增长迅速，'
+
+def f247():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速！'
+
+def f248():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？一般贸易进出口增长迅速！一般贸易进出口增长迅速，'
+
+def f249():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示。'
+
+def f250():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，一般贸易进出口增长迅速。中国对外贸易形势报告显示，中国对外贸易形势报告显示。'
+
+def f251():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示，中国对外贸易形势报告显示？中国对外贸易形势报告显示？一般贸易进出口增长迅速？'
+
+def f252():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示，'
+
+def f253():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f254():
+    return '一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？中国对外贸易形势报告显示！中国对外贸易形势报告显示。'
+
+def f255():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！中国对外贸易形势报告显示？'
+
+def f256():
+    return '中国对外贸易形势报告显示？一般贸易进出口增长迅速？一般贸易进出口增长迅速？中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f257():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示？中国对外贸易形势报告显示？一般贸易进出口增长迅速？一般贸易进出口增长迅速？'
+
+def f258():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f259():
+    return '中国对外贸易形势报告显示？中国对外贸易形势报告显示！一般贸易进出口增长迅速？中国对外贸易形势报告显示，中国对外贸易形势报告显示，'
+
+def f260():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f261():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速？中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速？'
+
+def f262():
+    return '一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示？'
+
+def f263():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。'
+
+def f264():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速，一般贸易进出口增长迅速。一般贸易进出口增长迅速，中国对外贸易形势报告显示，'
+
+def f265():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f266():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速？中国对外贸易形势报告显示！中国对外贸易形势报告显示？'
+
+def f267():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速？中国对外贸易形势报告显示？一般贸易进出口增长迅速，一般贸易进出口增长迅速，'
+
+def f268():
+    return '一般贸易进出口增长迅速，一般贸易进出口增长迅速。一般贸易进出口增长迅速！一般贸易进出口增长迅速。一般贸易进出口增长迅速！'
+
+def f269():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速？'
+
+def f270():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？中国对外贸易形势报告显示？'
+
+def f271():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，中国对外贸易形势报告显示。中国对外贸易形势报告显示。一般贸易进出口增长迅速。'
+
+def f272():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速？中国对外贸易形势报告显示。中国对外贸易形势报告显示。'
+
+def f273():
+    return '中国对外贸易形势报告显示。中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速，中国对外贸易形势报告显示。'
+
+def f274():
+    return '一般贸易进出口增长迅速？一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，'
+
+def f275():
+    return '中国对外贸易形势报告显示！中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f276():
+    return '一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f277():
+    return '中国对外贸易形势报告显示，中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f278():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速！'
+
+def f279():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示，一般贸易进出口增长迅速，一般贸易进出口增长迅速，'
+
+def f280():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示。中国对外贸易形势报告显示。中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f281():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示。中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。'
+
+def f282():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。一般贸易进出口增长迅速？一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f283():
+    return '一般贸易进出口增长迅速。一般贸易进出口增长迅速。中国对外贸易形势报告显示？中国对外贸易形势报告显示。占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f284():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！，中国对外贸易形势报告显示？一般贸易进出口增长迅速？中国对外贸易形势报告显示？'
+
+def f285():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！中国对外贸易形势报告显示，一般贸易进出口增长迅速，中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。'
+
+def f286():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，一般贸易进出口增长迅速，中国对外贸易形势报告显示！一般贸易进出口增长迅速。'
+
+def f287():
+    return '一般贸易进出口增长迅速！中国对外贸易形势报告显示？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速，中国对外贸易形势报告显示！'
+
+def f288():
+    return '中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速。'
+
+def f289():
+    return '一般贸易进出口增长迅速。中国对外贸易形势报告显示？一般贸易进出口增长迅速。中国对外贸易形势报告显示！占进出口总额的比重持续提升。服务贸易结构持续优化！！'
+
+def f290():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？'
+
+def f291():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！！一般贸易进出口增长迅速？中国对外贸易形势报告显示，一般贸易进出口增长迅速，一般贸易进出口增长迅速！'
+
+def f292():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！。中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f293():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！中国对外贸易形势报告显示，中国对外贸易形势报告显示！'
+
+def f294():
+    return '占进出口总额的比重持续提升。服务贸易结构持续优化！？占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速！中国对外贸易形势报告显示。中国对外贸易形势报告显示？'
+
+def f295():
+    return '中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！。一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f296():
+    return '中国对外贸易形势报告显示，一般贸易进出口增长迅速？中国对外贸易形势报告显示，占进出口总额的比重持续提升。服务贸易结构持续优化！，占进出口总额的比重持续提升。服务贸易结构持续优化！，'
+
+def f297():
+    return '一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！！占进出口总额的比重持续提升。服务贸易结构持续优化！。占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f298():
+    return '中国对外贸易形势报告显示。一般贸易进出口增长迅速！占进出口总额的比重持续提升。服务贸易结构持续优化！，一般贸易进出口增长迅速，占进出口总额的比重持续提升。服务贸易结构持续优化！？'
+
+def f299():
+    return '中国对外贸易形势报告显示！一般贸易进出口增长迅速！一般贸易进出口增长迅速。占进出口总额的比重持续提升。服务贸易结构持续优化！？一般贸易进出口增长迅速。'
@@ -10,6 +10,7 @@ def create_tables():
     """
     初始化数据库
     需要迁移到数据库的模型 要在application/configs/database_config.py的MIGRATE_MODELS里配置
+    已有数据库重复执行会补充新增的列与索引
     """
     from .knowledge_base_manager.db.migrate import create_tables as migrate_create_tables
     from xiaoapi.conf import settings
@@ -0,0 +1,46 @@
+from fastapi import FastAPI
+
+
+async def ingest_worker_event(app: FastAPI, status: bool):
+    """
+    启动/停止后台向量化 worker
+    """
+    from .knowledge_base_manager.ingest_worker import ingest_worker_pool
+
+    if status:
+        ingest_worker_pool.start()
+    else:
+        ingest_worker_pool.stop(timeout=5)
+
+
+async def executor_event(app: FastAPI, status: bool):
+    """
+    关闭时释放共享的线程池/进程池
+    """
+    from .knowledge_base_manager.file.utils import shutdown_executors
+
+    if not status:
+        shutdown_executors(wait=False)
+
+
+async def ocr_event(app: FastAPI, status: bool):
+    """
+    启动时在后台预加载一个 OCR 引擎（OCR_WARM_UP 为 True 时）：PDF_OCR_PARALLEL 为 True 时 PDF 在 OCR 进程中识别，
+    服务进程的引擎只用于图片、DOCX、PPTX，其余引擎在并发识别时按需创建，不长期占用内存与显存
+    """
+    from application.settings import OCR_WARM_UP
+    from .knowledge_base_manager.file.document_loaders.ocr import get_ocr_pool
+
+    if status and OCR_WARM_UP:
+        get_ocr_pool().warm_up_in_background(1)
+
+
+async def database_event(app: FastAPI, status: bool):
+    """
+    关闭时释放数据库连接池
+    """
+    from .knowledge_base_manager.db.base import engine, async_engine
+
+    if not status:
+        await async_engine.dispose()
+        engine.dispose()
@@ -1,16 +1,103 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 import json
 
-from application.settings import SQLALCHEMY_DATABASE_URL_SYNC
+from application.settings import SQLALCHEMY_DATABASE_URL_SYNC, SQLALCHEMY_DATABASE_URL_ASYNC, SQLITE_PRAGMAS, \
+    SQLITE_BEGIN_MODE, SQLALCHEMY_POOL_OPTIONS
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL_SYNC,
-    json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
-)
+
+# 写事务使用的执行选项：SQLite 上以 SQLITE_BEGIN_MODE 开始事务，其他数据库忽略该选项
+WRITE_EXECUTION_OPTIONS = {"sqlite_begin_mode": SQLITE_BEGIN_MODE}
+
+
+def set_sqlite_pragmas(dbapi_connection):
+    """
+    对新建立的 SQLite 连接执行 SQLITE_PRAGMAS，并关闭驱动自带的事务管理，由 begin 事件开始事务
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    for key, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {key}={value}")
+    cursor.close()
+
+
+def get_engine_options(url: str) -> dict:
+    """
+    获取数据库对应的连接池参数
+    """
+    url = make_url(url)
+    backend = url.get_backend_name()
+    options = dict(SQLALCHEMY_POOL_OPTIONS.get(backend, {}))
+    if backend == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # 内存数据库使用 SQLAlchemy 默认的单连接池
+            options = {}
+        # 连接会在线程池的不同线程中使用；锁等待由 busy_timeout 控制
+        options["connect_args"] = {"check_same_thread": False, "timeout": SQLITE_PRAGMAS.get("busy_timeout", 5000) / 1000}
+    return options
+
+
+def configure_sqlite_engine(engine: Engine):
+    """
+    为 SQLite 引擎注册事件：新连接执行 PRAGMA；带有 WRITE_EXECUTION_OPTIONS 的连接（写事务）以 SQLITE_BEGIN_MODE 开始事务，
+    其他连接（只读事务）以默认的 DEFERRED 开始，读取不会等待写锁。异步引擎传入 async_engine.sync_engine
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        set_sqlite_pragmas(dbapi_connection)
+
+    @event.listens_for(engine, "begin")
+    def on_begin(conn):
+        mode = conn.get_execution_options().get("sqlite_begin_mode", "DEFERRED")
+        conn.exec_driver_sql(f"BEGIN {mode}")
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL_SYNC) -> Engine:
+    engine = create_engine(
+        url,
+        json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
+        **get_engine_options(url),
+    )
+    configure_sqlite_engine(engine)
+    return engine
+
+
+def create_async_db_engine(url: str = SQLALCHEMY_DATABASE_URL_ASYNC) -> AsyncEngine:
+    options = get_engine_options(url)
+    if "pool_size" in options:
+        # aiosqlite 默认不使用连接池（NullPool），这里与其他数据库一样使用连接池
+        options["poolclass"] = AsyncAdaptedQueuePool
+    engine = create_async_engine(
+        url,
+        json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False),
+        **options,
+    )
+    configure_sqlite_engine(engine.sync_engine)
+    return engine
+
+
+engine = create_db_engine()
+async_engine = create_async_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False, bind=async_engine)
 
 Base: DeclarativeMeta = declarative_base()
+
+
+def lower_key(column: str):
+    """
+    生成列默认值：取同一行中 column 列的值转为小写，作为不区分大小写的等值查询的键
+    """
+    def default(context):
+        value = context.get_current_parameters().get(column)
+        return value.lower() if value is not None else None
+    return default
@@ -1,11 +1,27 @@
-from .base import engine, Base
+from sqlalchemy import inspect, text
+
+from .base import engine, Base, WRITE_EXECUTION_OPTIONS
 
 from .models.knowledge_base_model import KnowledgeBaseModel
 from .models.knowledge_file_model import KnowledgeFileModel, FileDocModel
+from .models.ingest_job_model import IngestJobModel, IngestCheckpointModel
+
+# 旧版本数据库中缺少的小写查询键列：{表: {键列: 原始列}}
+NAME_KEY_COLUMNS = {
+    KnowledgeBaseModel.__table__: {"kb_name_key": "kb_name"},
+    KnowledgeFileModel.__table__: {"kb_name_key": "kb_name", "file_name_key": "file_name"},
+    FileDocModel.__table__: {"kb_name_key": "kb_name", "file_name_key": "file_name"},
+    IngestJobModel.__table__: {"kb_name_key": "kb_name"},
+}
+# 旧版本数据库中缺少的其他列：{表: [列名]}，旧数据使用列的 server_default
+ADDED_COLUMNS = {
+    KnowledgeBaseModel.__table__: ["version"],
+}
 
 
 def create_tables():
     Base.metadata.create_all(bind=engine)
+    upgrade_tables()
 
 
 def reset_tables():
@@ -13,6 +29,46 @@ def reset_tables():
     create_tables()
 
 
+def upgrade_tables():
+    """
+    升级旧版本创建的数据库：补充小写的查询键列并回填数据，补充新增的列，然后创建索引。可以重复执行。
+    """
+    with engine.execution_options(**WRITE_EXECUTION_OPTIONS).begin() as conn:
+        # 检查表结构需要使用同一个连接，另开连接会等待本事务持有的写锁
+        inspector = inspect(conn)
+        for table, columns in ADDED_COLUMNS.items():
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in columns:
+                if column not in existing_columns:
+                    column_type = table.c[column].type.compile(dialect=engine.dialect)
+                    default = table.c[column].server_default.arg.text
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column} {column_type} "
+                                      f"NOT NULL DEFAULT {default}"))
+
+        for table, key_columns in NAME_KEY_COLUMNS.items():
+            existing_columns = {c["name"] for c in inspector.get_columns(table.name)}
+            for key_column, column in key_columns.items():
+                if key_column not in existing_columns:
+                    column_type = table.c[key_column].type.compile(dialect=engine.dialect)
+                    conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {key_column} {column_type}"))
+
+                # 只回填键列为空的行（本次新增的列或上次中断的升级），已回填的数据库重复执行时不再读取数据
+                # SQLite 的 lower() 只转换 ASCII 字符，包含非 ASCII 字符的名称用 Python 计算，与写入时保持一致
+                if engine.dialect.name == "sqlite":
+                    rows = conn.execute(text(f"SELECT id, {column} FROM {table.name} "
+                                             f"WHERE {key_column} IS NULL AND {column} GLOB '*[^ -~]*'")).all()
+                    params = [{"id": row[0], "key": row[1].lower()} for row in rows]
+                    if params:
+                        conn.execute(text(f"UPDATE {table.name} SET {key_column} = :key WHERE id = :id"), params)
+
+                conn.execute(text(f"UPDATE {table.name} SET {key_column} = lower({column}) "
+                                  f"WHERE {key_column} IS NULL AND {column} IS NOT NULL"))
+
+        for table in NAME_KEY_COLUMNS:
+            for index in table.indexes:
+                index.create(bind=conn, checkfirst=True)
+
+
 if __name__ == "__main__":
     create_tables()
     # reset_tables()
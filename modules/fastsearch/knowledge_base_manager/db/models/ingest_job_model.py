@@ -0,0 +1,66 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, JSON, Text, Index, func
+
+from modules.fastsearch.knowledge_base_manager.db.base import Base, lower_key
+
+
+class IngestJobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FINISHED = [SUCCEEDED, FAILED, CANCELLED]
+
+
+class IngestJobModel(Base):
+    """
+    向量化任务模型
+    """
+    __tablename__ = 'ingest_job'
+    __table_args__ = (
+        Index('ix_ingest_job_kb_create', 'kb_name_key', 'create_time'),
+    )
+    id = Column(String(32), primary_key=True, comment='任务ID')
+    kb_name = Column(String(50), comment='知识库名称')
+    kb_name_key = Column(String(50), default=lower_key("kb_name"), comment='小写的知识库名称，用于查询')
+    file_names = Column(JSON, default=[], comment='待向量化的文件名称')
+    params = Column(JSON, default={}, comment='分词参数：chunk_size, chunk_overlap, zh_title_enhance')
+    status = Column(String(20), default=IngestJobStatus.PENDING, comment='任务状态')
+    total = Column(Integer, default=0, comment='文件总数')
+    finished = Column(Integer, default=0, comment='已处理文件数')
+    failed_files = Column(JSON, default={}, comment='处理失败的文件及原因')
+    attempts = Column(Integer, default=0, comment='已执行次数')
+    max_attempts = Column(Integer, default=3, comment='最大执行次数')
+    cancel_requested = Column(Boolean, default=False, comment='是否请求取消')
+    worker_id = Column(String(64), comment='执行该任务的worker')
+    lease_expire_time = Column(Float, default=0.0, comment='任务租约到期时间，超时未续约的任务会被重新领取')
+    error = Column(Text, comment='最近一次执行的错误信息')
+    create_time = Column(DateTime, default=func.now(), comment='创建时间')
+    update_time = Column(DateTime, default=func.now(), onupdate=func.now(), comment='更新时间')
+
+    def __repr__(self):
+        return f"<IngestJob(id='{self.id}', kb_name='{self.kb_name}', status='{self.status}', finished='{self.finished}/{self.total}', attempts='{self.attempts}')>"
+
+
+class IngestCheckpointModel(Base):
+    """
+    文件向量化进度模型：按行向量化的文件（csv、jsonl）每写入一批文档记录一次已完成的行数，
+    向量化中断后重新执行时，文件未修改则从记录的行数继续。文件向量化完成后删除
+    """
+    __tablename__ = 'ingest_checkpoint'
+    __table_args__ = (
+        Index('ix_ingest_checkpoint_kb_file', 'kb_name_key', 'file_name_key'),
+    )
+    id = Column(Integer, primary_key=True, autoincrement=True, comment='ID')
+    kb_name = Column(String(50), comment='知识库名称')
+    file_name = Column(String(255), comment='文件名称')
+    kb_name_key = Column(String(50), default=lower_key("kb_name"), comment='小写的知识库名称，用于查询')
+    file_name_key = Column(String(255), default=lower_key("file_name"), comment='小写的文件名称，用于查询')
+    file_mtime = Column(Float, default=0.0, comment="开始向量化时文件的修改时间")
+    file_size = Column(Integer, default=0, comment="开始向量化时文件的大小")
+    docs_count = Column(Integer, default=0, comment="已写入向量库并记录的文档数（行数）")
+    update_time = Column(DateTime, default=func.now(), onupdate=func.now(), comment='更新时间')
+
+    def __repr__(self):
+        return f"<IngestCheckpoint(kb_name='{self.kb_name}', file_name='{self.file_name}', docs_count='{self.docs_count}')>"
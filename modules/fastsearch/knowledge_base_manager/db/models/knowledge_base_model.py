@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, func
+from sqlalchemy import Column, Integer, String, DateTime, func, text
 
-from modules.fastsearch.knowledge_base_manager.db.base import Base
+from modules.fastsearch.knowledge_base_manager.db.base import Base, lower_key
 
 
 class KnowledgeBaseModel(Base):
@@ -10,10 +10,13 @@ class KnowledgeBaseModel(Base):
     __tablename__ = 'knowledge_base'
     id = Column(Integer, primary_key=True, autoincrement=True, comment='知识库ID')
     kb_name = Column(String(50), comment='知识库名称')
+    kb_name_key = Column(String(50), default=lower_key("kb_name"), index=True, comment='小写的知识库名称，用于查询')
     kb_info = Column(String(200), comment='知识库简介(用于Agent)')
     vs_type = Column(String(50), comment='向量库类型')
     file_count = Column(Integer, default=0, comment='文件数量')
     create_time = Column(DateTime, default=func.now(), comment='创建时间')
+    version = Column(Integer, default=1, server_default=text("1"), nullable=False,
+                     comment='版本号，清空知识库或修改向量库类型时加1，用于通知其他工作进程刷新缓存')
 
     def __repr__(self):
-        return f"<KnowledgeBase(id='{self.id}', kb_name='{self.kb_name}',kb_intro='{self.kb_info} vs_type='{self.vs_type}', file_count='{self.file_count}', create_time='{self.create_time}')>"
+        return f"<KnowledgeBase(id='{self.id}', kb_name='{self.kb_name}',kb_intro='{self.kb_info} vs_type='{self.vs_type}', file_count='{self.file_count}', create_time='{self.create_time}', version='{self.version}')>"
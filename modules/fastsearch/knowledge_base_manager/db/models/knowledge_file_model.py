@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, JSON, func
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, JSON, Index, func
 
-from modules.fastsearch.knowledge_base_manager.db.base import Base
+from modules.fastsearch.knowledge_base_manager.db.base import Base, lower_key
 
 
 class KnowledgeFileModel(Base):
@@ -8,10 +8,15 @@ class KnowledgeFileModel(Base):
     知识文件模型
     """
     __tablename__ = 'knowledge_file'
+    __table_args__ = (
+        Index('ix_knowledge_file_kb_file', 'kb_name_key', 'file_name_key'),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True, comment='知识文件ID')
     file_name = Column(String(255), comment='文件名')
     file_ext = Column(String(10), comment='文件扩展名')
     kb_name = Column(String(50), comment='所属知识库名称')
+    kb_name_key = Column(String(50), default=lower_key("kb_name"), comment='小写的知识库名称，用于查询')
+    file_name_key = Column(String(255), default=lower_key("file_name"), comment='小写的文件名，用于查询')
     document_loader_name = Column(String(50), comment='文档加载器名称')
     text_splitter_name = Column(String(50), comment='文本分割器名称')
     file_version = Column(Integer, default=1, comment='文件版本')
@@ -30,9 +35,15 @@ class FileDocModel(Base):
     文件-向量库文档模型
     """
     __tablename__ = 'file_doc'
+    __table_args__ = (
+        Index('ix_file_doc_kb_file', 'kb_name_key', 'file_name_key'),
+        Index('ix_file_doc_kb_doc', 'kb_name_key', 'doc_id'),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True, comment='ID')
     kb_name = Column(String(50), comment='知识库名称')
     file_name = Column(String(255), comment='文件名称')
+    kb_name_key = Column(String(50), default=lower_key("kb_name"), comment='小写的知识库名称，用于查询')
+    file_name_key = Column(String(255), default=lower_key("file_name"), comment='小写的文件名称，用于查询')
     doc_id = Column(String(50), comment="向量库文档ID")
     meta_data = Column(JSON, default={})
 
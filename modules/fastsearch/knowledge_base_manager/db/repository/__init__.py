@@ -1,2 +1,3 @@
 from .knowledge_base_repository import *
 from .knowledge_file_repository import *
+from .ingest_job_repository import *
@@ -0,0 +1,247 @@
+import time
+import uuid
+from typing import List, Dict, Optional
+
+from sqlalchemy import or_, and_, select, Select
+
+from modules.fastsearch.knowledge_base_manager.db.models.ingest_job_model import IngestJobModel, IngestJobStatus
+from modules.fastsearch.knowledge_base_manager.db.session import with_session, with_readonly_session, with_async_session
+
+
+def _job_to_dict(job: IngestJobModel) -> dict:
+    return {
+        "job_id": job.id,
+        "kb_name": job.kb_name,
+        "file_names": job.file_names,
+        "params": job.params,
+        "status": job.status,
+        "total": job.total,
+        "finished": job.finished,
+        "failed_files": job.failed_files,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "cancel_requested": job.cancel_requested,
+        "error": job.error,
+        "create_time": job.create_time,
+        "update_time": job.update_time,
+    }
+
+
+@with_session
+def add_job_to_db(session,
+                  kb_name: str,
+                  file_names: List[str],
+                  params: Dict = {},
+                  max_attempts: int = 3,
+                  ) -> str:
+    '''
+    新增一个待执行的向量化任务，返回任务ID
+    '''
+    job = IngestJobModel(
+        id=uuid.uuid4().hex,
+        kb_name=kb_name,
+        file_names=file_names,
+        params=params,
+        status=IngestJobStatus.PENDING,
+        total=len(file_names),
+        finished=0,
+        failed_files={},
+        attempts=0,
+        max_attempts=max_attempts,
+    )
+    session.add(job)
+    return job.id
+
+
+@with_session
+def claim_job_from_db(session, worker_id: str, lease_seconds: float) -> Optional[Dict]:
+    '''
+    领取一个可执行的任务：待执行的任务，或租约已过期（执行它的worker已退出）的任务。
+    通过带条件的 UPDATE 保证同一任务同一时刻只会被一个 worker 领取。
+    '''
+    now = time.time()
+    claimable = or_(
+        IngestJobModel.status == IngestJobStatus.PENDING,
+        and_(IngestJobModel.status == IngestJobStatus.RUNNING,
+             IngestJobModel.lease_expire_time < now),
+    )
+
+    # 重试次数已用完且租约过期的任务直接标记为失败
+    (session.query(IngestJobModel)
+     .filter(IngestJobModel.status == IngestJobStatus.RUNNING,
+             IngestJobModel.lease_expire_time < now,
+             IngestJobModel.attempts >= IngestJobModel.max_attempts)
+     .update({"status": IngestJobStatus.FAILED,
+              "error": "任务执行超时，且已达到最大重试次数"},
+             synchronize_session=False))
+
+    candidates = (session.query(IngestJobModel.id)
+                  .filter(claimable, IngestJobModel.attempts < IngestJobModel.max_attempts)
+                  .order_by(IngestJobModel.create_time)
+                  .limit(10)
+                  .all())
+    for (job_id,) in candidates:
+        count = (session.query(IngestJobModel)
+                 .filter(IngestJobModel.id == job_id, claimable)
+                 .update({"status": IngestJobStatus.RUNNING,
+                          "worker_id": worker_id,
+                          "lease_expire_time": now + lease_seconds,
+                          "attempts": IngestJobModel.attempts + 1},
+                         synchronize_session=False))
+        session.commit()
+        if count == 1:
+            job = session.query(IngestJobModel).filter(IngestJobModel.id == job_id).first()
+            return _job_to_dict(job)
+    return None
+
+
+@with_session
+def update_job_progress(session,
+                        job_id: str,
+                        worker_id: str,
+                        finished: int,
+                        failed_files: Dict,
+                        lease_seconds: float,
+                        ) -> bool:
+    '''
+    更新任务进度并续约。
+    返回任务是否应继续执行：任务被请求取消或租约已被其他 worker 接管时返回 False
+    '''
+    job = (session.query(IngestJobModel)
+           .filter(IngestJobModel.id == job_id, IngestJobModel.worker_id == worker_id)
+           .first())
+    if job is None or job.status != IngestJobStatus.RUNNING:
+        return False
+
+    job.finished = finished
+    job.failed_files = failed_files
+    job.lease_expire_time = time.time() + lease_seconds
+    return not job.cancel_requested
+
+
+@with_session
+def renew_job_lease(session, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+    '''
+    续约执行中的任务，单个文件处理时间较长时由 worker 定时调用。
+    返回是否续约成功：任务已结束或租约已被其他 worker 接管时返回 False
+    '''
+    count = (session.query(IngestJobModel)
+             .filter(IngestJobModel.id == job_id,
+                     IngestJobModel.worker_id == worker_id,
+                     IngestJobModel.status == IngestJobStatus.RUNNING)
+             .update({"lease_expire_time": time.time() + lease_seconds}, synchronize_session=False))
+    return count == 1
+
+
+@with_session
+def finish_job_in_db(session,
+                     job_id: str,
+                     worker_id: str,
+                     status: str,
+                     failed_files: Dict = None,
+                     error: str = None,
+                     ) -> bool:
+    '''
+    结束任务，status 为 succeeded/failed/cancelled
+    '''
+    job = (session.query(IngestJobModel)
+           .filter(IngestJobModel.id == job_id, IngestJobModel.worker_id == worker_id)
+           .first())
+    if job is None:
+        return False
+
+    job.status = status
+    if failed_files is not None:
+        job.failed_files = failed_files
+    if status == IngestJobStatus.SUCCEEDED:
+        job.finished = job.total
+    job.error = error
+    job.lease_expire_time = 0.0
+    return True
+
+
+@with_session
+def retry_job_in_db(session, job_id: str, worker_id: str, error: str) -> str:
+    '''
+    任务执行出错时调用：未达到最大执行次数则重新放回队列，否则标记为失败。
+    返回任务的新状态
+    '''
+    job = (session.query(IngestJobModel)
+           .filter(IngestJobModel.id == job_id, IngestJobModel.worker_id == worker_id)
+           .first())
+    if job is None:
+        return ""
+
+    if job.cancel_requested:
+        job.status = IngestJobStatus.CANCELLED
+    elif job.attempts < job.max_attempts:
+        job.status = IngestJobStatus.PENDING
+    else:
+        job.status = IngestJobStatus.FAILED
+    job.error = error
+    job.lease_expire_time = 0.0
+    return job.status
+
+
+@with_session
+def cancel_job_in_db(session, job_id: str) -> Optional[str]:
+    '''
+    取消任务：待执行的任务直接取消，执行中的任务标记为请求取消，由 worker 在处理完当前文件后停止。
+    返回任务的新状态，任务不存在时返回 None
+    '''
+    job = session.query(IngestJobModel).filter(IngestJobModel.id == job_id).first()
+    if job is None:
+        return None
+
+    if job.status == IngestJobStatus.PENDING:
+        job.status = IngestJobStatus.CANCELLED
+    elif job.status == IngestJobStatus.RUNNING:
+        job.cancel_requested = True
+    return job.status
+
+
+@with_readonly_session
+def get_job_detail(session, job_id: str) -> dict:
+    job = session.query(IngestJobModel).filter(IngestJobModel.id == job_id).first()
+    if job:
+        return _job_to_dict(job)
+    else:
+        return {}
+
+
+@with_async_session
+async def aget_job_detail(session, job_id: str) -> dict:
+    job = await session.get(IngestJobModel, job_id)
+    if job:
+        return _job_to_dict(job)
+    else:
+        return {}
+
+
+def _select_jobs(kb_name: str = None, status: str = None, limit: int = 50) -> Select:
+    stmt = select(IngestJobModel)
+    if kb_name:
+        stmt = stmt.filter(IngestJobModel.kb_name_key == kb_name.lower())
+    if status:
+        stmt = stmt.filter(IngestJobModel.status == status)
+    return stmt.order_by(IngestJobModel.create_time.desc()).limit(limit)
+
+
+@with_readonly_session
+def list_jobs_from_db(session,
+                      kb_name: str = None,
+                      status: str = None,
+                      limit: int = 50,
+                      ) -> List[Dict]:
+    jobs = session.execute(_select_jobs(kb_name, status, limit)).scalars()
+    return [_job_to_dict(job) for job in jobs]
+
+
+@with_async_session
+async def alist_jobs_from_db(session,
+                             kb_name: str = None,
+                             status: str = None,
+                             limit: int = 50,
+                             ) -> List[Dict]:
+    jobs = await session.execute(_select_jobs(kb_name, status, limit))
+    return [_job_to_dict(job) for job in jobs.scalars()]
@@ -1,37 +1,49 @@
 from modules.fastsearch.knowledge_base_manager.db.models.knowledge_base_model import KnowledgeBaseModel
-from modules.fastsearch.knowledge_base_manager.db.session import with_session
+from modules.fastsearch.knowledge_base_manager.db.session import with_session, with_readonly_session, with_async_session
+
+from typing import List, Optional, Tuple
+
+from sqlalchemy import select, update
 
 
 @with_session
 def add_kb_to_db(session, kb_name, kb_info, vs_type):
     # 创建知识库实例
-    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name.ilike(kb_name)).first()
+    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_name.lower()).first()
     if not kb:
         kb = KnowledgeBaseModel(kb_name=kb_name, kb_info=kb_info, vs_type=vs_type)
         session.add(kb)
     else:  # update kb with new vs_type
         kb.kb_info = kb_info
-        kb.vs_type = vs_type
+        if kb.vs_type != vs_type:
+            kb.vs_type = vs_type
+            kb.version = KnowledgeBaseModel.version + 1
     return True
 
 
-@with_session
+@with_readonly_session
 def list_kbs_from_db(session, min_file_count: int = -1):
     kbs = session.query(KnowledgeBaseModel.kb_name).filter(KnowledgeBaseModel.file_count > min_file_count).all()
     kbs = [kb[0] for kb in kbs]
     return kbs
 
 
-@with_session
+@with_async_session
+async def alist_kbs_from_db(session, min_file_count: int = -1):
+    kbs = await session.execute(select(KnowledgeBaseModel.kb_name).filter(KnowledgeBaseModel.file_count > min_file_count))
+    return kbs.scalars().all()
+
+
+@with_readonly_session
 def kb_exists(session, kb_name):
-    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name.ilike(kb_name)).first()
+    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_name.lower()).first()
     status = True if kb else False
     return status
 
 
-@with_session
+@with_readonly_session
 def load_kb_from_db(session, kb_name):
-    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name.ilike(kb_name)).first()
+    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_name.lower()).first()
     if kb:
         kb_name, vs_type = kb.kb_name, kb.vs_type
     else:
@@ -39,24 +51,97 @@ def load_kb_from_db(session, kb_name):
     return kb_name, vs_type
 
 
+@with_async_session
+async def aload_kb_from_db(session, kb_name):
+    kb = await session.scalar(select(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_name.lower()))
+    if kb:
+        kb_name, vs_type = kb.kb_name, kb.vs_type
+    else:
+        kb_name, vs_type = None, None
+    return kb_name, vs_type
+
+
+@with_readonly_session
+def get_kb_version(session, kb_name) -> Optional[Tuple[int, int]]:
+    '''
+    返回知识库的 (id, version)，不存在时返回 None。
+    删除后重新创建的同名知识库 id 不同，清空知识库等操作会增加 version，两者都相同时缓存的知识库服务仍然有效
+    '''
+    row = session.query(KnowledgeBaseModel.id, KnowledgeBaseModel.version) \
+        .filter(KnowledgeBaseModel.kb_name_key == kb_name.lower()).first()
+    return tuple(row) if row else None
+
+
+def _kb_version_to_dict(row) -> dict:
+    return {"kb_name": row.kb_name, "vs_type": row.vs_type, "id": row.id, "version": row.version}
+
+
+def _select_kb_versions():
+    return select(KnowledgeBaseModel.kb_name, KnowledgeBaseModel.vs_type,
+                  KnowledgeBaseModel.id, KnowledgeBaseModel.version)
+
+
+@with_readonly_session
+def list_kb_versions_from_db(session) -> List[dict]:
+    '''
+    一次查询返回所有知识库的名称、向量库类型、id与版本号，用于缓存知识库目录
+    '''
+    return [_kb_version_to_dict(row) for row in session.execute(_select_kb_versions())]
+
+
+@with_async_session
+async def alist_kb_versions_from_db(session) -> List[dict]:
+    return [_kb_version_to_dict(row) for row in await session.execute(_select_kb_versions())]
+
+
+@with_session
+def bump_kb_version(session, kb_name) -> bool:
+    '''
+    增加知识库的版本号，通知其他工作进程缓存的知识库服务已失效
+    '''
+    result = session.execute(update(KnowledgeBaseModel)
+                             .where(KnowledgeBaseModel.kb_name_key == kb_name.lower())
+                             .values(version=KnowledgeBaseModel.version + 1))
+    return result.rowcount > 0
+
+
 @with_session
 def delete_kb_from_db(session, kb_name):
-    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name.ilike(kb_name)).first()
+    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_name.lower()).first()
     if kb:
         session.delete(kb)
     return True
 
 
-@with_session
+def _kb_to_dict(kb: KnowledgeBaseModel) -> dict:
+    return {
+        "kb_name": kb.kb_name,
+        "kb_info": kb.kb_info,
+        "vs_type": kb.vs_type,
+        "file_count": kb.file_count,
+        "create_time": kb.create_time,
+    }
+
+
+@with_readonly_session
 def get_kb_detail(session, kb_name: str) -> dict:
-    kb: KnowledgeBaseModel = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name.ilike(kb_name)).first()
+    kb: KnowledgeBaseModel = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_name.lower()).first()
     if kb:
-        return {
-            "kb_name": kb.kb_name,
-            "kb_info": kb.kb_info,
-            "vs_type": kb.vs_type,
-            "file_count": kb.file_count,
-            "create_time": kb.create_time,
-        }
+        return _kb_to_dict(kb)
     else:
         return {}
+
+
+@with_readonly_session
+def list_kb_details_from_db(session) -> List[dict]:
+    '''
+    一次查询返回所有知识库的信息，形式同 get_kb_detail
+    '''
+    kbs = session.query(KnowledgeBaseModel).order_by(KnowledgeBaseModel.id).all()
+    return [_kb_to_dict(kb) for kb in kbs]
+
+
+@with_async_session
+async def alist_kb_details_from_db(session) -> List[dict]:
+    kbs = await session.execute(select(KnowledgeBaseModel).order_by(KnowledgeBaseModel.id))
+    return [_kb_to_dict(kb) for kb in kbs.scalars()]
@@ -1,12 +1,62 @@
 from modules.fastsearch.knowledge_base_manager.db.models.knowledge_base_model import KnowledgeBaseModel
 from modules.fastsearch.knowledge_base_manager.db.models.knowledge_file_model import KnowledgeFileModel, FileDocModel
-from modules.fastsearch.knowledge_base_manager.db.session import with_session
+from modules.fastsearch.knowledge_base_manager.db.models.ingest_job_model import IngestCheckpointModel
+from modules.fastsearch.knowledge_base_manager.db.session import with_session, with_readonly_session, with_async_session
 from modules.fastsearch.knowledge_base_manager.file.knowledge_file import KnowledgeFile
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 
+from sqlalchemy import insert, select, update, Select
+from sqlalchemy.orm import Session
 
-@with_session
+
+def _insert_docs(session: Session, kb_name: str, file_name: str, doc_infos: List[Dict]):
+    '''
+    在当前事务中批量写入Document信息，使用一条 executemany 语句而不是逐条创建ORM对象。
+    '''
+    if not doc_infos:
+        return
+    session.execute(
+        insert(FileDocModel),
+        [{"kb_name": kb_name, "file_name": file_name, "doc_id": d["id"], "meta_data": d["metadata"]}
+         for d in doc_infos],
+    )
+
+
+def _delete_docs(session: Session, kb_name: str, file_name: str = None):
+    '''
+    在当前事务中删除某知识库某文件对应的所有Document信息。
+    '''
+    query = session.query(FileDocModel).filter(FileDocModel.kb_name_key == kb_name.lower())
+    if file_name:
+        query = query.filter(FileDocModel.file_name_key == file_name.lower())
+    query.delete(synchronize_session=False)
+
+
+def _delete_checkpoints(session: Session, kb_name: str, file_name: str = None):
+    '''
+    在当前事务中删除某知识库某文件的向量化进度。
+    '''
+    query = session.query(IngestCheckpointModel).filter(IngestCheckpointModel.kb_name_key == kb_name.lower())
+    if file_name:
+        query = query.filter(IngestCheckpointModel.file_name_key == file_name.lower())
+    query.delete(synchronize_session=False)
+
+
+def _select_docs(kb_name: str, file_name: str = None, metadata: Dict = {}) -> Select:
+    stmt = select(FileDocModel).filter(FileDocModel.kb_name_key == kb_name.lower())
+    if file_name:
+        # 文件名中包含 % 时按通配符匹配，否则使用索引等值查询
+        if "%" in file_name:
+            stmt = stmt.filter(FileDocModel.file_name_key.like(file_name.lower()))
+        else:
+            stmt = stmt.filter(FileDocModel.file_name_key == file_name.lower())
+    for k, v in metadata.items():
+        stmt = stmt.filter(FileDocModel.meta_data[k].as_string() == str(v))
+    return stmt
+
+
+@with_readonly_session
 def list_docs_from_db(session,
                       kb_name: str,
                       file_name: str = None,
@@ -16,13 +66,18 @@ def list_docs_from_db(session,
     列出某知识库某文件对应的所有Document。
     返回形式：[{"id": str, "metadata": dict}, ...]
     '''
-    docs = session.query(FileDocModel).filter(FileDocModel.kb_name.ilike(kb_name))
-    if file_name:
-        docs = docs.filter(FileDocModel.file_name.ilike(file_name))
-    for k, v in metadata.items():
-        docs = docs.filter(FileDocModel.meta_data[k].as_string()==str(v))
+    docs = session.execute(_select_docs(kb_name, file_name, metadata)).scalars()
+    return [{"id": x.doc_id, "metadata": x.meta_data} for x in docs]
+
 
-    return [{"id": x.doc_id, "metadata": x.metadata} for x in docs.all()]
+@with_async_session
+async def alist_docs_from_db(session,
+                             kb_name: str,
+                             file_name: str = None,
+                             metadata: Dict = {},
+                             ) -> List[Dict]:
+    docs = await session.execute(_select_docs(kb_name, file_name, metadata))
+    return [{"id": x.doc_id, "metadata": x.meta_data} for x in docs.scalars()]
 
 
 @with_session
@@ -35,11 +90,7 @@ def delete_docs_from_db(session,
     返回形式：[{"id": str, "metadata": dict}, ...]
     '''
     docs = list_docs_from_db(kb_name=kb_name, file_name=file_name)
-    query = session.query(FileDocModel).filter(FileDocModel.kb_name.ilike(kb_name))
-    if file_name:
-        query = query.filter(FileDocModel.file_name.ilike(file_name))
-    query.delete(synchronize_session=False)
-    session.commit()
+    _delete_docs(session, kb_name, file_name)
     return docs
 
 
@@ -56,25 +107,18 @@ def add_docs_to_db(session,
     if doc_infos is None:
         print("输入的server.db.repository.knowledge_file_repository.add_docs_to_db的doc_infos参数为None")
         return False
-    for d in doc_infos:
-        obj = FileDocModel(
-            kb_name=kb_name,
-            file_name=file_name,
-            doc_id=d["id"],
-            meta_data=d["metadata"],
-        )
-        session.add(obj)
+    _insert_docs(session, kb_name, file_name, doc_infos)
     return True
 
 
-@with_session
+@with_readonly_session
 def count_files_from_db(session, kb_name: str) -> int:
-    return session.query(KnowledgeFileModel).filter(KnowledgeFileModel.kb_name.ilike(kb_name)).count()
+    return session.query(KnowledgeFileModel).filter(KnowledgeFileModel.kb_name_key == kb_name.lower()).count()
 
 
-@with_session
+@with_readonly_session
 def list_files_from_db(session, kb_name):
-    files = session.query(KnowledgeFileModel).filter(KnowledgeFileModel.kb_name.ilike(kb_name)).all()
+    files = session.query(KnowledgeFileModel).filter(KnowledgeFileModel.kb_name_key == kb_name.lower()).all()
     docs = [f.file_name for f in files]
     return docs
 
@@ -85,13 +129,19 @@ def add_file_to_db(session,
                 docs_count: int = 0,
                 custom_docs: bool = False,
                 doc_infos: List[Dict] = [], # 形式：[{"id": str, "metadata": dict}, ...]
+                replace_docs: bool = True,
                 ):
-    kb = session.query(KnowledgeBaseModel).filter_by(kb_name=kb_file.kb_name).first()
+    '''
+    添加或更新文件信息，并写入该文件对应的所有Document信息，文件与Document在同一个事务中写入。
+    如果已经存在该文件，原有的Document信息会被替换；replace_docs 为 False 时保留已写入的Document信息
+    （按行向量化的文件在向量化过程中已逐批写入，见 add_checkpoint_docs_to_db）。文件的向量化进度同时删除。
+    '''
+    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_file.kb_name.lower()).first()
     if kb:
         # 如果已经存在该文件，则更新文件信息与版本号
         existing_file: KnowledgeFileModel = (session.query(KnowledgeFileModel)
-                                             .filter(KnowledgeFileModel.kb_name.ilike(kb_file.kb_name),
-                                                     KnowledgeFileModel.file_name.ilike(kb_file.filename))
+                                             .filter(KnowledgeFileModel.kb_name_key == kb_file.kb_name.lower(),
+                                                     KnowledgeFileModel.file_name_key == kb_file.filename.lower())
                                             .first())
         mtime = kb_file.get_mtime()
         size = kb_file.get_size()
@@ -102,6 +152,8 @@ def add_file_to_db(session,
             existing_file.docs_count = docs_count
             existing_file.custom_docs = custom_docs
             existing_file.file_version += 1
+            if replace_docs:
+                _delete_docs(session, kb_file.kb_name, kb_file.filename)
         # 否则，添加新文件
         else:
             new_file = KnowledgeFileModel(
@@ -117,33 +169,82 @@ def add_file_to_db(session,
             )
             kb.file_count += 1
             session.add(new_file)
-        add_docs_to_db(kb_name=kb_file.kb_name, file_name=kb_file.filename, doc_infos=doc_infos)
+        _insert_docs(session, kb_file.kb_name, kb_file.filename, doc_infos)
+        _delete_checkpoints(session, kb_file.kb_name, kb_file.filename)
     return True
 
 
+@with_readonly_session
+def get_ingest_checkpoint(session, kb_file: KnowledgeFile) -> Optional[int]:
+    '''
+    返回文件上次向量化中断时已完成的文档数；没有进度记录，或文件在此之后被修改过时返回 None
+    '''
+    checkpoint = (session.query(IngestCheckpointModel)
+                  .filter(IngestCheckpointModel.kb_name_key == kb_file.kb_name.lower(),
+                          IngestCheckpointModel.file_name_key == kb_file.filename.lower())
+                  .first())
+    if checkpoint is None:
+        return None
+    if checkpoint.file_mtime != kb_file.get_mtime() or checkpoint.file_size != kb_file.get_size():
+        return None
+    return checkpoint.docs_count
+
+
+@with_session
+def start_ingest_checkpoint(session, kb_file: KnowledgeFile):
+    '''
+    开始按行向量化文件：删除该文件原有的Document信息，记录文件当前的修改时间、大小，已完成的文档数为0
+    '''
+    _delete_docs(session, kb_file.kb_name, kb_file.filename)
+    _delete_checkpoints(session, kb_file.kb_name, kb_file.filename)
+    session.add(IngestCheckpointModel(
+        kb_name=kb_file.kb_name,
+        file_name=kb_file.filename,
+        file_mtime=kb_file.get_mtime(),
+        file_size=kb_file.get_size(),
+        docs_count=0,
+    ))
+
+
+@with_session
+def add_checkpoint_docs_to_db(session, kb_file: KnowledgeFile, doc_infos: List[Dict]):
+    '''
+    写入按行向量化的文件的一批Document信息，并在同一个事务中增加已完成的文档数，
+    调用方需要按行的顺序写入，保证已完成的文档数之前的行都已记录
+    '''
+    _insert_docs(session, kb_file.kb_name, kb_file.filename, doc_infos)
+    session.execute(
+        update(IngestCheckpointModel)
+        .where(IngestCheckpointModel.kb_name_key == kb_file.kb_name.lower(),
+               IngestCheckpointModel.file_name_key == kb_file.filename.lower())
+        .values(docs_count=IngestCheckpointModel.docs_count + len(doc_infos))
+    )
+
+
 @with_session
 def delete_file_from_db(session, kb_file: KnowledgeFile):
     existing_file = (session.query(KnowledgeFileModel)
-                     .filter(KnowledgeFileModel.file_name.ilike(kb_file.filename),
-                            KnowledgeFileModel.kb_name.ilike(kb_file.kb_name))
+                     .filter(KnowledgeFileModel.file_name_key == kb_file.filename.lower(),
+                            KnowledgeFileModel.kb_name_key == kb_file.kb_name.lower())
                     .first())
     if existing_file:
         session.delete(existing_file)
-        delete_docs_from_db(kb_name=kb_file.kb_name, file_name=kb_file.filename)
-        session.commit()
 
-        kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name.ilike(kb_file.kb_name)).first()
+        kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == kb_file.kb_name.lower()).first()
         if kb:
             kb.file_count -= 1
-            session.commit()
+    # 按行向量化未完成的文件没有文件信息，但可能已经记录了部分Document信息与向量化进度
+    _delete_docs(session, kb_file.kb_name, kb_file.filename)
+    _delete_checkpoints(session, kb_file.kb_name, kb_file.filename)
     return True
 
 
 @with_session
 def delete_files_from_db(session, knowledge_base_name: str):
-    session.query(KnowledgeFileModel).filter(KnowledgeFileModel.kb_name.ilike(knowledge_base_name)).delete(synchronize_session=False)
-    session.query(FileDocModel).filter(FileDocModel.kb_name.ilike(knowledge_base_name)).delete(synchronize_session=False)
-    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name.ilike(knowledge_base_name)).first()
+    session.query(KnowledgeFileModel).filter(KnowledgeFileModel.kb_name_key == knowledge_base_name.lower()).delete(synchronize_session=False)
+    session.query(FileDocModel).filter(FileDocModel.kb_name_key == knowledge_base_name.lower()).delete(synchronize_session=False)
+    _delete_checkpoints(session, knowledge_base_name)
+    kb = session.query(KnowledgeBaseModel).filter(KnowledgeBaseModel.kb_name_key == knowledge_base_name.lower()).first()
     if kb:
         kb.file_count = 0
 
@@ -151,34 +252,91 @@ def delete_files_from_db(session, knowledge_base_name: str):
     return True
 
 
-@with_session
+@with_readonly_session
 def file_exists_in_db(session, kb_file: KnowledgeFile):
     existing_file = (session.query(KnowledgeFileModel)
-                     .filter(KnowledgeFileModel.file_name.ilike(kb_file.filename),
-                            KnowledgeFileModel.kb_name.ilike(kb_file.kb_name))
+                     .filter(KnowledgeFileModel.file_name_key == kb_file.filename.lower(),
+                            KnowledgeFileModel.kb_name_key == kb_file.kb_name.lower())
                     .first())
     return True if existing_file else False
 
 
-@with_session
+def _file_to_dict(file: KnowledgeFileModel) -> dict:
+    return {
+        "kb_name": file.kb_name,
+        "file_name": file.file_name,
+        "file_ext": file.file_ext,
+        "file_version": file.file_version,
+        "document_loader": file.document_loader_name,
+        "text_splitter": file.text_splitter_name,
+        "create_time": file.create_time,
+        "file_mtime": file.file_mtime,
+        "file_size": file.file_size,
+        "custom_docs": file.custom_docs,
+        "docs_count": file.docs_count,
+    }
+
+
+@with_readonly_session
 def get_file_detail(session, kb_name: str, filename: str) -> dict:
     file: KnowledgeFileModel = (session.query(KnowledgeFileModel)
-                                .filter(KnowledgeFileModel.file_name.ilike(filename),
-                                        KnowledgeFileModel.kb_name.ilike(kb_name))
+                                .filter(KnowledgeFileModel.file_name_key == filename.lower(),
+                                        KnowledgeFileModel.kb_name_key == kb_name.lower())
                                 .first())
     if file:
-        return {
-            "kb_name": file.kb_name,
-            "file_name": file.file_name,
-            "file_ext": file.file_ext,
-            "file_version": file.file_version,
-            "document_loader": file.document_loader_name,
-            "text_splitter": file.text_splitter_name,
-            "create_time": file.create_time,
-            "file_mtime": file.file_mtime,
-            "file_size": file.file_size,
-            "custom_docs": file.custom_docs,
-            "docs_count": file.docs_count,
-        }
+        return _file_to_dict(file)
     else:
         return {}
+
+
+@with_readonly_session
+def list_file_details_from_db(session, kb_name: str) -> List[dict]:
+    '''
+    一次查询返回某知识库所有文件的信息，形式同 get_file_detail
+    '''
+    files = (session.query(KnowledgeFileModel)
+             .filter(KnowledgeFileModel.kb_name_key == kb_name.lower())
+             .order_by(KnowledgeFileModel.id)
+             .all())
+    return [_file_to_dict(file) for file in files]
+
+
+@with_async_session
+async def alist_file_details_from_db(session, kb_name: str) -> List[dict]:
+    files = await session.execute(select(KnowledgeFileModel)
+                                  .filter(KnowledgeFileModel.kb_name_key == kb_name.lower())
+                                  .order_by(KnowledgeFileModel.id))
+    return [_file_to_dict(file) for file in files.scalars()]
+
+
+if __name__ == "__main__":
+    # 对比逐条 session.add 与批量写入 100k 条 file_doc 的耗时，使用临时 SQLite 数据库
+    import json
+    import tempfile
+    import time
+    import uuid
+
+    from sqlalchemy import create_engine
+
+    from modules.fastsearch.knowledge_base_manager.db.base import Base, SessionLocal
+
+    n = 100_000
+    doc_infos = [{"id": uuid.uuid4().hex, "metadata": {"source": "bench.pdf", "page": i // 20}} for i in range(n)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{tmp_dir}/bench.db",
+                               json_serializer=lambda obj: json.dumps(obj, ensure_ascii=False))
+        Base.metadata.create_all(bind=engine)
+        SessionLocal.configure(bind=engine)
+
+        start = time.perf_counter()
+        with SessionLocal() as session:
+            for d in doc_infos:
+                session.add(FileDocModel(kb_name="bench", file_name="orm.pdf", doc_id=d["id"], meta_data=d["metadata"]))
+            session.commit()
+        print(f"逐条 session.add: {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        add_docs_to_db(kb_name="bench", file_name="bulk.pdf", doc_infos=doc_infos)
+        print(f"批量写入: {time.perf_counter() - start:.2f}s")
+        engine.dispose()
@@ -1,13 +1,19 @@
 from functools import wraps
-from contextlib import contextmanager
-from .base import SessionLocal
+from contextlib import contextmanager, asynccontextmanager
+from .base import SessionLocal, AsyncSessionLocal, WRITE_EXECUTION_OPTIONS
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
 @contextmanager
-def session_scope() -> Session:
-    """上下文管理器用于自动获取 Session, 避免错误"""
+def session_scope(readonly: bool = False) -> Session:
+    """
+    上下文管理器用于自动获取 Session, 避免错误。
+    默认为写事务，SQLite 上以 SQLITE_BEGIN_MODE 开始；readonly 为 True 时以 DEFERRED 开始，不等待写锁
+    """
     session = SessionLocal()
+    if not readonly:
+        session.bind = session.bind.execution_options(**WRITE_EXECUTION_OPTIONS)
     try:
         yield session
         session.commit()
@@ -18,10 +24,10 @@ def session_scope() -> Session:
         session.close()
 
 
-def with_session(f):
+def _session_decorator(f, readonly: bool):
     @wraps(f)
     def wrapper(*args, **kwargs):
-        with session_scope() as session:
+        with session_scope(readonly) as session:
             try:
                 result = f(session, *args, **kwargs)
                 session.commit()
@@ -33,6 +39,41 @@ def with_session(f):
     return wrapper
 
 
+def with_session(f):
+    return _session_decorator(f, readonly=False)
+
+
+def with_readonly_session(f):
+    """
+    只读版本的 with_session，用于只查询数据库的函数：SQLite 上不获取写锁，不会等待正在写入的事务
+    """
+    return _session_decorator(f, readonly=True)
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncSession:
+    """异步上下文管理器用于自动获取 AsyncSession"""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except:
+            await session.rollback()
+            raise
+
+
+def with_async_session(f):
+    """
+    异步版本的 with_session，用于在 async 接口中访问数据库而不阻塞事件循环
+    """
+    @wraps(f)
+    async def wrapper(*args, **kwargs):
+        async with async_session_scope() as session:
+            return await f(session, *args, **kwargs)
+
+    return wrapper
+
+
 def get_db() -> SessionLocal:
     db = SessionLocal()
     try:
@@ -44,3 +85,93 @@ def get_db() -> SessionLocal:
 def get_db0() -> SessionLocal:
     db = SessionLocal()
     return db
+
+
+def _stress_worker(url: str, worker: int, rounds: int, docs_per_file: int) -> dict:
+    """
+    压力测试的单个工作进程：多个线程交替写入文件与Document信息、读取文件列表
+    """
+    import threading
+    import time
+
+    from .base import create_db_engine
+    from .repository import add_file_to_db, list_file_details_from_db, list_docs_from_db
+
+    class FakeFile:
+        kb_name = "stress"
+        ext = ".pdf"
+        document_loader_name = "RapidOCRPDFLoader"
+        text_splitter_name = "ChineseRecursiveTextSplitter"
+
+        def __init__(self, filename):
+            self.filename = filename
+
+        def get_mtime(self):
+            return time.time()
+
+        def get_size(self):
+            return 0
+
+    SessionLocal.configure(bind=create_db_engine(url))
+    stats = {"writes": 0, "reads": 0, "errors": []}
+    lock = threading.Lock()
+
+    def run(thread: int):
+        for i in range(rounds):
+            try:
+                if i % 2 == 0:
+                    file_name = f"w{worker}-t{thread}-{i % 10}.pdf"
+                    doc_infos = [{"id": f"{file_name}-{j}", "metadata": {"page": j}} for j in range(docs_per_file)]
+                    add_file_to_db(FakeFile(file_name), docs_count=docs_per_file, doc_infos=doc_infos)
+                    key = "writes"
+                else:
+                    list_file_details_from_db("stress")
+                    list_docs_from_db(kb_name="stress", file_name=f"w{worker}-t{thread}-0.pdf")
+                    key = "reads"
+                with lock:
+                    stats[key] += 1
+            except Exception as e:
+                with lock:
+                    stats["errors"].append(f"{e.__class__.__name__}: {e}")
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return stats
+
+
+if __name__ == "__main__":
+    # 并发读写压力测试：多个进程（模拟多个 uvicorn worker）× 多个线程同时读写临时 SQLite 数据库，
+    # 也可以传入数据库URL测试其他数据库，例如 python -m ...db.session postgresql+psycopg2://...
+    import sys
+    import tempfile
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .base import create_db_engine
+    from .migrate import Base
+    from .repository import add_kb_to_db
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        url = sys.argv[1] if len(sys.argv) > 1 else f"sqlite:///{tmp_dir}/stress.db"
+        engine = create_db_engine(url)
+        Base.metadata.create_all(bind=engine)
+        SessionLocal.configure(bind=engine)
+        add_kb_to_db("stress", "压力测试", "es")
+
+        processes, rounds, docs_per_file = 4, 50, 200
+        start = time.perf_counter()
+        with ProcessPoolExecutor(processes) as pool:
+            results = list(pool.map(_stress_worker, [url] * processes, range(processes),
+                                    [rounds] * processes, [docs_per_file] * processes))
+        elapsed = time.perf_counter() - start
+
+        writes = sum(r["writes"] for r in results)
+        reads = sum(r["reads"] for r in results)
+        errors = [e for r in results for e in r["errors"]]
+        print(f"{processes} 进程 × 8 线程，写入 {writes} 次，读取 {reads} 次，耗时 {elapsed:.2f}s，错误 {len(errors)} 次")
+        for e in errors[:10]:
+            print(e)
+        engine.dispose()
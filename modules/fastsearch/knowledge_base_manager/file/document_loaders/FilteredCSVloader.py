@@ -1,19 +1,25 @@
+import codecs
 import csv
 from io import TextIOWrapper
-from typing import Dict, List, Optional
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional
 from langchain_core.documents import Document
 from langchain_community.document_loaders import CSVLoader
 from langchain_community.document_loaders.helpers import detect_file_encodings
+from application.settings import ENCODING_DETECT_CANDIDATES
+from .encoding import detect_file_encoding
 
 
 class FilteredCSVLoader(CSVLoader):
     """
-    指定列的csv文件加载器
+    指定列的csv文件加载器。
+    columns_to_read 为空时与 CSVLoader 的输出相同（每行的各列以 "列名: 值" 逐行拼接），
+    用于代替 CSVLoader 加载所有 csv 文件：读取中途出现编码错误时不会重复返回已经读取的行
     """
     def __init__(
             self,
             file_path: str,
-            columns_to_read: List[str],
+            columns_to_read: Optional[List[str]] = None,
             source_column: Optional[str] = None,
             metadata_columns: List[str] = [],
             csv_args: Optional[Dict] = None,
@@ -32,20 +38,31 @@ class FilteredCSVLoader(CSVLoader):
 
     def load(self) -> List[Document]:
         """Load data into document objects."""
+        return list(self.lazy_load())
 
-        docs = []
+    def lazy_load(self) -> Iterator[Document]:
+        """
+        逐行读取 csv 文件，每行返回一个 Document，不需要将整个文件加载到内存中。
+        读取中途出现编码错误时（autodetect_encoding 为 True）依次尝试其他编码重新读取，并跳过已经返回的行
+        """
+        yielded = 0
         try:
-            with open(self.file_path, newline="", encoding=self.encoding) as csvfile:
-                docs = self.__read_file(csvfile)
+            # 未指定 encoding 时按文件采样识别，采样之外的内容无法解码时再按 autodetect_encoding 识别整个文件
+            encoding = self.encoding or detect_file_encoding(self.file_path)
+            with open(self.file_path, newline="", encoding=encoding) as csvfile:
+                for doc in self.__read_file(csvfile):
+                    yield doc
+                    yielded += 1
         except UnicodeDecodeError as e:
             if self.autodetect_encoding:
-                detected_encodings = detect_file_encodings(self.file_path)
-                for encoding in detected_encodings:
+                for encoding in self.__fallback_encodings(encoding):
                     try:
                         with open(
-                            self.file_path, newline="", encoding=encoding.encoding
+                            self.file_path, newline="", encoding=encoding
                         ) as csvfile:
-                            docs = self.__read_file(csvfile)
+                            for doc in islice(self.__read_file(csvfile), yielded, None):
+                                yield doc
+                                yielded += 1
                             break
                     except UnicodeDecodeError:
                         continue
@@ -54,13 +71,25 @@ class FilteredCSVLoader(CSVLoader):
         except Exception as e:
             raise RuntimeError(f"Error loading {self.file_path}") from e
 
-        return docs
+    def __fallback_encodings(self, failed: str) -> Iterator[str]:
+        """
+        先尝试 ENCODING_DETECT_CANDIDATES 中的其他编码，再尝试 chardet 按整个文件识别的编码：
+        只有少数几行不是 ASCII 时，chardet 可能识别为错误的单字节编码
+        """
+        tried = {codecs.lookup(failed).name}
+        candidates = chain(ENCODING_DETECT_CANDIDATES,
+                           (e.encoding for e in detect_file_encodings(self.file_path)))
+        for encoding in candidates:
+            if encoding and codecs.lookup(encoding).name not in tried:
+                tried.add(codecs.lookup(encoding).name)
+                yield encoding
 
-    def __read_file(self, csvfile: TextIOWrapper) -> List[Document]:
-        docs = []
+    def __read_file(self, csvfile: TextIOWrapper) -> Iterator[Document]:
         csv_reader = csv.DictReader(csvfile, **self.csv_args)  # type: ignore
         for i, row in enumerate(csv_reader):
-            if self.columns_to_read[0] in row:
+            if not self.columns_to_read:
+                yield self.__read_row(i, row)
+            elif self.columns_to_read[0] in row:
                 content = row[self.columns_to_read[0]]
                 # Extract the source if available
                 source = (
@@ -74,9 +103,25 @@ class FilteredCSVLoader(CSVLoader):
                     if col in row:
                         metadata[col] = row[col]
 
-                doc = Document(page_content=content, metadata=metadata)
-                docs.append(doc)
+                yield Document(page_content=content, metadata=metadata)
             else:
                 raise ValueError(f"Column '{self.columns_to_read[0]}' not found in CSV file.")
 
-        return docs
+    def __read_row(self, i: int, row: Dict) -> Document:
+        """同 CSVLoader：除元数据列外的所有列作为文档内容"""
+        try:
+            source = row[self.source_column] if self.source_column is not None else str(self.file_path)
+        except KeyError:
+            raise ValueError(f"Source column '{self.source_column}' not found in CSV file.")
+        content = "\n".join(
+            f"{k.strip()}: {v.strip() if v is not None else v}"
+            for k, v in row.items()
+            if k not in self.metadata_columns
+        )
+        metadata = {"source": source, "row": i}
+        for col in self.metadata_columns:
+            try:
+                metadata[col] = row[col]
+            except KeyError:
+                raise ValueError(f"Metadata column '{col}' not found in CSV file.")
+        return Document(page_content=content, metadata=metadata)
@@ -2,3 +2,4 @@ from .mypdfloader import RapidOCRPDFLoader
 from .myimgloader import RapidOCRLoader
 from .mydocloader import RapidOCRDocLoader
 from .mypptloader import RapidOCRPPTLoader
+from .FilteredCSVloader import FilteredCSVLoader
@@ -0,0 +1,115 @@
+import codecs
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Tuple
+
+import chardet
+
+from application.settings import (ENCODING_DETECT_SAMPLE_SIZE, ENCODING_DETECT_WINDOWS,
+                                  ENCODING_DETECT_CANDIDATES)
+from xiaoapi.core import logger
+
+# (绝对路径, 修改时间, 文件大小) -> 编码
+_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_cache_lock = threading.Lock()
+_CACHE_SIZE = 1024
+
+_BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def _read_samples(file_path: str, size: int, sample_size: int, windows: int) -> Tuple[bytes, List[bytes], bool]:
+    """
+    读取文件开头 sample_size 字节，文件中部均匀分布的 windows 个片段，以及文件末尾的一个片段（每个 sample_size // 4 字节）。
+    中部片段从第一个换行符之后开始、到最后一个换行符结束，末尾片段从第一个换行符之后开始、到文件末尾结束，
+    UTF-8、GB18030 中换行符不会出现在多字节字符内部，因此片段不会从半个字符开始。返回 (开头, 其他片段, 是否读取了整个文件)
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(sample_size)
+        if size <= sample_size:
+            return head, [], True
+
+        parts = []
+        window_size = max(sample_size // 4, 1)
+        for i in range(1, windows + 1):
+            offset = sample_size + (size - sample_size - window_size) * i // (windows + 1)
+            f.seek(offset)
+            data = f.read(window_size)
+            start, end = data.find(b"\n"), data.rfind(b"\n")
+            if start < end:
+                parts.append(data[start + 1:end + 1])
+
+        # 只有开头是 ASCII 的文件常在末尾才出现其他编码的内容（例如后追加的行），末尾总是采样
+        f.seek(max(sample_size, size - window_size))
+        data = f.read()
+        start = data.find(b"\n")
+        if 0 <= start < len(data) - 1:
+            parts.append(data[start + 1:])
+        return head, parts, False
+
+
+def _can_decode(encoding: str, head: bytes, parts: List[bytes], whole: bool) -> bool:
+    try:
+        # 开头可能在多字节字符中间截断，使用增量解码器允许末尾不完整
+        codecs.getincrementaldecoder(encoding)().decode(head, final=whole)
+        for part in parts:
+            part.decode(encoding)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def _detect(file_path: str, size: int) -> str:
+    head, parts, whole = _read_samples(file_path, size, ENCODING_DETECT_SAMPLE_SIZE, ENCODING_DETECT_WINDOWS)
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    for encoding in ENCODING_DETECT_CANDIDATES:
+        if _can_decode(encoding, head, parts, whole):
+            return encoding
+    # 常见编码都无法解码时使用 chardet 识别采样内容
+    encoding = chardet.detect(head + b"".join(parts)).get("encoding") or "utf-8"
+    logger.debug(f"文件 {file_path} 不是 {ENCODING_DETECT_CANDIDATES} 编码，chardet 识别为 {encoding}")
+    return encoding
+
+
+def detect_file_encoding(file_path: str) -> str:
+    """
+    识别文本文件的编码。只读取文件开头、中部与末尾的少量内容：先检查 BOM，再依次尝试 ENCODING_DETECT_CANDIDATES 严格解码，
+    都失败时才使用 chardet 识别采样内容；不会因为文件很大而读取整个文件。
+    识别结果按 (路径, 修改时间, 文件大小) 缓存，文件不变时重复加载不再读取文件。
+    采样之外的内容仍可能无法解码，加载器应保留 autodetect_encoding 作为兜底，
+    按行返回文档的加载器（如 FilteredCSVLoader）重新识别编码后需要跳过已经返回的行
+    """
+    stat = os.stat(file_path)
+    key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        encoding = _cache.get(key)
+        if encoding is not None:
+            _cache.move_to_end(key)
+            return encoding
+
+    encoding = _detect(file_path, stat.st_size)
+    with _cache_lock:
+        _cache[key] = encoding
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return encoding
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    # python -m modules.fastsearch.knowledge_base_manager.file.document_loaders.encoding <文件路径>
+    for path in sys.argv[1:]:
+        start = time.perf_counter()
+        result = detect_file_encoding(path)
+        cost = time.perf_counter() - start
+        print(f"{path}: {result}，耗时 {cost * 1000:.1f}ms")
@@ -1,6 +1,8 @@
 from typing import List
 import tqdm
 from langchain_community.document_loaders import UnstructuredFileLoader
+from .ocr import get_ocr_pool, ocr_image
+from .ocr_cache import image_hash
 
 
 class RapidOCRDocLoader(UnstructuredFileLoader):
@@ -14,8 +16,7 @@ class RapidOCRDocLoader(UnstructuredFileLoader):
             from PIL import Image
             from io import BytesIO
             import numpy as np
-            from rapidocr_onnxruntime import RapidOCR
-            ocr = RapidOCR()
+            ocr = get_ocr_pool()
             doc = Document(filepath)
             resp = ""
 
@@ -47,11 +48,9 @@ class RapidOCRDocLoader(UnstructuredFileLoader):
                         for img_id in image.xpath('.//a:blip/@r:embed'):  # 获取图片id
                             part = doc.part.related_parts[img_id]  # 根据图片id获取对应的图片
                             if isinstance(part, ImagePart):
-                                image = Image.open(BytesIO(part._blob))
-                                result, _ = ocr(np.array(image))
-                                if result:
-                                    ocr_result = [line[1] for line in result]
-                                    resp += "\n".join(ocr_result)
+                                blob = part._blob
+                                resp += ocr_image(ocr, image_hash(blob),
+                                                  lambda: np.array(Image.open(BytesIO(blob))))
                 elif isinstance(block, Table):
                     for row in block.rows:
                         for cell in row.cells:
@@ -1,18 +1,15 @@
 from typing import List
 from langchain_community.document_loaders import UnstructuredFileLoader
-from .ocr import get_ocr
+from .ocr import get_ocr_pool, ocr_image
+from .ocr_cache import image_hash
 
 
 class RapidOCRLoader(UnstructuredFileLoader):
     def _get_elements(self) -> List:
         def img2text(filepath):
-            resp = ""
-            ocr = get_ocr()
-            result, _ = ocr(filepath)
-            if result:
-                ocr_result = [line[1] for line in result]
-                resp += "\n".join(ocr_result)
-            return resp
+            with open(filepath, "rb") as f:
+                key = image_hash(f.read())
+            return ocr_image(get_ocr_pool(), key, lambda: filepath)
 
         text = img2text(self.file_path)
         from unstructured.partition.text import partition_text
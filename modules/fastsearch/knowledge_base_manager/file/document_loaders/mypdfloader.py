@@ -1,47 +1,226 @@
-from typing import List
-import tqdm
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Tuple
+
 from langchain_community.document_loaders import UnstructuredFileLoader
 
-from application.settings import PDF_OCR_THRESHOLD
-from .ocr import get_ocr
+from application.settings import PDF_OCR_THRESHOLD, PDF_OCR_PARALLEL, PDF_OCR_SKIP_TEXT_COVERAGE, PDF_OCR_MAX_DPI
+from xiaoapi.core import logger
+from .ocr import get_ocr_pool, ocr_image
+from .ocr_cache import image_hash, get_ocr_cache
+from ..utils import get_max_workers, get_process_executor, discard_executor, run_in_executor
+
+# OCR 进程中最近打开的 PDF
+_worker_doc = (None, None)
+
+
+def _init_ocr_worker():
+    """
+    OCR 进程启动时的准备工作，每个进程只执行一次：OCR 进程以 spawn 方式启动，不继承服务进程的状态，
+    在这里导入 PyMuPDF、加载 OCR 引擎、创建 OCR 结果缓存，之后该进程识别的所有页面共用
+    """
+    import fitz  # noqa: F401
+    get_ocr_pool().warm_up(1)
+    get_ocr_cache()
+
+
+def _open_pdf(filepath: str):
+    """在 OCR 进程中打开 PDF，同一文件的多个页面复用已打开的文档"""
+    import fitz  # pyMuPDF里面的fitz包，不要与pip install fitz混淆
+    global _worker_doc
+    key = (filepath, os.path.getmtime(filepath))
+    if _worker_doc[0] != key:
+        if _worker_doc[1] is not None:
+            _worker_doc[1].close()
+        _worker_doc = (key, fitz.open(filepath))
+    return _worker_doc[1]
+
+
+class PDFOCRMetrics:
+    """
+    PDF OCR 统计：按页统计需要 OCR、因已有文本层跳过 OCR、没有需要 OCR 的图片的页数，以及识别、跳过、缩小的图片数。
+    统计本进程加载的所有 PDF，可通过 snapshot() 查看
+    """
+    FIELDS = ("pages", "pages_ocr", "pages_skipped", "pages_no_image",
+              "images_ocr", "images_skipped", "images_downscaled")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.FIELDS, 0)
+
+    def add(self, counts: Dict[str, int]):
+        with self._lock:
+            for k, v in counts.items():
+                self._counts[k] += v
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts = dict.fromkeys(self.FIELDS, 0)
+
+
+pdf_ocr_metrics = PDFOCRMetrics()
+
+
+def _text_coverage(words: List[Tuple], bbox: Tuple[float, float, float, float]) -> float:
+    """统计文本层的文字框与 bbox 相交部分的面积之和占 bbox 面积的比例"""
+    x0, y0, x1, y1 = bbox
+    area = (x1 - x0) * (y1 - y0)
+    if area <= 0:
+        return 0.0
+    covered = 0.0
+    for w in words:
+        width = min(x1, w[2]) - max(x0, w[0])
+        height = min(y1, w[3]) - max(y0, w[1])
+        if width > 0 and height > 0:
+            covered += width * height
+    return covered / area
+
+
+def _shrink_factor(img_width: int, bbox_width: float) -> int:
+    """
+    图片在页面上的分辨率超过 PDF_OCR_MAX_DPI 时，返回缩小的次数（每次宽高减半），缩小后的分辨率不低于 PDF_OCR_MAX_DPI
+    """
+    if not PDF_OCR_MAX_DPI or bbox_width <= 0:
+        return 0
+    dpi = img_width * 72 / bbox_width
+    factor = 0
+    while dpi / 2 ** (factor + 1) >= PDF_OCR_MAX_DPI:
+        factor += 1
+    return factor
+
+
+def plan_page_ocr(page, text: str, counts: Dict[str, int]) -> List[Tuple[int, int]]:
+    """
+    判断页面中哪些图片需要 OCR，返回 [(xref, 缩小次数), ...]，并将判断结果计入 counts。
+    1. 只对宽高超过页面一定比例（PDF_OCR_THRESHOLD）的图片进行 OCR；
+    2. 文本层的文字框覆盖图片面积的比例达到 PDF_OCR_SKIP_TEXT_COVERAGE 时跳过该图片：
+       例如文字在背景图之上的电子版 PDF，或者已经带有 OCR 文本层的扫描版 PDF；
+       只有页眉、页脚、Bates 编号等少量文字的扫描页覆盖比例很低，仍然会 OCR；
+    3. 分辨率超过 PDF_OCR_MAX_DPI 的图片缩小后再识别。
+    页面没有文本层时不需要按图片区域统计（扫描版 PDF 的常见情况）。
+    """
+    counts["pages"] += 1
+    candidates = []
+    for img in page.get_image_info(xrefs=True):
+        if xref := img.get("xref"):
+            bbox = img["bbox"]
+            # 检查图片尺寸是否超过设定的阈值
+            if ((bbox[2] - bbox[0]) / (page.rect.width) < PDF_OCR_THRESHOLD[0]
+                    or (bbox[3] - bbox[1]) / (page.rect.height) < PDF_OCR_THRESHOLD[1]):
+                continue
+            candidates.append(img)
+    if not candidates:
+        counts["pages_no_image"] += 1
+        return []
+
+    words = None
+    if PDF_OCR_SKIP_TEXT_COVERAGE and text.strip():
+        words = page.get_text("words")
+
+    images = []
+    for img in candidates:
+        bbox = img["bbox"]
+        if words is not None and _text_coverage(words, bbox) >= PDF_OCR_SKIP_TEXT_COVERAGE:
+            counts["images_skipped"] += 1
+            continue
+        factor = _shrink_factor(img["width"], bbox[2] - bbox[0])
+        if factor:
+            counts["images_downscaled"] += 1
+        counts["images_ocr"] += 1
+        images.append((img["xref"], factor))
+    counts["pages_ocr" if images else "pages_skipped"] += 1
+    return images
+
+
+def ocr_pdf_images(doc, images: List[Tuple[int, int]], ocr) -> List[str]:
+    """识别 PDF 中的图片，每张图片返回一段文本（图片中的各行以换行连接）"""
+    import fitz
+    import numpy as np
+    results = []
+    for xref, factor in images:
+        pix = fitz.Pixmap(doc, xref)
+        if factor:
+            pix.shrink(factor)
+        samples = pix.samples
+        key = image_hash(samples, pix.width, pix.height, pix.n)
+        text = ocr_image(ocr, key,
+                         lambda: np.frombuffer(samples, dtype=np.uint8).reshape(pix.height, pix.width, -1))
+        if text:
+            results.append(text)
+    return results
+
+
+def _ocr_pdf_page(filepath: str, page_no: int, images: List[Tuple[int, int]]) -> Tuple[int, List[str]]:
+    """在 OCR 进程中识别一页的图片"""
+    doc = _open_pdf(filepath)
+    return page_no, ocr_pdf_images(doc, images, get_ocr_pool())
+
+
+def pdf2text(filepath: str, parallel: bool = PDF_OCR_PARALLEL) -> str:
+    """
+    提取 PDF 每页的文本，并识别其中需要 OCR 的图片（见 plan_page_ocr），已有文本层的电子版 PDF 按文本提取的速度加载。
+    文本在当前进程中提取；需要 OCR 的页面提交到 OCR 进程池中并行识别，每个进程只加载一次 OCR 引擎，
+    识别结果按页码放回原位置后一次性拼接。parallel 为 False 时在当前进程中逐页识别。
+    """
+    import fitz  # pyMuPDF里面的fitz包，不要与pip install fitz混淆
+    counts = dict.fromkeys(PDFOCRMetrics.FIELDS, 0)
+    with fitz.open(filepath) as doc:
+        page_texts = []
+        ocr_pages: Dict[int, List[Tuple[int, int]]] = {}
+        for i, page in enumerate(doc):
+            text = page.get_text("")
+            page_texts.append(text)
+            images = plan_page_ocr(page, text, counts)
+            if images:
+                ocr_pages[i] = images
+
+        ocr_texts: Dict[int, List[str]] = {}
+        total = len(ocr_pages)
+        if total and parallel:
+            params = ({"filepath": filepath, "page_no": i, "images": images} for i, images in ocr_pages.items())
+            executor = get_process_executor("ocr", initializer=_init_ocr_worker)
+            max_in_flight = get_max_workers("ocr") * 2
+            try:
+                for page_no, texts in run_in_executor(executor, _ocr_pdf_page, params, max_in_flight):
+                    ocr_texts[page_no] = texts
+                    logger.debug(f"RapidOCRPDFLoader {filepath} OCR 进度：{len(ocr_texts)}/{total}，第 {page_no + 1} 页")
+            except BrokenProcessPool:
+                discard_executor("ocr")
+                raise
+        elif total:
+            ocr = get_ocr_pool()
+            for page_no, images in ocr_pages.items():
+                ocr_texts[page_no] = ocr_pdf_images(doc, images, ocr)
+                logger.debug(f"RapidOCRPDFLoader {filepath} OCR 进度：{len(ocr_texts)}/{total}，第 {page_no + 1} 页")
+
+    pdf_ocr_metrics.add(counts)
+    if counts["pages_ocr"] or counts["pages_skipped"]:
+        logger.info(f"RapidOCRPDFLoader {filepath} 共 {counts['pages']} 页，OCR {counts['pages_ocr']} 页，"
+                    f"已有文本层跳过 {counts['pages_skipped']} 页；识别图片 {counts['images_ocr']} 张"
+                    f"（缩小 {counts['images_downscaled']} 张），跳过 {counts['images_skipped']} 张")
+
+    parts = []
+    for i, text in enumerate(page_texts):
+        parts.append(text)
+        parts.append("\n")
+        parts.extend(ocr_texts.get(i, []))
+    return "".join(parts)
 
 
 class RapidOCRPDFLoader(UnstructuredFileLoader):
+    def __init__(self, file_path: str, mode: str = "single", ocr_parallel: bool = PDF_OCR_PARALLEL,
+                 **unstructured_kwargs):
+        """ocr_parallel 同 pdf2text 的 parallel，在解析进程中加载时为 False，见 knowledge_file._file2chunks"""
+        self.ocr_parallel = ocr_parallel
+        super().__init__(file_path, mode=mode, **unstructured_kwargs)
+
     def _get_elements(self) -> List:
-        def pdf2text(filepath):
-            import fitz # pyMuPDF里面的fitz包，不要与pip install fitz混淆
-            import numpy as np
-            ocr = get_ocr()
-            doc = fitz.open(filepath)
-            resp = ""
-
-            b_unit = tqdm.tqdm(total=doc.page_count, desc="RapidOCRPDFLoader context page index: 0")
-            for i, page in enumerate(doc):
-                b_unit.set_description("RapidOCRPDFLoader context page index: {}".format(i))
-                b_unit.refresh()
-                text = page.get_text("")
-                resp += text + "\n"
-
-                img_list = page.get_image_info(xrefs=True)
-                for img in img_list:
-                    if xref := img.get("xref"):
-                        bbox = img["bbox"]
-                        # 检查图片尺寸是否超过设定的阈值
-                        if ((bbox[2] - bbox[0]) / (page.rect.width) < PDF_OCR_THRESHOLD[0]
-                            or (bbox[3] - bbox[1]) / (page.rect.height) < PDF_OCR_THRESHOLD[1]):
-                            continue
-                        pix = fitz.Pixmap(doc, xref)
-                        img_array = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, -1)
-                        result, _ = ocr(img_array)
-                        if result:
-                            ocr_result = [line[1] for line in result]
-                            resp += "\n".join(ocr_result)
-
-                # 更新进度
-                b_unit.update(1)
-            return resp
-
-        text = pdf2text(self.file_path)
+        text = pdf2text(self.file_path, parallel=self.ocr_parallel)
         from unstructured.partition.text import partition_text
         return partition_text(text=text, **self.unstructured_kwargs)
 
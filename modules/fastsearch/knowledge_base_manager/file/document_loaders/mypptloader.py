@@ -1,6 +1,8 @@
 from typing import List
 import tqdm
 from langchain_community.document_loaders import UnstructuredFileLoader
+from .ocr import get_ocr_pool, ocr_image
+from .ocr_cache import image_hash
 
 
 class RapidOCRPPTLoader(UnstructuredFileLoader):
@@ -10,8 +12,7 @@ class RapidOCRPPTLoader(UnstructuredFileLoader):
             from PIL import Image
             import numpy as np
             from io import BytesIO
-            from rapidocr_onnxruntime import RapidOCR
-            ocr = RapidOCR()
+            ocr = get_ocr_pool()
             prs = Presentation(filepath)
             resp = ""
 
@@ -25,11 +26,8 @@ class RapidOCRPPTLoader(UnstructuredFileLoader):
                             for paragraph in cell.text_frame.paragraphs:
                                 resp += paragraph.text.strip() + "\n"
                 if shape.shape_type == 13:  # 13 表示图片
-                    image = Image.open(BytesIO(shape.image.blob))
-                    result, _ = ocr(np.array(image))
-                    if result:
-                        ocr_result = [line[1] for line in result]
-                        resp += "\n".join(ocr_result)
+                    blob = shape.image.blob
+                    resp += ocr_image(ocr, image_hash(blob), lambda: np.array(Image.open(BytesIO(blob))))
                 elif shape.shape_type == 6:  # 6 表示组合
                     for child_shape in shape.shapes:
                         extract_text(child_shape)
@@ -1,5 +1,12 @@
-from typing import TYPE_CHECKING
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, List
 
+from application.settings import OCR_ENGINE_POOL_SIZE
+from xiaoapi.core import logger
+from .ocr_cache import get_ocr_cache
 
 if TYPE_CHECKING:
     try:
@@ -16,3 +23,126 @@ def get_ocr(use_cuda: bool = True) -> "RapidOCR":
         from rapidocr_onnxruntime import RapidOCR
         ocr = RapidOCR()
     return ocr
+
+
+def ocr_image(ocr: Callable, key: bytes, load_image: Callable[[], Any]) -> str:
+    """
+    识别一张图片，返回识别出的文本（各行以换行连接），没有识别出文本时返回空字符串。
+    key 为图片内容的哈希值（见 image_hash），命中 OCR 结果缓存时不调用 load_image 与 OCR 模型
+    """
+    cache = get_ocr_cache()
+    if cache is not None:
+        text = cache.get(key)
+        if text is not None:
+            return text
+    result, _ = ocr(load_image())
+    text = "\n".join(line[1] for line in result) if result else ""
+    if cache is not None:
+        cache.put(key, text)
+    return text
+
+
+class OCREnginePool:
+    """
+    OCR 引擎池：进程内最多创建 size 个 OCR 引擎，按需创建后反复使用，避免每个文件重新加载模型。
+    引擎不能同时被多个线程使用，通过 engine() 借出、用完归还；所有引擎都被借出时等待其他线程归还。
+    也可以直接调用引擎池识别图片：pool(img)，每次识别时借出一个引擎。
+    """
+
+    def __init__(self, size: int = OCR_ENGINE_POOL_SIZE, factory: Callable[[], "RapidOCR"] = get_ocr):
+        self.size = max(1, size)
+        self.factory = factory
+        self._idle: List["RapidOCR"] = []
+        self._created = 0
+        self._cond = threading.Condition()
+
+    @property
+    def created(self) -> int:
+        return self._created
+
+    def _create(self) -> "RapidOCR":
+        """创建引擎，调用前已占用一个名额，失败时释放名额"""
+        try:
+            start = time.perf_counter()
+            engine = self.factory()
+            logger.info(f"OCR 引擎加载完成（pid {os.getpid()}），耗时 {time.perf_counter() - start:.2f}s")
+            return engine
+        except BaseException:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def acquire(self, timeout: float = None) -> "RapidOCR":
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._idle:
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"等待 OCR 引擎超时（{timeout}s）")
+                self._cond.wait(remaining)
+            else:
+                return self._idle.pop()
+        # 模型加载较慢，不持有锁，其他线程可以同时借出已有的引擎
+        return self._create()
+
+    def release(self, engine: "RapidOCR"):
+        with self._cond:
+            self._idle.append(engine)
+            self._cond.notify()
+
+    @contextmanager
+    def engine(self, timeout: float = None):
+        engine = self.acquire(timeout)
+        try:
+            yield engine
+        finally:
+            self.release(engine)
+
+    def __call__(self, img, **kwargs):
+        with self.engine() as engine:
+            return engine(img, **kwargs)
+
+    def warm_up(self, n: int = None):
+        """预先创建 n 个引擎（默认 size 个），已经创建的引擎计入其中"""
+        n = self.size if n is None else min(n, self.size)
+        while True:
+            with self._cond:
+                if self._created >= n:
+                    return
+                self._created += 1
+            self.release(self._create())
+
+    def warm_up_in_background(self, n: int = None) -> threading.Thread:
+        def target():
+            try:
+                self.warm_up(n)
+            except Exception as e:
+                logger.warning(f"OCR 引擎预加载失败：{e}")
+
+        thread = threading.Thread(target=target, name="ocr-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+
+_pool: OCREnginePool = None
+_pool_pid: int = None
+_pool_lock = threading.Lock()
+
+
+def get_ocr_pool() -> OCREnginePool:
+    """
+    获取本进程共享的 OCR 引擎池。每个进程（包括 OCR 进程池中的子进程）使用各自的引擎池，
+    OCR 进程池中的每个进程只使用一个线程识别，因此只会创建一个引擎
+    """
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is None or _pool_pid != pid:
+        with _pool_lock:
+            if _pool is None or _pool_pid != pid:
+                _pool = OCREnginePool()
+                _pool_pid = pid
+    return _pool
@@ -0,0 +1,114 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from application.settings import OCR_CACHE_PATH, OCR_CACHE_MAX_ENTRIES
+from xiaoapi.core import logger
+
+
+def image_hash(data: bytes, *shape: int) -> bytes:
+    """
+    计算图片内容的哈希值作为缓存键。data 为图片文件内容或像素数据，
+    像素数据需要同时传入宽、高、通道数，避免内容相同但形状不同的图片冲突
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if shape:
+        h.update(",".join(map(str, shape)).encode())
+        h.update(b"\0")
+    h.update(data)
+    return h.digest()
+
+
+class OCRCache:
+    """
+    OCR 结果缓存：以图片内容的哈希值为键，保存识别出的文本，存放在独立的 SQLite 文件中，服务重启、重新入库后仍然有效。
+    同一张图片（logo、印章、截图等）出现在多个文件中或文件被重新入库时直接使用缓存，不再调用 OCR 模型。
+    缓存条目超过 max_entries 时按最近使用时间淘汰最旧的条目。多个线程、进程可以同时使用。
+    """
+
+    # 每写入多少条检查一次缓存大小
+    EVICT_INTERVAL = 100
+
+    def __init__(self, path: str = OCR_CACHE_PATH, max_entries: int = OCR_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: sqlite3.Connection = None
+        self._pid: int = None
+        self._lock = threading.Lock()
+        self._puts = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # 连接不能跨进程使用，fork 出的子进程重新连接
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cache ("
+                "key BLOB PRIMARY KEY, text TEXT NOT NULL, used_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_ocr_cache_used_at ON ocr_cache (used_at)")
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key: bytes) -> Optional[str]:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT text FROM ocr_cache WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                conn.execute("UPDATE ocr_cache SET used_at = ? WHERE key = ?", (time.time(), key))
+                return row[0]
+        return None
+
+    def put(self, key: bytes, text: str):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO ocr_cache (key, text, used_at) VALUES (?, ?, ?)",
+                         (key, text, time.time()))
+            self._puts += 1
+            if self._puts % self.EVICT_INTERVAL == 0:
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        count = conn.execute("SELECT COUNT(*) FROM ocr_cache").fetchone()[0]
+        if count > self.max_entries:
+            # 多淘汰 10%，避免每次检查都触发淘汰
+            n = count - int(self.max_entries * 0.9)
+            conn.execute(
+                "DELETE FROM ocr_cache WHERE key IN (SELECT key FROM ocr_cache ORDER BY used_at LIMIT ?)", (n,)
+            )
+            logger.info(f"OCR 缓存超过 {self.max_entries} 条，淘汰了 {n} 条最久未使用的结果")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM ocr_cache").fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM ocr_cache")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+_cache: OCRCache = None
+_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> Optional[OCRCache]:
+    """获取共享的 OCR 结果缓存，OCR_CACHE_PATH 为空时不使用缓存，返回 None"""
+    global _cache
+    if not OCR_CACHE_PATH:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = OCRCache()
+    return _cache
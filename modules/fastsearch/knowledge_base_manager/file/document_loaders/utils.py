@@ -1,10 +1,10 @@
 import importlib
 from typing import Dict
-import chardet
 from langchain_community import document_loaders
 
 from application.settings import LOADER_DICT
 from xiaoapi.core import logger
+from .encoding import detect_file_encoding
 
 
 class JSONLinesLoader(document_loaders.JSONLoader):
@@ -37,9 +37,15 @@ def get_loader(loader_name: str, file_path: str, loader_kwargs: Dict = None):
         if loader_name in ["RapidOCRPDFLoader", "RapidOCRLoader", "FilteredCSVLoader",
                            "RapidOCRDocLoader", "RapidOCRPPTLoader"]:
             document_loaders_module = importlib.import_module('modules.fastsearch.knowledge_base_manager.file.document_loaders')
+            DocumentLoader = getattr(document_loaders_module, loader_name)
+        elif loader_name == "CSVLoader":
+            # CSVLoader 读取中途出现编码错误时会从第一行重新读取，重复返回已经读取的行；
+            # 不指定列的 FilteredCSVLoader 输出与之相同，并且重新读取时跳过已经返回的行
+            document_loaders_module = importlib.import_module('modules.fastsearch.knowledge_base_manager.file.document_loaders')
+            DocumentLoader = getattr(document_loaders_module, "FilteredCSVLoader")
         else:
             document_loaders_module = importlib.import_module('langchain_community.document_loaders')
-        DocumentLoader = getattr(document_loaders_module, loader_name)
+            DocumentLoader = getattr(document_loaders_module, loader_name)
     except Exception as e:
         msg = f"为文件{file_path}查找加载器{loader_name}时出错：{e}"
         logger.error(f'{e.__class__.__name__}: {msg}')
@@ -48,14 +54,11 @@ def get_loader(loader_name: str, file_path: str, loader_kwargs: Dict = None):
 
     if loader_name == "UnstructuredFileLoader":
         loader_kwargs.setdefault("autodetect_encoding", True)
-    elif loader_name == "CSVLoader":
+    elif loader_name in ["CSVLoader", "FilteredCSVLoader"]:
         if not loader_kwargs.get("encoding"):
             # 如果未指定 encoding，自动识别文件编码类型，避免langchain loader 加载文件报编码错误
-            with open(file_path, 'rb') as struct_file:
-                encode_detect = chardet.detect(struct_file.read())
-            if encode_detect is None:
-                encode_detect = {"encoding": "utf-8"}
-            loader_kwargs["encoding"] = encode_detect["encoding"]
+            loader_kwargs["encoding"] = detect_file_encoding(file_path)
+        loader_kwargs.setdefault("autodetect_encoding", True)
 
     elif loader_name == "JSONLoader":
         loader_kwargs.setdefault("jq_schema", ".")
@@ -64,6 +67,8 @@ def get_loader(loader_name: str, file_path: str, loader_kwargs: Dict = None):
         loader_kwargs.setdefault("jq_schema", ".")
         loader_kwargs.setdefault("text_content", False)
     elif loader_name == "TextLoader":
+        if not loader_kwargs.get("encoding"):
+            loader_kwargs["encoding"] = detect_file_encoding(file_path)
         loader_kwargs.setdefault("autodetect_encoding", True)
 
     loader = DocumentLoader(file_path, **loader_kwargs)
@@ -1,5 +1,8 @@
+import hashlib
+import json
 import os
 import shutil
+import uuid
 from pathlib import Path
 from typing import List
 
@@ -8,6 +11,9 @@ from fastapi import File, Form, Body, Query, UploadFile
 
 from modules.fastsearch.knowledge_base_manager.file.utils import run_in_thread_pool
 
+# 流式保存上传文件时每次读写的字节数
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def exist_kb(knowledge_base_name: str):
     kb_path = get_kb_path(knowledge_base_name)
@@ -17,6 +23,9 @@ def exist_kb(knowledge_base_name: str):
 def delete_file(file_path: str):
     if os.path.exists(file_path):
         os.remove(file_path)
+    sha256_path = _sha256_path(file_path)
+    if os.path.exists(sha256_path):
+        os.remove(sha256_path)
 
 
 def exist_file(kb_name: str, file_name: str):
@@ -57,6 +66,84 @@ def delete_kb(kb_name: str):
         shutil.rmtree(kb_path)
 
 
+def file_sha256(file_path: str) -> str:
+    """
+    分块计算文件内容的 sha256
+    """
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _sha256_path(file_path: str) -> str:
+    """文件 sha256 的记录文件，以 . 开头，不会出现在 list_files_from_folder 的结果中"""
+    return os.path.join(os.path.dirname(file_path), f".{os.path.basename(file_path)}.sha256")
+
+
+def _write_file_sha256(file_path: str, sha256: str):
+    """记录文件的 sha256，以及记录时文件的大小与修改时间"""
+    stat = os.stat(file_path)
+    with open(_sha256_path(file_path), "w") as f:
+        json.dump({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}, f)
+
+
+def get_file_sha256(file_path: str) -> str:
+    """
+    获取文件的 sha256：优先使用保存文件时记录的值，文件的大小或修改时间与记录不一致（例如被直接修改过）
+    或没有记录时重新计算并记录
+    """
+    stat = os.stat(file_path)
+    try:
+        with open(_sha256_path(file_path)) as f:
+            record = json.load(f)
+        if record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+            return record["sha256"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    sha256 = file_sha256(file_path)
+    _write_file_sha256(file_path, sha256)
+    return sha256
+
+
+def save_upload_file(file: UploadFile, file_path: str, override: bool) -> bool:
+    """
+    将上传文件分块写入同目录下的临时文件，同时计算大小与 sha256，完成后原子地重命名为目标文件，
+    整个过程不会把文件内容全部读入内存。
+    临时文件以 . 开头，不会出现在 list_files_from_folder 的结果中。
+    目标文件已存在且内容相同（大小与 sha256 一致）并且不覆盖时，放弃保存并返回 False。
+    保存时计算的 sha256 记录在文件旁（见 get_file_sha256），再次上传时不需要重新读取已有文件计算。
+    """
+    dir_path = os.path.dirname(file_path)
+    os.makedirs(dir_path, exist_ok=True)
+    tmp_path = os.path.join(dir_path, f".{os.path.basename(file_path)}.{uuid.uuid4().hex}.uploading")
+
+    try:
+        size = 0
+        sha256 = hashlib.sha256()
+        file.file.seek(0)
+        with open(tmp_path, "wb") as f:
+            while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                sha256.update(chunk)
+                f.write(chunk)
+
+        if (not override
+                and os.path.isfile(file_path)
+                and os.path.getsize(file_path) == size
+                and get_file_sha256(file_path) == sha256.hexdigest()
+        ):
+            return False
+
+        os.replace(tmp_path, file_path)
+        _write_file_sha256(file_path, sha256.hexdigest())
+        return True
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def save_files_in_thread(
         files: List[UploadFile],
         knowledge_base_name: str,
@@ -76,27 +163,19 @@ def save_files_in_thread(
             file_path = get_file_path(knowledge_base_name=knowledge_base_name, doc_name=filename)
             data = {"knowledge_base_name": knowledge_base_name, "file_name": filename}
 
-            file_content = file.file.read()  # 读取上传文件的内容
-            if (os.path.isfile(file_path)
-                    and not override
-                    and os.path.getsize(file_path) == len(file_content)
-            ):
+            if not save_upload_file(file, file_path, override):
                 file_status = f"文件 {filename} 已存在。"
                 print(file_status)
                 return dict(code=404, msg=file_status, data=data)
 
-            if not os.path.isdir(os.path.dirname(file_path)):
-                os.makedirs(os.path.dirname(file_path))
-            with open(file_path, "wb") as f:
-                f.write(file_content)
             return dict(code=200, msg=f"成功上传文件 {filename}", data=data)
         except Exception as e:
             msg = f"{filename} 文件上传失败，报错信息为: {e}"
             print(f'{e.__class__.__name__}: {msg}')
             return dict(code=500, msg=msg, data=data)
 
-    params = [{"file": file, "knowledge_base_name": knowledge_base_name, "override": override} for file in files]
-    for result in run_in_thread_pool(save_file, params=params):
+    params = ({"file": file, "knowledge_base_name": knowledge_base_name, "override": override} for file in files)
+    for result in run_in_thread_pool(save_file, params=params, executor="upload"):
         yield result
 
 
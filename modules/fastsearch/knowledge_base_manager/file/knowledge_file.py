@@ -1,19 +1,21 @@
 import os
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Union, Tuple, Generator
+from typing import Dict, List, Union, Tuple, Generator, Iterator
 
 from langchain_core.documents import Document
 from langchain_text_splitters import TextSplitter
 
-from application.settings import ZH_TITLE_ENHANCE, CHUNK_SIZE, OVERLAP_SIZE
+from application.settings import ZH_TITLE_ENHANCE, CHUNK_SIZE, OVERLAP_SIZE, FILE2TEXT_EXECUTOR, INGEST_STREAM_BATCH_SIZE
 from xiaoapi.core import logger
 from .document_loaders.utils import SUPPORTED_EXTS, get_loader_name, get_loader
 from .file_manager import get_file_path
 from .text_splitter.utils import get_splitter_name, make_text_splitter
-from .utils import run_in_thread_pool
+from .utils import run_in_thread_pool, run_in_process_pool
 
 from .text_splitter import zh_title_enhance as func_zh_title_enhance
 from .text_splitter import zh_title_enhance_md as func_zh_title_enhance_md
+from .text_splitter.zh_title_enhance import iter_zh_title_enhance, iter_zh_title_enhance_md
 
 
 class KnowledgeFile:
@@ -104,6 +106,82 @@ class KnowledgeFile:
                                                 text_splitter=text_splitter)
         return self.splited_docs
 
+    def iter_docs(self) -> Iterator[Document]:
+        '''
+        逐个加载文档，不保存在 self.docs 中。加载器实现了 lazy_load 时按需读取文件
+        '''
+        logger.info(f"{self.document_loader_name} used for {self.filepath} (streaming)")
+        loader = get_loader(loader_name=self.document_loader_name,
+                            file_path=self.filepath,
+                            loader_kwargs=self.loader_kwargs)
+        try:
+            docs = loader.lazy_load()
+        except NotImplementedError:
+            docs = loader.load()
+        yield from docs
+
+    def iter_chunks(
+            self,
+            zh_title_enhance: bool = ZH_TITLE_ENHANCE,
+            chunk_size: int = CHUNK_SIZE,
+            chunk_overlap: int = OVERLAP_SIZE,
+            text_splitter: TextSplitter = None,
+    ) -> Iterator[Document]:
+        '''
+        流式版本的 file2text：逐个文档加载、切分、标题加强，逐个返回切分后的 Document，结果与 file2text 相同，
+        内存中只保留当前加载的文档，不保存在 self.docs、self.splited_docs 中
+        '''
+        if text_splitter is None:
+            text_splitter = make_text_splitter(
+                splitter_name=self.text_splitter_name,
+                chunk_size=chunk_size,
+                chunk_overlap=chunk_overlap
+            )
+
+        def split(docs: Iterator[Document]) -> Iterator[Document]:
+            for doc in docs:
+                if text_splitter is None:
+                    yield doc
+                elif self.text_splitter_name == "MarkdownHeaderTextSplitter":
+                    # 与 docs2texts 一致，只切分第一个文档
+                    yield from text_splitter.split_text(doc.page_content)
+                    return
+                else:
+                    yield from text_splitter.split_documents([doc])
+
+        chunks = split(self.iter_docs())
+        if zh_title_enhance:
+            if self.ext == ".md":
+                chunks = iter_zh_title_enhance_md(chunks)
+            else:
+                chunks = iter_zh_title_enhance(chunks)
+        yield from chunks
+
+    @property
+    def row_based(self) -> bool:
+        '''
+        csv、jsonl 等不使用分词器的文件，每行对应一个切分结果，第 n 个切分结果总是来自第 n 行，可以从中断处继续向量化
+        '''
+        return self.text_splitter_name == "None"
+
+    def iter_chunk_batches(
+            self,
+            batch_size: int = INGEST_STREAM_BATCH_SIZE,
+            skip: int = 0,
+            **kwargs,
+    ) -> Iterator[List[Document]]:
+        '''
+        将 iter_chunks 的结果按 batch_size 分批返回，跳过前 skip 个切分结果，其他参数同 iter_chunks
+        '''
+        batch = []
+        for chunk in islice(self.iter_chunks(**kwargs), skip, None):
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
     def file_exist(self):
         return os.path.isfile(self.filepath)
 
@@ -155,14 +233,105 @@ def files2docs_in_thread(
         except Exception as e:
             yield False, (kb_name, filename, str(e))
 
-    for result in run_in_thread_pool(func=file2docs, params=kwargs_list):
+    for result in run_in_thread_pool(func=file2docs, params=kwargs_list, executor="parse"):
         yield result
 
 
+def _file2chunks(
+        filename: str,
+        kb_name: str,
+        loader_kwargs: Dict,
+        **kwargs,
+) -> Tuple[bool, Tuple[str, str, Union[List[Tuple[str, Dict]], str]]]:
+    '''
+    在子进程中加载并切分文件。
+    为了减少进程间传输的数据量，返回紧凑的 (page_content, metadata) 列表，而不是 Document 对象
+    '''
+    try:
+        file = KnowledgeFile(filename=filename, knowledge_base_name=kb_name, loader_kwargs=loader_kwargs)
+        if file.document_loader_name == "RapidOCRPDFLoader":
+            # 解析进程已按 CPU 数并行，在进程内逐页 OCR，不再为每个解析进程各创建一个 OCR 进程池（每个 OCR 进程都加载 OCR 引擎）
+            file.loader_kwargs = {**file.loader_kwargs, "ocr_parallel": False}
+        docs = file.file2text(**kwargs)
+        return True, (kb_name, file.filename, [(doc.page_content, doc.metadata) for doc in docs])
+    except Exception as e:
+        msg = f"从文件 {kb_name}/{filename} 加载文档时出错：{e}"
+        logger.error(f'{e.__class__.__name__}: {msg}')
+        return False, (kb_name, filename, msg)
+
+
+def files2docs_in_process(
+        files: List[Union[KnowledgeFile, Tuple[str, str], Dict]],
+        chunk_size: int = CHUNK_SIZE,
+        chunk_overlap: int = OVERLAP_SIZE,
+        zh_title_enhance: bool = ZH_TITLE_ENHANCE,
+) -> Generator:
+    '''
+    利用多进程批量将磁盘文件转化成langchain Document，参数与返回值同 files2docs_in_thread。
+    文件的加载与切分都是CPU密集型操作，多进程可以避开GIL的限制。
+    '''
+    kwargs_list = []
+    for file in files:
+        kwargs = {}
+        try:
+            if isinstance(file, KnowledgeFile):
+                filename, kb_name, loader_kwargs = file.filename, file.kb_name, file.loader_kwargs
+            elif isinstance(file, tuple) and len(file) >= 2:
+                filename, kb_name, loader_kwargs = file[0], file[1], {}
+            elif isinstance(file, dict):
+                filename = file.pop("filename")
+                kb_name = file.pop("kb_name")
+                loader_kwargs = {}
+                kwargs.update(file)
+            kwargs["filename"] = filename
+            kwargs["kb_name"] = kb_name
+            kwargs["loader_kwargs"] = loader_kwargs
+            kwargs["chunk_size"] = chunk_size
+            kwargs["chunk_overlap"] = chunk_overlap
+            kwargs["zh_title_enhance"] = zh_title_enhance
+            kwargs_list.append(kwargs)
+        except Exception as e:
+            yield False, (kb_name, filename, str(e))
+
+    for status, result in run_in_process_pool(func=_file2chunks, params=kwargs_list, executor="parse_process"):
+        if status:
+            kb_name, file_name, chunks = result
+            docs = [Document(page_content=page_content, metadata=metadata) for page_content, metadata in chunks]
+            yield True, (kb_name, file_name, docs)
+        else:
+            yield False, result
+
+
+def files2docs(
+        files: List[Union[KnowledgeFile, Tuple[str, str], Dict]],
+        chunk_size: int = CHUNK_SIZE,
+        chunk_overlap: int = OVERLAP_SIZE,
+        zh_title_enhance: bool = ZH_TITLE_ENHANCE,
+        executor: str = FILE2TEXT_EXECUTOR,
+) -> Generator:
+    '''
+    根据配置的执行方式（thread/process）批量将磁盘文件转化成langchain Document
+    '''
+    if executor == "process":
+        func = files2docs_in_process
+    else:
+        func = files2docs_in_thread
+    return func(files, chunk_size=chunk_size, chunk_overlap=chunk_overlap, zh_title_enhance=zh_title_enhance)
+
+
 if __name__ == "__main__":
-    kb_file = KnowledgeFile(
-        filename="帮会任务.md",
-        knowledge_base_name="test001"
-    )
-    docs = kb_file.docs2texts()
-    print(docs)
+    import sys
+    import time
+    from .file_manager import list_files_from_folder
+
+    # 对比线程池与进程池加载切分文件的耗时：
+    # python -m modules.fastsearch.knowledge_base_manager.file.knowledge_file <知识库名称>
+    kb_name = sys.argv[1] if len(sys.argv) > 1 else "test001"
+    files = [(file, kb_name) for file in list_files_from_folder(kb_name)]
+    for executor in ["thread", "process"]:
+        start = time.perf_counter()
+        docs_count = 0
+        for status, result in files2docs(files, executor=executor):
+            if status:
+                docs_count += len(result[2])
+        print(f"{executor}: {len(files)} 个文件，{docs_count} 个文档，耗时 {time.perf_counter() - start:.2f}s")
@@ -1,31 +1,45 @@
+import json
+import os
 import re
-from typing import List, Optional, Any
+from collections import deque
+from typing import List, Optional, Any, Dict, Iterable, Pattern, Tuple
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 import logging
 
 
 logger = logging.getLogger(__name__)
 
+MULTI_NEWLINE_PATTERN = re.compile(r"\n{2,}")
 
-def _split_text_with_regex_from_end(
-        text: str, separator: str, keep_separator: bool
-) -> List[str]:
-    # Now that we have the separator, split the text
-    if separator:
-        if keep_separator:
-            # The parentheses in the pattern keep the delimiters in the result.
-            _splits = re.split(f"({separator})", text)
-            splits = ["".join(i) for i in zip(_splits[0::2], _splits[1::2])]
-            if len(_splits) % 2 == 1:
-                splits += _splits[-1:]
-            # splits = [_splits[0]] + splits
-        else:
-            splits = re.split(separator, text)
+
+def _split_text_with_pattern_from_end(text: str, pattern: Pattern, keep_separator: bool) -> List[str]:
+    """
+    使用预编译的分隔符切分文本，保留分隔符时分隔符放在前一个片段的末尾。
+    保留分隔符时 pattern 为外层加了括号的分隔符，re.split 与拼接都在C中完成，不需要为每个片段执行Python代码
+    """
+    _splits = pattern.split(text)
+    if keep_separator:
+        it = iter(_splits)
+        splits = [s + sep for s, sep in zip(it, it)]
+        if len(_splits) % 2 == 1:
+            splits.append(_splits[-1])
     else:
-        splits = list(text)
+        splits = _splits
     return [s for s in splits if s != ""]
 
 
+class _SplitFrame:
+    """_split_text 工作栈中的一项：一段待切分文本的切分结果、各片段长度及合并状态"""
+    __slots__ = ("splits", "new_separators", "merge_separator", "good_splits", "good_lengths")
+
+    def __init__(self, splits: List[str], lengths: List[int], new_separators: List[str], merge_separator: str):
+        self.splits = zip(splits, lengths)
+        self.new_separators = new_separators
+        self.merge_separator = merge_separator
+        self.good_splits = []
+        self.good_lengths = []
+
+
 class ChineseRecursiveTextSplitter(RecursiveCharacterTextSplitter):
     def __init__(
             self,
@@ -45,49 +59,179 @@ class ChineseRecursiveTextSplitter(RecursiveCharacterTextSplitter):
             "，|,\s"
         ]
         self._is_separator_regex = is_separator_regex
+        # 分隔符 -> (用于查找的正则, 用于切分的正则)，每个实例只编译一次
+        self._separator_patterns: Dict[str, Tuple[Pattern, Pattern]] = {}
+        for separator in self._separators:
+            self._get_separator_patterns(separator)
 
-    def _split_text(self, text: str, separators: List[str]) -> List[str]:
-        """Split incoming text and return chunks."""
-        final_chunks = []
-        # Get appropriate separator to use
-        separator = separators[-1]
-        new_separators = []
+    def _get_separator_patterns(self, separator: str) -> Tuple[Pattern, Pattern]:
+        patterns = self._separator_patterns.get(separator)
+        if patterns is None:
+            _separator = separator if self._is_separator_regex else re.escape(separator)
+            # The parentheses in the pattern keep the delimiters in the result.
+            split_pattern = re.compile(f"({_separator})") if self._keep_separator else re.compile(_separator)
+            patterns = (re.compile(_separator), split_pattern)
+            self._separator_patterns[separator] = patterns
+        return patterns
+
+    def _choose_separator(self, text: str, separators: List[str]) -> Tuple[str, List[str]]:
+        """选择文本中出现的第一个分隔符，返回该分隔符与之后的分隔符"""
         for i, _s in enumerate(separators):
-            _separator = _s if self._is_separator_regex else re.escape(_s)
             if _s == "":
-                separator = _s
-                break
-            if re.search(_separator, text):
-                separator = _s
-                new_separators = separators[i + 1:]
-                break
-
-        _separator = separator if self._is_separator_regex else re.escape(separator)
-        splits = _split_text_with_regex_from_end(text, _separator, self._keep_separator)
-
-        # Now go merging things, recursively splitting longer texts.
-        _good_splits = []
-        _separator = "" if self._keep_separator else separator
-        for s in splits:
-            if self._length_function(s) < self._chunk_size:
-                _good_splits.append(s)
-            else:
-                if _good_splits:
-                    merged_text = self._merge_splits(_good_splits, _separator)
-                    final_chunks.extend(merged_text)
-                    _good_splits = []
-                if not new_separators:
+                return _s, []
+            if self._get_separator_patterns(_s)[0].search(text):
+                return _s, separators[i + 1:]
+        return separators[-1], []
+
+    def _new_frame(self, text: str, separators: List[str]) -> _SplitFrame:
+        separator, new_separators = self._choose_separator(text, separators)
+        if separator:
+            splits = _split_text_with_pattern_from_end(text, self._get_separator_patterns(separator)[1],
+                                                       self._keep_separator)
+        else:
+            splits = list(text)
+        merge_separator = "" if self._keep_separator else separator
+        return _SplitFrame(splits, self._lengths(splits), new_separators, merge_separator)
+
+    def _lengths(self, texts: List[str]) -> List[int]:
+        """
+        计算一组片段的长度。length_function 支持批量计算（如 TokenLengthFunction）时一次计算所有片段
+        """
+        batch = getattr(self._length_function, "batch", None)
+        if batch is not None:
+            return batch(texts)
+        return [self._length_function(text) for text in texts]
+
+    def split_text(self, text: str) -> List[str]:
+        # 按 token 计算长度时，字符数乘以每个字符的最大 token 数仍小于 chunk_size 的文本不需要切分，也不需要分词
+        upper_bound = getattr(self._length_function, "upper_bound", None)
+        if upper_bound is not None and self._keep_separator and upper_bound(text) < self._chunk_size:
+            return self._postprocess_chunks([text])
+        return self._split_text(text, self._separators)
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        """
+        Split incoming text and return chunks.
+        使用显式的工作栈代替递归：过长的片段压栈后用之后的分隔符继续切分，切分完成后出栈，继续处理上一层剩余的片段，
+        结果顺序与递归实现相同。去除首尾空白、合并连续换行只在最后对所有 chunk 执行一次。
+        """
+        final_chunks = []
+        stack = [self._new_frame(text, separators)]
+        while stack:
+            frame = stack[-1]
+            # Now go merging things, splitting longer texts with the remaining separators.
+            for s, length in frame.splits:
+                if length < self._chunk_size:
+                    frame.good_splits.append(s)
+                    frame.good_lengths.append(length)
+                    continue
+                if frame.good_splits:
+                    final_chunks.extend(self._merge_splits_with_lengths(frame.good_splits, frame.good_lengths,
+                                                                        frame.merge_separator))
+                    frame.good_splits = []
+                    frame.good_lengths = []
+                if not frame.new_separators:
                     final_chunks.append(s)
                 else:
-                    other_info = self._split_text(s, new_separators)
-                    final_chunks.extend(other_info)
-        if _good_splits:
-            merged_text = self._merge_splits(_good_splits, _separator)
-            final_chunks.extend(merged_text)
-        return [re.sub(r"\n{2,}", "\n", chunk.strip()) for chunk in final_chunks if chunk.strip()!=""]
+                    stack.append(self._new_frame(s, frame.new_separators))
+                    break
+            else:
+                if frame.good_splits:
+                    final_chunks.extend(self._merge_splits_with_lengths(frame.good_splits, frame.good_lengths,
+                                                                        frame.merge_separator))
+                stack.pop()
+
+        return self._postprocess_chunks(final_chunks)
+
+    @staticmethod
+    def _postprocess_chunks(final_chunks: List[str]) -> List[str]:
+        results = []
+        for chunk in final_chunks:
+            chunk = chunk.strip()
+            if chunk != "":
+                if "\n\n" in chunk:
+                    chunk = MULTI_NEWLINE_PATTERN.sub("\n", chunk)
+                results.append(chunk)
+        return results
+
+    def _merge_splits(self, splits: Iterable[str], separator: str) -> List[str]:
+        splits = list(splits)
+        return self._merge_splits_with_lengths(splits, self._lengths(splits), separator)
+
+    def _merge_splits_with_lengths(self, splits: List[str], lengths: List[int], separator: str) -> List[str]:
+        """
+        与 TextSplitter._merge_splits 结果相同。
+        使用预先计算的片段长度，移出窗口时不再重新计算（length_function 为 tokenizer 时开销较大），并使用 deque 从头部移出片段
+        """
+        chunk_size = self._chunk_size
+        chunk_overlap = self._chunk_overlap
+        separator_len = self._length_function(separator) if separator else 0
+
+        docs = []
+        current_doc = deque()
+        current_lens = deque()
+        total = 0
+        for d, _len in zip(splits, lengths):
+            if total + _len + (separator_len if current_doc else 0) > chunk_size:
+                if total > chunk_size:
+                    logger.warning(
+                        f"Created a chunk of size {total}, "
+                        f"which is longer than the specified {chunk_size}"
+                    )
+                if current_doc:
+                    doc = self._join_docs(current_doc, separator)
+                    if doc is not None:
+                        docs.append(doc)
+                    # Keep on popping if:
+                    # - we have a larger chunk than in the chunk overlap
+                    # - or if we still have any chunks and the length is long
+                    while total > chunk_overlap or (
+                            total + _len + (separator_len if current_doc else 0) > chunk_size
+                            and total > 0
+                    ):
+                        total -= current_lens.popleft() + (separator_len if len(current_doc) > 1 else 0)
+                        current_doc.popleft()
+            current_doc.append(d)
+            current_lens.append(_len)
+            total += _len + (separator_len if len(current_doc) > 1 else 0)
+        doc = self._join_docs(current_doc, separator)
+        if doc is not None:
+            docs.append(doc)
+        return docs
+
+
+GOLDEN_OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "golden", "chinese_recursive_text_splitter.json")
+
+
+def check_golden_output(path: str = GOLDEN_OUTPUT_PATH) -> List[str]:
+    """
+    按固定语料检查切分结果与原递归实现的结果（golden/chinese_recursive_text_splitter.json）是否一致，
+    返回不一致的用例说明，全部一致时返回空列表
+    """
+    with open(path, encoding="utf-8") as f:
+        golden = json.load(f)
+    mismatches = []
+    for i, case in enumerate(golden["cases"]):
+        chunks = ChineseRecursiveTextSplitter(**case["kwargs"]).split_text(golden["texts"][case["text"]])
+        if chunks != case["chunks"]:
+            n = next((j for j, (a, b) in enumerate(zip(chunks, case["chunks"])) if a != b),
+                     min(len(chunks), len(case["chunks"])))
+            mismatches.append(f"用例 {i}（文本 {case['text']}，参数 {case['kwargs']}）：期望 {len(case['chunks'])} 段，"
+                              f"实际 {len(chunks)} 段，第 {n + 1} 段开始不一致")
+    return mismatches
 
 
 if __name__ == "__main__":
+    import sys
+
+    # python -m modules.fastsearch.knowledge_base_manager.file.text_splitter.chinese_recursive_text_splitter --check
+    if "--check" in sys.argv:
+        mismatches = check_golden_output()
+        for mismatch in mismatches:
+            print(mismatch)
+        print(f"切分结果不一致的用例：{len(mismatches)} 个")
+        sys.exit(1 if mismatches else 0)
+
     text_splitter = ChineseRecursiveTextSplitter(
         keep_separator=True,
         is_separator_regex=True,
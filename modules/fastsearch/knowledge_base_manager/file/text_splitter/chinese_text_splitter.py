@@ -1,6 +1,28 @@
 from langchain_text_splitters import CharacterTextSplitter
 import re
-from typing import List
+from typing import Iterator, List
+
+# pdf 文本预处理
+PDF_MULTI_NEWLINE_PATTERN = re.compile(r"\n{3,}")
+PDF_WHITESPACE_PATTERN = re.compile(r"\s")
+
+# 断句规则，依次作用于全文，在断句处插入 \n
+SENTENCE_PATTERNS = [
+    re.compile(r'([;；.!?。！？\?])([^”’])'),  # 单字符断句符
+    re.compile(r'(\.{6})([^"’”」』])'),  # 英文省略号
+    re.compile(r'(\…{2})([^"’”」』])'),  # 中文省略号
+    # 如果双引号前有终止符，那么双引号才是句子的终点，把分句符\n放到双引号后，注意前面的几句都小心保留了双引号
+    re.compile(r'([;；!?。！？\?]["’”」』]{0,2})([^;；!?，。！？\?])'),
+]
+
+# 超过 sentence_size 的句子依次按逗号、连续空格、单个空格继续切分
+LONG_SENTENCE_PATTERNS = [
+    re.compile(r'([,，.]["’”」』]{0,2})([^,，.])'),
+    re.compile(r'([\n]{1,}| {2,}["’”」』]{0,2})([^\s])'),
+    re.compile(r'( ["’”」』]{0,2})([^ ])'),
+]
+
+LINE_PATTERN = re.compile(r"[^\n]+")
 
 
 class ChineseTextSplitter(CharacterTextSplitter):
@@ -23,37 +45,60 @@ class ChineseTextSplitter(CharacterTextSplitter):
                 sent_list.append(ele)
         return sent_list
 
-    def split_text(self, text: str) -> List[str]:   ##此处需要进一步优化逻辑
+    def split_text(self, text: str) -> List[str]:
+        return list(self.iter_sentences(text))
+
+    def iter_sentences(self, text: str) -> Iterator[str]:
+        """
+        按句切分文本，逐句返回。
+        断句规则在全文上各执行一次，之后按行遍历，过长的句子按 LONG_SENTENCE_PATTERNS 逐级细分，耗时与文本长度成线性关系。
+        很多规则中会考虑分号;，但是这里我把它忽略不计，破折号、英文双引号等同样忽略，需要的再做些简单调整即可。
+        """
         if self.pdf:
-            text = re.sub(r"\n{3,}", r"\n", text)
-            text = re.sub('\s', " ", text)
-            text = re.sub("\n\n", "", text)
-
-        text = re.sub(r'([;；.!?。！？\?])([^”’])', r"\1\n\2", text)  # 单字符断句符
-        text = re.sub(r'(\.{6})([^"’”」』])', r"\1\n\2", text)  # 英文省略号
-        text = re.sub(r'(\…{2})([^"’”」』])', r"\1\n\2", text)  # 中文省略号
-        text = re.sub(r'([;；!?。！？\?]["’”」』]{0,2})([^;；!?，。！？\?])', r'\1\n\2', text)
-        # 如果双引号前有终止符，那么双引号才是句子的终点，把分句符\n放到双引号后，注意前面的几句都小心保留了双引号
+            text = PDF_MULTI_NEWLINE_PATTERN.sub("\n", text)
+            text = PDF_WHITESPACE_PATTERN.sub(" ", text)
+            text = text.replace("\n\n", "")
+
+        for pattern in SENTENCE_PATTERNS:
+            text = pattern.sub(r"\1\n\2", text)
         text = text.rstrip()  # 段尾如果有多余的\n就去掉它
-        # 很多规则中会考虑分号;，但是这里我把它忽略不计，破折号、英文双引号等同样忽略，需要的再做些简单调整即可。
-        ls = [i for i in text.split("\n") if i]
-        for ele in ls:
-            if len(ele) > self.sentence_size:
-                ele1 = re.sub(r'([,，.]["’”」』]{0,2})([^,，.])', r'\1\n\2', ele)
-                ele1_ls = ele1.split("\n")
-                for ele_ele1 in ele1_ls:
-                    if len(ele_ele1) > self.sentence_size:
-                        ele_ele2 = re.sub(r'([\n]{1,}| {2,}["’”」』]{0,2})([^\s])', r'\1\n\2', ele_ele1)
-                        ele2_ls = ele_ele2.split("\n")
-                        for ele_ele2 in ele2_ls:
-                            if len(ele_ele2) > self.sentence_size:
-                                ele_ele3 = re.sub('( ["’”」』]{0,2})([^ ])', r'\1\n\2', ele_ele2)
-                                ele2_id = ele2_ls.index(ele_ele2)
-                                ele2_ls = ele2_ls[:ele2_id] + [i for i in ele_ele3.split("\n") if i] + ele2_ls[
-                                                                                                       ele2_id + 1:]
-                        ele_id = ele1_ls.index(ele_ele1)
-                        ele1_ls = ele1_ls[:ele_id] + [i for i in ele2_ls if i] + ele1_ls[ele_id + 1:]
-
-                id = ls.index(ele)
-                ls = ls[:id] + [i for i in ele1_ls if i] + ls[id + 1:]
-        return ls
+
+        for match in LINE_PATTERN.finditer(text):
+            sentence = match.group()
+            if len(sentence) > self.sentence_size:
+                yield from self._split_long_sentence(sentence, 0)
+            else:
+                yield sentence
+
+    def _split_long_sentence(self, sentence: str, level: int) -> Iterator[str]:
+        pattern = LONG_SENTENCE_PATTERNS[level]
+        is_last_level = level == len(LONG_SENTENCE_PATTERNS) - 1
+        for part in pattern.sub(r"\1\n\2", sentence).split("\n"):
+            if not part:
+                continue
+            if len(part) > self.sentence_size and not is_last_level:
+                yield from self._split_long_sentence(part, level + 1)
+            else:
+                yield part
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # 在数 MB 的中文文本上测试切分耗时：
+    # python -m modules.fastsearch.knowledge_base_manager.file.text_splitter.chinese_text_splitter
+    random.seed(0)
+    chars = "天龙八部武侠小说中的人物段誉乔峰虚竹王语嫣阿朱阿紫慕容复鸠摩智扫地僧江湖恩怨情仇"
+    puncts = ["，", "。", "！", "？", "；", "……", "” ", "  ", " "]
+    sentences = []
+    for i in range(150000):
+        sentences.append("".join(random.choices(chars, k=random.randint(5, 40))) + str(i) + random.choice(puncts))
+        if random.random() < 0.05:
+            sentences.append("\n")
+    text = "".join(sentences)
+
+    splitter = ChineseTextSplitter(sentence_size=100)
+    start = time.perf_counter()
+    results = splitter.split_text(text)
+    print(f"文本长度 {len(text) / 1024 / 1024:.2f}M 字符，切分为 {len(results)} 句，耗时 {time.perf_counter() - start:.2f}s")
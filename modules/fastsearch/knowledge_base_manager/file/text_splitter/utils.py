@@ -1,12 +1,19 @@
 import importlib
-from langchain_text_splitters import MarkdownHeaderTextSplitter
-from application.settings import TEXT_SPLITTER_DICT, CHUNK_SIZE, OVERLAP_SIZE
+import math
+import threading
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from langchain_text_splitters import MarkdownHeaderTextSplitter, TextSplitter
+from application.settings import TEXT_SPLITTER_DICT, CHUNK_SIZE, OVERLAP_SIZE, CHUNK_LENGTH_MODE, \
+    EMBEDDING_TOKENIZER_PATH, EMBEDDING_MAX_TOKENS, MAX_TOKENS_PER_CHAR
+from xiaoapi.core import logger
 
 DEFAULT_TEXT_SPLITTER_NAME = "ChineseRecursiveTextSplitter"
 
 # 分词器匹配， 如果未配置默认为DEFAULT_TEXT_SPLITTER_NAME
 SPLITTER_DICT = {
-    "None": ['.csv'],  # 无需使用分词器的格式
+    "None": ['.csv', '.jsonl'],  # 无需使用分词器的格式，每行一个 Document
     "MarkdownHeaderTextSplitter": ['.md'],
 
 }
@@ -18,35 +25,211 @@ def get_splitter_name(file_extension):
             return splitter_name
 
 
+# 已创建的分词器：(分词器名称, chunk_size, chunk_overlap, 长度计算方式, tokenizer来源, tokenizer名称或路径) -> 分词器
+_text_splitters: Dict[Tuple, TextSplitter] = {}
+_text_splitters_lock = threading.Lock()
+# 不能在多个线程中同时使用的分词器按线程缓存：_thread_local.text_splitters、_thread_local.tokenizers，
+# 清空缓存时增加 _cache_generation，各线程下次获取分词器时丢弃旧的缓存
+_thread_local = threading.local()
+_cache_generation = 0
+
+
+def _load_huggingface_tokenizer(tokenizer_name_or_path: str):
+    if tokenizer_name_or_path == "gpt2":
+        from transformers import GPT2TokenizerFast
+        return GPT2TokenizerFast.from_pretrained("gpt2")
+    else:
+        from transformers import AutoTokenizer
+        return AutoTokenizer.from_pretrained(tokenizer_name_or_path, trust_remote_code=True)
+
+
+@lru_cache(maxsize=None)
+def get_huggingface_tokenizer(tokenizer_name_or_path: str):
+    """
+    加载 huggingface tokenizer，每个进程中同一个 tokenizer 只加载一次
+    """
+    return _load_huggingface_tokenizer(tokenizer_name_or_path)
+
+
+def _get_thread_cache(name: str) -> Dict:
+    """获取当前线程的缓存字典，缓存已被 clear_text_splitter_cache 清空时返回新的字典"""
+    if getattr(_thread_local, "generation", None) != _cache_generation:
+        _thread_local.generation = _cache_generation
+        _thread_local.text_splitters = {}
+        _thread_local.tokenizers = {}
+    return getattr(_thread_local, name)
+
+
+def _get_thread_huggingface_tokenizer(tokenizer_name_or_path: str):
+    """
+    加载当前线程使用的 huggingface tokenizer：tokenizer.encode 会修改 Rust 端的截断、填充设置，
+    多个线程同时使用同一个 tokenizer 会报 Already borrowed
+    """
+    tokenizers = _get_thread_cache("tokenizers")
+    tokenizer = tokenizers.get(tokenizer_name_or_path)
+    if tokenizer is None:
+        tokenizer = _load_huggingface_tokenizer(tokenizer_name_or_path)
+        tokenizers[tokenizer_name_or_path] = tokenizer
+    return tokenizer
+
+
+def _is_thread_safe(splitter_name: str, length_mode: str) -> bool:
+    """
+    分词器能否在多个线程中同时使用：spaCy pipeline 不保证线程安全；
+    按字符数切分时 huggingface 来源的分词器用 tokenizer.encode 计算长度，会修改 tokenizer 的状态
+    """
+    if splitter_name == "SpacyTextSplitter":
+        return False
+    config = TEXT_SPLITTER_DICT.get(splitter_name, {})
+    return not (length_mode == "char" and config.get("source") == "huggingface"
+                and config.get("tokenizer_name_or_path"))
+
+
+class TokenLengthFunction:
+    """
+    按 tokenizer 的 token 数计算文本长度（不含 [CLS]、[SEP] 等特殊 token），用作分词器的 length_function。
+    batch 一次计算多个文本的长度，fast tokenizer 在 Rust 中批量分词；upper_bound 按字符数估计长度上限，不需要分词
+    """
+
+    def __init__(self, tokenizer, max_tokens_per_char: float = MAX_TOKENS_PER_CHAR):
+        self.tokenizer = tokenizer
+        self.max_tokens_per_char = max_tokens_per_char
+        # fast tokenizer 底层的 tokenizers.Tokenizer，encode_batch 不修改截断、填充设置，可以在多个线程中同时调用；
+        # 不要对同一个 tokenizer 调用 tokenizer.encode 等会修改设置的方法（见 _get_thread_huggingface_tokenizer）
+        self._backend = getattr(tokenizer, "backend_tokenizer", None)
+
+    def __call__(self, text: str) -> int:
+        return self.batch([text])[0]
+
+    def batch(self, texts: List[str]) -> List[int]:
+        if not texts:
+            return []
+        if self._backend is not None:
+            return [len(encoding.ids) for encoding in self._backend.encode_batch(texts, add_special_tokens=False)]
+        return [len(ids) for ids in self.tokenizer(texts, add_special_tokens=False)["input_ids"]]
+
+    def upper_bound(self, text: str) -> int:
+        return math.ceil(len(text) * self.max_tokens_per_char)
+
+
+@lru_cache(maxsize=None)
+def get_token_length_function(tokenizer_name_or_path: str = EMBEDDING_TOKENIZER_PATH) -> TokenLengthFunction:
+    """
+    按 embeddings 模型的 token 数计算长度的 length_function，每个进程中只加载一次 tokenizer
+    """
+    if not tokenizer_name_or_path:
+        raise ValueError("CHUNK_LENGTH_MODE 为 token 时需要配置 EMBEDDING_TOKENIZER_PATH")
+    return TokenLengthFunction(get_huggingface_tokenizer(tokenizer_name_or_path))
+
+
 def make_text_splitter(
         splitter_name: str,
         chunk_size: int = CHUNK_SIZE,
         chunk_overlap: int = OVERLAP_SIZE,
+        cache: bool = True,
+        length_mode: str = CHUNK_LENGTH_MODE,
 ):
     """
-    根据参数获取特定的分词器
+    根据参数获取特定的分词器。
+    length_mode 为 token 时 chunk_size、chunk_overlap 的单位为 embeddings 模型的 token，chunk_size 不超过模型的最大输入长度。
+    分词器创建后按 (分词器名称, chunk_size, chunk_overlap, tokenizer) 缓存，之后切分每个文件时直接复用，
+    不再重复导入模块、加载 tokenizer。能在多个线程中同时使用的分词器在进程内共享，
+    spaCy、huggingface tokenizer 等不能同时使用的分词器每个线程各自创建一个（见 _is_thread_safe）。
     """
     if splitter_name == "None":
         return None
 
     splitter_name = splitter_name or "SpacyTextSplitter"
+    if length_mode == "token" and splitter_name != "MarkdownHeaderTextSplitter":
+        make_func = _make_token_text_splitter
+        # 留出 [CLS]、[SEP] 的位置
+        chunk_size = min(chunk_size, EMBEDDING_MAX_TOKENS - 2)
+        chunk_overlap = min(chunk_overlap, chunk_size)
+    else:
+        make_func = _make_text_splitter
+        length_mode = "char"
+    if not cache:
+        return make_func(splitter_name, chunk_size, chunk_overlap)
+
+    config = TEXT_SPLITTER_DICT.get(splitter_name, {})
+    key = (splitter_name, chunk_size, chunk_overlap, length_mode,
+           config.get("source"), config.get("tokenizer_name_or_path"))
+    if not _is_thread_safe(splitter_name, length_mode):
+        text_splitters = _get_thread_cache("text_splitters")
+        text_splitter = text_splitters.get(key)
+        if text_splitter is None:
+            text_splitter = make_func(splitter_name, chunk_size, chunk_overlap)
+            text_splitters[key] = text_splitter
+        return text_splitter
+
+    text_splitter = _text_splitters.get(key)
+    if text_splitter is None:
+        with _text_splitters_lock:
+            text_splitter = _text_splitters.get(key)
+            if text_splitter is None:
+                text_splitter = make_func(splitter_name, chunk_size, chunk_overlap)
+                _text_splitters[key] = text_splitter
+    return text_splitter
+
+
+def clear_text_splitter_cache():
+    global _cache_generation
+    with _text_splitters_lock:
+        _text_splitters.clear()
+        _cache_generation += 1
+    get_token_length_function.cache_clear()
+    get_huggingface_tokenizer.cache_clear()
+
+
+def _get_text_splitter_class(splitter_name: str):
+    try:
+        # 优先使用用户自定义的text_splitter
+        text_splitter_module = importlib.import_module(
+            'modules.fastsearch.knowledge_base_manager.file.text_splitter'
+        )
+        return getattr(text_splitter_module, splitter_name)
+    except:
+        # 否则使用langchain的text_splitter
+        text_splitter_module = importlib.import_module('langchain_text_splitters')
+        return getattr(text_splitter_module, splitter_name)
+
+
+def _make_token_text_splitter(
+        splitter_name: str,
+        chunk_size: int,
+        chunk_overlap: int,
+):
+    """
+    创建按 embeddings 模型 token 数计算长度的分词器，tokenizer 加载失败时抛出异常，不退回按字符数切分
+    """
+    length_function = get_token_length_function()
+    try:
+        TextSplitter = _get_text_splitter_class(splitter_name)
+    except AttributeError:
+        logger.warning(f"不存在分词器 {splitter_name}，使用 {DEFAULT_TEXT_SPLITTER_NAME}")
+        TextSplitter = _get_text_splitter_class(DEFAULT_TEXT_SPLITTER_NAME)
+
+    kwargs = {"chunk_size": chunk_size, "chunk_overlap": chunk_overlap, "length_function": length_function}
+    if splitter_name == "SpacyTextSplitter":
+        try:
+            return TextSplitter(pipeline="zh_core_web_sm", **kwargs)
+        except:
+            pass
+    return TextSplitter(**kwargs)
+
+
+def _make_text_splitter(
+        splitter_name: str,
+        chunk_size: int,
+        chunk_overlap: int,
+):
     try:
         if splitter_name == "MarkdownHeaderTextSplitter":  # MarkdownHeaderTextSplitter特殊判定
             headers_to_split_on = TEXT_SPLITTER_DICT[splitter_name]['headers_to_split_on']
             text_splitter = MarkdownHeaderTextSplitter(
                 headers_to_split_on=headers_to_split_on)
         else:
-
-            try:
-                # 优先使用用户自定义的text_splitter
-                text_splitter_module = importlib.import_module(
-                    'modules.fastsearch.knowledge_base_manager.file.text_splitter'
-                )
-                TextSplitter = getattr(text_splitter_module, splitter_name)
-            except:
-                # 否则使用langchain的text_splitter
-                text_splitter_module = importlib.import_module('langchain_text_splitters')
-                TextSplitter = getattr(text_splitter_module, splitter_name)
+            TextSplitter = _get_text_splitter_class(splitter_name)
 
             if TEXT_SPLITTER_DICT[splitter_name]["source"] == "tiktoken":  ## 从tiktoken加载
                 try:
@@ -68,15 +251,8 @@ def make_text_splitter(
                 #     text_splitter_dict[splitter_name]["tokenizer_name_or_path"] = \
                 #         config.get("model_path")
 
-                if TEXT_SPLITTER_DICT[splitter_name]["tokenizer_name_or_path"] == "gpt2":
-                    from transformers import GPT2TokenizerFast
-                    from langchain.text_splitter import CharacterTextSplitter
-                    tokenizer = GPT2TokenizerFast.from_pretrained("gpt2")
-                else:  ## 字符长度加载
-                    from transformers import AutoTokenizer
-                    tokenizer = AutoTokenizer.from_pretrained(
-                        TEXT_SPLITTER_DICT[splitter_name]["tokenizer_name_or_path"],
-                        trust_remote_code=True)
+                tokenizer = _get_thread_huggingface_tokenizer(
+                    TEXT_SPLITTER_DICT[splitter_name]["tokenizer_name_or_path"])
                 text_splitter = TextSplitter.from_huggingface_tokenizer(
                     tokenizer=tokenizer,
                     chunk_size=chunk_size,
@@ -95,7 +271,7 @@ def make_text_splitter(
                         chunk_overlap=chunk_overlap
                     )
     except Exception as e:
-        print(e)
+        logger.warning(f"创建分词器 {splitter_name} 失败，使用 RecursiveCharacterTextSplitter：{e}")
         text_splitter_module = importlib.import_module('langchain_text_splitters')
         TextSplitter = getattr(text_splitter_module, "RecursiveCharacterTextSplitter")
         text_splitter = TextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
@@ -104,3 +280,20 @@ def make_text_splitter(
     # text_splitter._tokenizer.max_length = 37016792
     # text_splitter._tokenizer.prefer_gpu()
     return text_splitter
+
+
+if __name__ == "__main__":
+    import time
+
+    # 对比每个文件重新创建分词器与复用缓存分词器的耗时：
+    # python -m modules.fastsearch.knowledge_base_manager.file.text_splitter.utils
+    texts = [f"# 标题{i}\n\n## 小节\n\n这是第{i}个用于测试的小型 Markdown 文件。" * 3 for i in range(2000)]
+    for splitter_name in ["MarkdownHeaderTextSplitter", DEFAULT_TEXT_SPLITTER_NAME]:
+        for cache in [False, True]:
+            clear_text_splitter_cache()
+            start = time.perf_counter()
+            for text in texts:
+                make_text_splitter(splitter_name, cache=cache).split_text(text)
+            cost = time.perf_counter() - start
+            print(f"{splitter_name} cache={cache}: {len(texts)} 个文件，"
+                  f"耗时 {cost:.2f}s，平均每个文件 {cost / len(texts) * 1000:.3f}ms")
@@ -1,8 +1,17 @@
 import re
+from typing import Iterable, Iterator, List
+
 from langchain_core.documents import Document
 from application.settings import TEXT_SPLITTER_DICT
 
 
+# 文本以标点符号结尾
+ENDS_IN_PUNCT_RE = re.compile(r"[^\w\s]\Z")
+# Markdown 标题在 metadata 中的键，从低级标题到高级标题
+MD_HEADER_KEYS = [header[1] for header in
+                  reversed(TEXT_SPLITTER_DICT["MarkdownHeaderTextSplitter"]["headers_to_split_on"])]
+
+
 def under_non_alpha_ratio(text: str, threshold: float = 0.5):
     """Checks if the proportion of non-alpha characters in the text snippet exceeds a given
     threshold. This helps prevent text like "-----------BREAK---------" from being tagged
@@ -16,16 +25,12 @@ def under_non_alpha_ratio(text: str, threshold: float = 0.5):
         If the proportion of non-alpha characters exceeds this threshold, the function
         returns False
     """
-    if len(text) == 0:
-        return False
-
-    alpha_count = len([char for char in text if char.strip() and char.isalpha()])
-    total_count = len([char for char in text if char.strip()])
-    try:
-        ratio = alpha_count / total_count
-        return ratio < threshold
-    except:
+    # 字母（含汉字）一定不是空白字符，分别统计即可，不需要构造中间列表
+    total_count = len(text) - sum(map(str.isspace, text))
+    if total_count == 0:
         return False
+    alpha_count = sum(map(str.isalpha, text))
+    return alpha_count / total_count < threshold
 
 
 def is_possible_title(
@@ -34,6 +39,7 @@ def is_possible_title(
         non_alpha_threshold: float = 0.5,
 ) -> bool:
     """Checks to see if the text passes all of the checks for a valid title.
+    各项检查全部通过才是title，开销小的检查放在前面，大部分chunk在长度检查时即可返回。
 
     Parameters
     ----------
@@ -47,13 +53,6 @@ def is_possible_title(
 
     # 文本长度为0的话，肯定不是title
     if len(text) == 0:
-        print("Not a title. Text is empty.")
-        return False
-
-    # 文本中有标点符号，就不是title
-    ENDS_IN_PUNCT_PATTERN = r"[^\w\s]\Z"
-    ENDS_IN_PUNCT_RE = re.compile(ENDS_IN_PUNCT_PATTERN)
-    if ENDS_IN_PUNCT_RE.search(text) is not None:
         return False
 
     # 文本长度不能超过设定值，默认20
@@ -62,59 +61,84 @@ def is_possible_title(
     if len(text) > title_max_word_length:
         return False
 
-    # 文本中数字的占比不能太高，否则不是title
-    if under_non_alpha_ratio(text, threshold=non_alpha_threshold):
+    # 文本中有标点符号，就不是title
+    if ENDS_IN_PUNCT_RE.search(text) is not None:
         return False
 
     # NOTE(robinson) - Prevent flagging salutations like "To My Dearest Friends," as titles
     if text.endswith((",", ".", "，", "。")):
         return False
 
+    # 文本中数字的占比不能太高，否则不是title
+    if under_non_alpha_ratio(text, threshold=non_alpha_threshold):
+        return False
+
     if text.isnumeric():
-        print(f"Not a title. Text is all numeric:\n\n{text}")  # type: ignore
         return False
 
     # 开头的字符内应该有数字，默认5个字符内
-    if len(text) < 5:
-        text_5 = text
-    else:
-        text_5 = text[:5]
-    alpha_in_text_5 = sum(list(map(lambda x: x.isnumeric(), list(text_5))))
-    if not alpha_in_text_5:
+    if not any(map(str.isnumeric, text[:5])):
         return False
 
     return True
 
 
-def zh_title_enhance(docs: Document) -> Document:
+def iter_zh_title_enhance(docs: Iterable[Document]) -> Iterator[Document]:
+    """
+    流式的中文标题加强：逐个处理切分后的 Document，标记标题，并在之后的文本前加上最近的标题。
+    只保存最近的标题，可以直接处理切分结果的生成器
+    """
     title = None
-    if len(docs) > 0:
-        for doc in docs:
-            if is_possible_title(doc.page_content):
-                doc.metadata['category'] = 'cn_Title'
-                title = doc.page_content
-            elif title:
-                doc.page_content = f"下文与({title})有关。{doc.page_content}"
-        return docs
-    else:
-        print("文件不存在")
+    for doc in docs:
+        if is_possible_title(doc.page_content):
+            doc.metadata['category'] = 'cn_Title'
+            title = doc.page_content
+        elif title:
+            doc.page_content = f"下文与({title})有关。{doc.page_content}"
+        yield doc
+
+
+def zh_title_enhance(docs: List[Document]) -> List[Document]:
+    return list(iter_zh_title_enhance(docs))
 
 
 def get_nearest_title(doc):
-    headers = TEXT_SPLITTER_DICT["MarkdownHeaderTextSplitter"]["headers_to_split_on"]
-    for header in reversed(headers):
-        title = doc.metadata.get(header[1], "")
+    for key in MD_HEADER_KEYS:
+        title = doc.metadata.get(key, "")
         if title != "":
             return title
     return ""
 
 
-def zh_title_enhance_md(docs: Document) -> Document:
-    if len(docs) > 0:
-        for doc in docs:
-            title = get_nearest_title(doc)
-            if title != "":
-                doc.page_content = f"{title}：{doc.page_content}"
-        return docs
-    else:
-        print("文件不存在")
+def iter_zh_title_enhance_md(docs: Iterable[Document]) -> Iterator[Document]:
+    """
+    流式的 Markdown 标题加强：在文本前加上 MarkdownHeaderTextSplitter 记录的最近一级标题
+    """
+    for doc in docs:
+        title = get_nearest_title(doc)
+        if title != "":
+            doc.page_content = f"{title}：{doc.page_content}"
+        yield doc
+
+
+def zh_title_enhance_md(docs: List[Document]) -> List[Document]:
+    return list(iter_zh_title_enhance_md(docs))
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # 测试 10 万个 chunk 的标题加强耗时：
+    # python -m modules.fastsearch.knowledge_base_manager.file.text_splitter.zh_title_enhance
+    random.seed(0)
+    texts = []
+    for i in range(100000):
+        if random.random() < 0.1:
+            texts.append(f"{i % 10}.{random.choice(['概述', '总则', '适用范围', 'Introduction'])}")
+        else:
+            texts.append("正文内容，" * random.randint(1, 50))
+    docs = [Document(page_content=text) for text in texts]
+    start = time.perf_counter()
+    titles = sum(1 for doc in iter_zh_title_enhance(docs) if doc.metadata.get("category") == "cn_Title")
+    print(f"{len(docs)} 个 chunk，{titles} 个标题，耗时 {time.perf_counter() - start:.2f}s")
@@ -1,20 +1,151 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Callable, Generator, Union, Tuple
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Callable, Generator, Iterable
+
+from application.settings import EXECUTOR_MAX_WORKERS
+
+# 按任务类型共享的线程池/进程池，避免每次调用都创建新的线程池
+_executors: Dict[str, Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_max_workers(name: str) -> int:
+    """
+    获取某类任务配置的最大并发数，未配置时与 ThreadPoolExecutor 的默认值一致
+    """
+    max_workers = EXECUTOR_MAX_WORKERS.get(name)
+    if max_workers is None:
+        max_workers = EXECUTOR_MAX_WORKERS.get("default")
+    return max_workers or min(32, (os.cpu_count() or 1) + 4)
+
+
+def get_executor(name: str = "default") -> ThreadPoolExecutor:
+    """
+    获取指定名称的共享线程池，最大线程数由 EXECUTOR_MAX_WORKERS 配置
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=get_max_workers(name), thread_name_prefix=name)
+            _executors[name] = executor
+        return executor
+
+
+# 进程池使用 spawn 方式创建子进程：服务进程中已有向量化线程、数据库连接池与 ES 客户端，
+# fork 会把其他线程持有的锁原样复制到子进程中，这些锁在子进程中永远不会被释放，子进程可能死锁
+_mp_context = multiprocessing.get_context("spawn")
+
+
+def get_process_executor(
+        name: str,
+        initializer: Callable = None,
+        initargs: tuple = (),
+) -> ProcessPoolExecutor:
+    """
+    获取指定名称的共享进程池，最大进程数由 EXECUTOR_MAX_WORKERS 配置，未配置时使用CPU核数。
+    子进程以 spawn 方式启动，模型加载等耗时的准备工作放在 initializer 中，每个子进程只执行一次
+    """
+    with _executors_lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS.get(name),
+                                           mp_context=_mp_context,
+                                           initializer=initializer,
+                                           initargs=initargs)
+            _executors[name] = executor
+        return executor
+
+
+def discard_executor(name: str):
+    """
+    丢弃已损坏的线程池/进程池（例如子进程异常退出），下次获取时会重新创建
+    """
+    with _executors_lock:
+        executor = _executors.pop(name, None)
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_executors(wait: bool = True):
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def run_in_executor(
+        executor: Executor,
+        func: Callable,
+        params: Iterable[Dict],
+        max_in_flight: int,
+        ordered: bool = False,
+) -> Generator:
+    """
+    在线程池/进程池中批量运行任务，并将运行结果以生成器的形式返回。
+    params 可以是生成器，任务按需提交，同时进行中的任务数不超过 max_in_flight；
+    调用方消费结果较慢时暂停提交新任务，避免一次性创建所有任务与结果。
+    ordered 为 True 时按提交顺序返回结果，否则按完成顺序返回。
+    """
+    params = iter(params)
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                kwargs = next(params, None)
+                if kwargs is None:
+                    break
+                pending.append(executor.submit(func, **kwargs))
+
+            if not pending:
+                break
+
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, not_done = wait(pending, return_when=FIRST_COMPLETED)
+                pending = deque(not_done)
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
 
 
 def run_in_thread_pool(
         func: Callable,
-        params: List[Dict] = [],
+        params: Iterable[Dict] = [],
+        executor: str = "default",
+        max_in_flight: int = None,
+        ordered: bool = False,
 ) -> Generator:
     """
-    在线程池中批量运行任务，并将运行结果以生成器的形式返回。
+    在共享线程池中批量运行任务，并将运行结果以生成器的形式返回。
     请确保任务中的所有操作是线程安全的，任务函数请全部使用关键字参数。
+    max_in_flight 默认为线程池最大线程数的2倍。
     """
-    tasks = []
-    with ThreadPoolExecutor() as pool:
-        for kwargs in params:
-            thread = pool.submit(func, **kwargs)
-            tasks.append(thread)
+    max_in_flight = max_in_flight or get_max_workers(executor) * 2
+    yield from run_in_executor(get_executor(executor), func, params, max_in_flight, ordered=ordered)
+
 
-        for obj in as_completed(tasks):
-            yield obj.result()
+def run_in_process_pool(
+        func: Callable,
+        params: Iterable[Dict] = [],
+        executor: str = "default_process",
+        max_in_flight: int = None,
+        ordered: bool = False,
+) -> Generator:
+    """
+    在共享进程池中批量运行任务，并将运行结果以生成器的形式返回，适用于CPU密集型任务。
+    任务函数必须定义在模块顶层，参数与返回值必须可以被pickle，任务函数请全部使用关键字参数。
+    """
+    max_in_flight = max_in_flight or (EXECUTOR_MAX_WORKERS.get(executor) or os.cpu_count() or 1) * 2
+    try:
+        yield from run_in_executor(get_process_executor(executor), func, params, max_in_flight, ordered=ordered)
+    except BrokenProcessPool:
+        discard_executor(executor)
+        raise
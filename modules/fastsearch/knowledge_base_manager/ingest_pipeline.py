@@ -0,0 +1,349 @@
+import queue
+import threading
+import uuid
+from typing import List, Dict, Callable, Generator
+
+from application.settings import CHUNK_SIZE, OVERLAP_SIZE, ZH_TITLE_ENHANCE, INGEST_QUEUE_SIZE, \
+    INGEST_EMBED_WORKERS, INGEST_INDEX_WORKERS, INGEST_STREAMING, INGEST_STREAM_BATCH_SIZE, FILE2TEXT_EXECUTOR, \
+    INGEST_RESUME
+from xiaoapi.core import logger
+from .db import repository as db
+from .file.knowledge_file import KnowledgeFile, files2docs
+from .file.utils import get_max_workers
+from .vectordb.base import VectorKB
+
+# 阶段结束标记，由上游阶段放入队列
+_DONE = object()
+
+
+def row_doc_id(kb_name: str, file_name: str, row: int) -> str:
+    """
+    按行向量化的文件中第 row 行的文档ID，同一行的ID固定不变，从中断处继续向量化时重复写入的行会覆盖原有文档而不会重复
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{kb_name.lower()}/{file_name.lower()}/{row}"))
+
+
+class _FileState:
+    """
+    一个文件在流水线中的状态。文件的切分结果分为一批或多批在流水线中传递，最后是一个 end 标记，
+    记录元数据阶段收到 end 标记且所有批次都已写入向量库后，才将文件记录到数据库
+    """
+
+    def __init__(self, kb_file: KnowledgeFile):
+        self.kb_file = kb_file
+        # 是否按行向量化并记录进度：每批文档按行的顺序逐批记录到数据库，而不是在文件处理完后一次性记录
+        self.checkpoint = False
+        # 加载切分阶段发出的批次数，在发出 end 标记前写入
+        self.batches = 0
+        # 文档总数（包括从中断处继续时跳过的行），也是下一批第一个文档的行号
+        self.docs_count = 0
+        # 以下属性只在记录元数据阶段（单线程）中修改
+        self.recorded = 0
+        self.doc_infos = []
+        self.ended = False
+        # 按行向量化时已记录的行数，以及已写入向量库、等待前面的批次记录完成的批次：{起始行号: doc_infos}
+        self.committed = 0
+        self.pending: Dict[int, List[Dict]] = {}
+        # 任一批次处理出错后，该文件的后续批次不再处理
+        self.failed = False
+
+
+class _Stage:
+    """
+    流水线中的一个阶段：多个线程从 in_queue 取出一批文档，处理后放入 out_queue（最后一个阶段为 None）。
+    forward 为 False 时由 func 自行向 out_queue 放入结果（例如一个文件产生多批文档）。
+    处理出错的文件只报告一次错误，该文件的后续批次不再处理。
+    """
+
+    def __init__(self, name: str, func: Callable, workers: int, in_queue: queue.Queue, out_queue: queue.Queue,
+                 pipeline: "IngestPipeline", forward: bool = True):
+        self.name = name
+        self.func = func
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.pipeline = pipeline
+        self.forward = forward
+        self.finished = threading.Event()
+        self._running = workers
+        self._lock = threading.Lock()
+        self.threads = [threading.Thread(target=self._run, name=f"ingest-{name}-{i}", daemon=True)
+                        for i in range(workers)]
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def _run(self):
+        while True:
+            item = self.pipeline.get(self.in_queue)
+            if item is None:
+                return
+            if item is _DONE:
+                # 放回队列，让同一阶段的其他线程也能结束
+                self.pipeline.put(self.in_queue, _DONE)
+                break
+
+            state = item["state"]
+            if state.failed:
+                continue
+            try:
+                self.func(item)
+            except Exception as e:
+                msg = f"{self.name} 阶段处理文件 {state.kb_file.filename} 时出错：{e}"
+                logger.error(f'{e.__class__.__name__}: {msg}')
+                self.pipeline.fail(state, msg)
+                continue
+            if self.forward and self.out_queue is not None:
+                self.pipeline.put(self.out_queue, item)
+
+        with self._lock:
+            self._running -= 1
+            last = self._running == 0
+        if last:
+            if self.out_queue is not None:
+                self.pipeline.put(self.out_queue, _DONE)
+            self.finished.set()
+
+
+class IngestPipeline:
+    """
+    分阶段的向量化流水线：加载切分 → 向量化 → 写入向量库 → 记录元数据。
+    相邻阶段之间使用有界队列连接，各阶段并发执行，总耗时接近最慢的阶段，而不是各阶段耗时之和；
+    下游处理较慢时上游会阻塞，内存中最多缓存 INGEST_QUEUE_SIZE 批切分结果。
+    流式模式下每个文件逐个文档加载、切分，切分结果每 batch_size 个一批进入后续阶段，大文件不需要整个加载到内存中；
+    csv、jsonl 等按行切分的文件（resume 为 True 时）每批写入后记录进度，中断后重新执行时从中断处继续。
+    否则加载切分在 files2docs 的线程池/进程池中执行，每个文件的切分结果作为一批。
+    记录元数据只使用一个线程，避免并发写 SQLite。
+    """
+
+    def __init__(
+            self,
+            kb_name: str,
+            vector_kb: VectorKB,
+            queue_size: int = INGEST_QUEUE_SIZE,
+            embed_workers: int = INGEST_EMBED_WORKERS,
+            index_workers: int = INGEST_INDEX_WORKERS,
+            streaming: bool = INGEST_STREAMING and FILE2TEXT_EXECUTOR != "process",
+            batch_size: int = INGEST_STREAM_BATCH_SIZE,
+            resume: bool = INGEST_RESUME,
+    ):
+        self.kb_name = kb_name
+        self.vector_kb = vector_kb
+        self.queue_size = queue_size
+        self.embed_workers = embed_workers
+        self.index_workers = index_workers
+        self.streaming = streaming
+        self.batch_size = batch_size
+        self.resume = resume
+        self.results = queue.Queue()
+        self._stop_event = threading.Event()
+        self._fail_lock = threading.Lock()
+
+    def put(self, q: queue.Queue, item) -> bool:
+        while not self._stop_event.is_set():
+            try:
+                q.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def get(self, q: queue.Queue):
+        while not self._stop_event.is_set():
+            try:
+                return q.get(timeout=0.5)
+            except queue.Empty:
+                pass
+        return None
+
+    def fail(self, state: _FileState, msg: str):
+        """标记文件处理失败，每个文件只报告一次"""
+        with self._fail_lock:
+            if state.failed:
+                return
+            state.failed = True
+        self.put(self.results, (False, state.kb_file.filename, msg))
+
+    def _emit_file(self, state: _FileState, batches, out_queue: queue.Queue, delete: bool = True) -> bool:
+        """
+        删除文件在向量库中原有的文档，然后逐批放入队列，最后放入 end 标记。
+        删除在放入第一批之前完成，后续阶段可以并发、乱序地处理同一文件的各个批次。
+        每个文档的 metadata["source"] 设为文件名
+        """
+        if delete:
+            self.vector_kb.delete_docs(state.kb_file)
+        for docs in batches:
+            if state.failed:
+                return True
+            # 同 KBService.handle_doc_source：向量库按 source 删除、列出文件的文档，统一为知识库中的文件名
+            for doc in docs:
+                doc.metadata["source"] = state.kb_file.filename
+            item = {"state": state, "docs": docs, "offset": state.docs_count}
+            state.batches += 1
+            state.docs_count += len(docs)
+            if not self.put(out_queue, item):
+                return False
+        return self.put(out_queue, {"state": state, "docs": [], "end": True})
+
+    def _start_checkpoint(self, state: _FileState) -> int:
+        """
+        按行向量化的文件：上次向量化中断且文件未修改时返回已完成的行数，从该行继续；
+        否则删除文件原有的文档，从头开始记录进度，返回0
+        """
+        kb_file = state.kb_file
+        state.checkpoint = True
+        skip = db.get_ingest_checkpoint(kb_file)
+        if skip is None:
+            skip = 0
+            self.vector_kb.delete_docs(kb_file)
+            db.start_ingest_checkpoint(kb_file)
+        else:
+            logger.info(f"文件 {kb_file.filename} 上次向量化已完成 {skip} 行，从第 {skip + 1} 行继续")
+        state.docs_count = state.committed = skip
+        return skip
+
+    def _parse_stream(self, item: Dict, out_queue: queue.Queue, **kwargs):
+        state = item["state"]
+        skip = 0
+        if self.resume and state.kb_file.row_based:
+            skip = self._start_checkpoint(state)
+        batches = state.kb_file.iter_chunk_batches(batch_size=self.batch_size, skip=skip, **kwargs)
+        try:
+            self._emit_file(state, batches, out_queue, delete=not state.checkpoint)
+        finally:
+            batches.close()
+
+    def _parse(self, files: List[KnowledgeFile], parse_queue: queue.Queue, **kwargs):
+        parsed = set()
+        results = files2docs(files, **kwargs)
+        try:
+            for status, result in results:
+                kb_name, file_name, data = result
+                parsed.add(file_name)
+                if status:
+                    kb_file = KnowledgeFile(filename=file_name, knowledge_base_name=kb_name)
+                    state = _FileState(kb_file)
+                    try:
+                        if not self._emit_file(state, [data], parse_queue):
+                            return
+                    except Exception as e:
+                        msg = f"删除文件 {file_name} 原有的向量时出错：{e}"
+                        logger.error(f'{e.__class__.__name__}: {msg}')
+                        self.fail(state, msg)
+                else:
+                    self.put(self.results, (False, file_name, data))
+        except Exception as e:
+            msg = f"加载文档时出错：{e}"
+            logger.error(f'{e.__class__.__name__}: {msg}')
+            for file in files:
+                if file.filename not in parsed:
+                    self.put(self.results, (False, file.filename, msg))
+        finally:
+            results.close()
+            self.put(parse_queue, _DONE)
+
+    def _embed(self, item: Dict):
+        if item.get("end"):
+            return
+        item["embeddings"] = self.vector_kb.embed_docs(item["docs"])
+
+    def _index(self, item: Dict):
+        if item.get("end"):
+            return
+        state = item["state"]
+        ids = None
+        if state.checkpoint:
+            kb_file = state.kb_file
+            ids = [row_doc_id(kb_file.kb_name, kb_file.filename, item["offset"] + i) for i in range(len(item["docs"]))]
+        item["doc_infos"] = self.vector_kb.add_embeddings(item["docs"], item["embeddings"], ids=ids)
+        # 写入后不再需要文档与向量，尽早释放
+        item.pop("embeddings")
+        item.pop("docs")
+
+    def _record(self, item: Dict):
+        state = item["state"]
+        if item.get("end"):
+            state.ended = True
+        elif state.checkpoint:
+            # 按行的顺序逐批记录，记录的进度之前的行都已写入向量库与数据库
+            state.pending[item["offset"]] = item["doc_infos"]
+            while state.committed in state.pending:
+                doc_infos = state.pending.pop(state.committed)
+                db.add_checkpoint_docs_to_db(state.kb_file, doc_infos)
+                state.committed += len(doc_infos)
+                state.recorded += 1
+        else:
+            state.recorded += 1
+            state.doc_infos.extend(item["doc_infos"])
+        if not state.ended or state.recorded < state.batches:
+            return
+
+        # 文件信息与所有Document信息在一个事务中写入，已存在的文件会替换原有的Document信息；
+        # 按行向量化的文件的Document信息已逐批写入，只写入文件信息并删除进度
+        db.add_file_to_db(state.kb_file, custom_docs=False, docs_count=state.docs_count, doc_infos=state.doc_infos,
+                          replace_docs=not state.checkpoint)
+        state.doc_infos = []
+        self.put(self.results, (True, state.kb_file.filename, ""))
+
+    def run(
+            self,
+            files: List[KnowledgeFile],
+            chunk_size: int = CHUNK_SIZE,
+            chunk_overlap: int = OVERLAP_SIZE,
+            zh_title_enhance: bool = ZH_TITLE_ENHANCE,
+    ) -> Generator:
+        """
+        执行流水线，每处理完一个文件返回一次结果，返回顺序为完成顺序。每个 IngestPipeline 对象只能执行一次。
+        生成器返回值为 status, file_name, msg；提前关闭生成器会停止流水线。
+        """
+        parse_queue = queue.Queue(self.queue_size)
+        embed_queue = queue.Queue(self.queue_size)
+        index_queue = queue.Queue(self.queue_size)
+        split_kwargs = {"chunk_size": chunk_size,
+                        "chunk_overlap": chunk_overlap,
+                        "zh_title_enhance": zh_title_enhance}
+
+        stages = [
+            _Stage("向量化", self._embed, self.embed_workers, parse_queue, embed_queue, self),
+            _Stage("写入向量库", self._index, self.index_workers, embed_queue, index_queue, self),
+            _Stage("记录元数据", self._record, 1, index_queue, None, self),
+        ]
+        if self.streaming:
+            # 文件队列一次性放入所有文件，加载切分线程逐个文件流式处理
+            file_queue = queue.Queue()
+            for file in files:
+                file_queue.put({"state": _FileState(file)})
+            file_queue.put(_DONE)
+            parse_workers = max(1, min(get_max_workers("parse"), len(files)))
+            parser = _Stage("加载切分",
+                            lambda item: self._parse_stream(item, parse_queue, **split_kwargs),
+                            parse_workers, file_queue, parse_queue, self, forward=False)
+            threads = parser.threads
+        else:
+            threads = [threading.Thread(target=self._parse,
+                                        args=(files, parse_queue),
+                                        kwargs=split_kwargs,
+                                        name="ingest-parse",
+                                        daemon=True)]
+
+        for thread in threads:
+            thread.start()
+        for stage in stages:
+            stage.start()
+
+        try:
+            while True:
+                try:
+                    result = self.results.get(timeout=0.5)
+                except queue.Empty:
+                    # 最后一个阶段结束时所有结果都已放入结果队列
+                    if stages[-1].finished.is_set() and self.results.empty():
+                        break
+                    continue
+                yield result
+        finally:
+            # 加载线程会在当前文件（流式模式下为当前批次）加载完成后退出，不等待
+            self._stop_event.set()
+            for stage in stages:
+                for thread in stage.threads:
+                    thread.join()
@@ -0,0 +1,190 @@
+import os
+import socket
+import threading
+from typing import List, Dict
+
+from starlette.concurrency import run_in_threadpool
+
+from application.settings import CHUNK_SIZE, OVERLAP_SIZE, ZH_TITLE_ENHANCE, INGEST_WORKERS, \
+    INGEST_JOB_MAX_ATTEMPTS, INGEST_JOB_LEASE_SECONDS, INGEST_JOB_HEARTBEAT_SECONDS, INGEST_POLL_INTERVAL
+from xiaoapi.core import CustomException, logger
+from .db import repository as db
+from .db.models.ingest_job_model import IngestJobStatus
+from .kb_service import KBService
+
+
+class _LeaseHeartbeat:
+    """
+    任务执行期间定时续约的后台线程：单个文件（如大型扫描版 PDF）的处理时间超过租约时长时，任务也不会被其他 worker 重新领取。
+    续约失败（任务已结束或租约已被接管）后 lost 为 True，worker 处理完当前文件后停止执行该任务
+    """
+
+    def __init__(self, job_id: str, worker_id: str, lease_seconds: float, interval: float):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.interval = interval
+        self.lost = False
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"ingest-heartbeat-{job_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop_event.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                if not db.renew_job_lease(self.job_id, self.worker_id, self.lease_seconds):
+                    self.lost = True
+                    return
+            except Exception as e:
+                # 续约出错（如数据库暂时不可用）时下次重试，租约到期前续约成功即可
+                logger.warning(f'{e.__class__.__name__}: 向量化任务 {self.job_id} 续约时出错：{e}')
+
+
+class IngestWorkerPool:
+    """
+    后台向量化 worker 池。
+    worker 从数据库中的任务队列领取任务并执行，多个工作进程可以同时运行各自的 worker 池。
+    任务至少执行一次：执行出错、worker 停止或异常退出（租约过期）后，任务会被重新领取，直到达到最大执行次数。
+    """
+
+    def __init__(
+            self,
+            workers: int = INGEST_WORKERS,
+            poll_interval: float = INGEST_POLL_INTERVAL,
+            lease_seconds: float = INGEST_JOB_LEASE_SECONDS,
+            heartbeat_seconds: float = INGEST_JOB_HEARTBEAT_SECONDS,
+    ):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        # 续约间隔不超过租约时长的 1/3，一两次续约失败不会导致租约过期
+        self.heartbeat_seconds = min(heartbeat_seconds, lease_seconds / 3)
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        self._wakeup_event = threading.Event()
+
+    def start(self):
+        if self._threads:
+            return
+
+        self._stop_event.clear()
+        prefix = f"{socket.gethostname()}-{os.getpid()}"
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker_loop,
+                                      args=(f"{prefix}-{i}",),
+                                      name=f"ingest-worker-{i}",
+                                      daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"已启动 {self.workers} 个向量化 worker")
+
+    def stop(self, timeout: float = None):
+        self._stop_event.set()
+        self._wakeup_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self):
+        """有新任务入队时唤醒空闲的 worker"""
+        self._wakeup_event.set()
+
+    def _worker_loop(self, worker_id: str):
+        while not self._stop_event.is_set():
+            try:
+                job = db.claim_job_from_db(worker_id, self.lease_seconds)
+            except Exception as e:
+                logger.error(f'{e.__class__.__name__}: 领取向量化任务时出错：{e}')
+                job = None
+
+            if job is None:
+                self._wakeup_event.wait(self.poll_interval)
+                self._wakeup_event.clear()
+                continue
+
+            job_id = job["job_id"]
+            try:
+                with _LeaseHeartbeat(job_id, worker_id, self.lease_seconds, self.heartbeat_seconds) as heartbeat:
+                    self.run_job(job, worker_id, heartbeat)
+            except Exception as e:
+                # 任何错误都不能结束 worker 线程，任务重新入队或标记为失败
+                msg = f"执行向量化任务 {job_id} 时出错：{e}"
+                logger.error(f'{e.__class__.__name__}: {msg}')
+                try:
+                    db.retry_job_in_db(job_id, worker_id, msg)
+                except Exception as e:
+                    logger.error(f'{e.__class__.__name__}: 向量化任务 {job_id} 重新入队时出错，租约过期后会被重新领取：{e}')
+
+    def run_job(self, job: Dict, worker_id: str, heartbeat: _LeaseHeartbeat = None):
+        """执行任务，出错时抛出异常，由调用方将任务重新入队"""
+        job_id = job["job_id"]
+        logger.info(f"worker {worker_id} 开始执行向量化任务 {job_id}，第 {job['attempts']} 次执行")
+
+        try:
+            kb_service = KBService.get_kb_service(job["kb_name"])
+        except CustomException as e:
+            db.finish_job_in_db(job_id, worker_id, IngestJobStatus.FAILED, error=e.msg)
+            return
+
+        finished = 0
+        failed_files = {}
+        interrupted = False
+        results = kb_service.iter_update_files(job["file_names"], **job["params"])
+        try:
+            for status, file_name, msg in results:
+                finished += 1
+                if not status:
+                    failed_files[file_name] = msg
+                if (not db.update_job_progress(job_id, worker_id, finished, failed_files, self.lease_seconds)
+                        or self._stop_event.is_set()
+                        or (heartbeat is not None and heartbeat.lost)):
+                    interrupted = True
+                    break
+        finally:
+            results.close()
+
+        if not interrupted:
+            db.finish_job_in_db(job_id, worker_id, IngestJobStatus.SUCCEEDED, failed_files=failed_files)
+        elif self._stop_event.is_set():
+            db.retry_job_in_db(job_id, worker_id, "worker 已停止，任务重新入队")
+        else:
+            # 任务被取消，或租约已被其他 worker 接管（此时 worker_id 不匹配，不会改动任务状态）
+            db.finish_job_in_db(job_id, worker_id, IngestJobStatus.CANCELLED, failed_files=failed_files)
+        logger.info(f"worker {worker_id} 结束向量化任务 {job_id}")
+
+
+ingest_worker_pool = IngestWorkerPool()
+
+
+def submit_ingest_job(
+        kb_name: str,
+        file_names: List[str],
+        chunk_size: int = CHUNK_SIZE,
+        chunk_overlap: int = OVERLAP_SIZE,
+        zh_title_enhance: bool = ZH_TITLE_ENHANCE,
+) -> str:
+    """
+    提交向量化任务，返回任务ID
+    """
+    params = {
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "zh_title_enhance": zh_title_enhance,
+    }
+    job_id = db.add_job_to_db(kb_name, file_names, params, max_attempts=INGEST_JOB_MAX_ATTEMPTS)
+    ingest_worker_pool.notify()
+    return job_id
+
+
+async def asubmit_ingest_job(kb_name: str, file_names: List[str], **kwargs) -> str:
+    """
+    异步版本的 submit_ingest_job，供 async 接口调用：写入任务在线程池中执行，等待数据库写锁时不阻塞事件循环
+    """
+    return await run_in_threadpool(submit_ingest_job, kb_name, file_names, **kwargs)
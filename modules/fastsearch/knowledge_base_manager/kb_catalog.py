@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from application.settings import KB_CATALOG_TTL
+from .db import repository as db
+
+
+class KBCatalog:
+    """
+    知识库目录：一次查询读取所有知识库的名称、向量库类型与版本号，缓存 ttl 秒。
+    ttl 内判断知识库是否存在只查内存，不存在的名称同样被缓存（负缓存），不会因为请求错误的知识库名称反复访问数据库与向量库。
+    本进程创建、删除、清空知识库后调用 invalidate，下次使用时立即重新读取；其他工作进程的修改最多经过 ttl 秒后可见。
+    invalidate 递增代数，查询期间代数发生变化时结果可能早于提交，只更新内容，不标记为新鲜，下次使用时重新读取。
+    """
+
+    def __init__(self, ttl: float = KB_CATALOG_TTL):
+        self.ttl = ttl
+        # 小写的知识库名称 -> {"kb_name", "vs_type", "id", "version"}
+        self._kbs: Dict[str, Dict] = {}
+        self._loaded_at: float = None
+        self._generation = 0
+        # _lock 在查询期间持有，避免并发重复查询；_state_lock 只保护代数与快照的更新，invalidate 不会等待查询
+        self._lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._async_lock: asyncio.Lock = None
+
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    def _begin(self) -> Tuple[float, int]:
+        with self._state_lock:
+            return time.monotonic(), self._generation
+
+    def _set(self, kbs: Iterable[Dict], loaded_at: float, generation: int):
+        kbs = {kb["kb_name"].lower(): kb for kb in kbs}
+        with self._state_lock:
+            self._kbs = kbs
+            self._loaded_at = loaded_at if generation == self._generation else None
+
+    def refresh(self):
+        with self._lock:
+            if self._is_fresh():
+                return
+            loaded_at, generation = self._begin()
+            self._set(db.list_kb_versions_from_db(), loaded_at, generation)
+
+    async def arefresh(self):
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            if self._is_fresh():
+                return
+            loaded_at, generation = self._begin()
+            self._set(await db.alist_kb_versions_from_db(), loaded_at, generation)
+
+    def invalidate(self):
+        with self._state_lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def get(self, kb_name: str) -> Optional[Dict]:
+        """返回知识库信息，不存在时返回 None"""
+        if not self._is_fresh():
+            self.refresh()
+        return self._kbs.get(kb_name.lower())
+
+    async def aget(self, kb_name: str) -> Optional[Dict]:
+        if not self._is_fresh():
+            await self.arefresh()
+        return self._kbs.get(kb_name.lower())
+
+    def exists(self, kb_name: str) -> bool:
+        return self.get(kb_name) is not None
+
+    async def aexists(self, kb_name: str) -> bool:
+        return await self.aget(kb_name) is not None
+
+    def exist_many(self, kb_names: Iterable[str]) -> Dict[str, bool]:
+        """批量判断知识库是否存在，最多执行一次数据库查询"""
+        if not self._is_fresh():
+            self.refresh()
+        kbs = self._kbs
+        return {kb_name: kb_name.lower() in kbs for kb_name in kb_names}
+
+    def get_token(self, kb_name: str) -> Optional[Tuple[int, int]]:
+        """返回知识库的 (id, version)，用于判断缓存的知识库服务是否仍然有效"""
+        kb = self.get(kb_name)
+        return (kb["id"], kb["version"]) if kb else None
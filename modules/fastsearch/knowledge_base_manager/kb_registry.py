@@ -0,0 +1,92 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from application.settings import KB_SERVICE_CACHE_SIZE, KB_SERVICE_CACHE_TTL
+from .db import repository as db
+
+
+class _Entry:
+    __slots__ = ("service", "token", "checked_at")
+
+    def __init__(self, service: Any, token: Tuple[int, int], checked_at: float):
+        self.service = service
+        self.token = token
+        self.checked_at = checked_at
+
+
+class KBServiceRegistry:
+    """
+    知识库服务缓存：最多缓存 max_size 个知识库服务，超出时淘汰最久未使用的。
+    缓存项记录创建时知识库的 (id, version)，超过 ttl 秒后使用时通过 token_getter 重新获取一次（默认查询数据库）：
+    知识库被删除、重新创建、清空或修改向量库类型（其他工作进程中执行也一样）后，缓存项失效并重新创建服务。
+    ttl 内直接使用缓存，不访问数据库与向量库。
+    """
+
+    def __init__(self, factory: Callable[[str], Any], max_size: int = KB_SERVICE_CACHE_SIZE,
+                 ttl: float = KB_SERVICE_CACHE_TTL,
+                 token_getter: Callable[[str], Optional[Tuple[int, int]]] = db.get_kb_version):
+        self.factory = factory
+        self.token_getter = token_getter
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, kb_name: str) -> bool:
+        return self.peek(kb_name) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, kb_name: str) -> Optional[Any]:
+        """
+        返回 ttl 内验证过的缓存服务，不访问数据库；没有缓存或需要重新验证时返回 None
+        """
+        key = kb_name.lower()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry.checked_at >= self.ttl:
+                return None
+            self._entries.move_to_end(key)
+            return entry.service
+
+    def get(self, kb_name: str) -> Any:
+        """
+        获取知识库服务，知识库不存在时由 factory 抛出异常
+        """
+        service = self.peek(kb_name)
+        if service is not None:
+            return service
+
+        key = kb_name.lower()
+        token = self.token_getter(kb_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and token is not None and entry.token == token:
+                entry.checked_at = time.monotonic()
+                self._entries.move_to_end(key)
+                return entry.service
+            self._entries.pop(key, None)
+
+        # 创建服务需要访问数据库、向量库与文件目录，不持有锁
+        service = self.factory(kb_name)
+        self.put(kb_name, service, token)
+        return service
+
+    def put(self, kb_name: str, service: Any, token: Tuple[int, int] = None):
+        token = token or self.token_getter(kb_name)
+        with self._lock:
+            self._entries[kb_name.lower()] = _Entry(service, token, time.monotonic())
+            self._entries.move_to_end(kb_name.lower())
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, kb_name: str):
+        with self._lock:
+            self._entries.pop(kb_name.lower(), None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
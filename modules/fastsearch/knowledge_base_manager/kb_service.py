@@ -1,13 +1,17 @@
 import os
-from typing import Any, Dict, List, ClassVar
+from typing import Any, Dict, List, ClassVar, Generator
 
 from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
 from langchain_core.documents import Document
 from pydantic.v1 import root_validator, BaseModel, Field
 
 from application.settings import CHUNK_SIZE, OVERLAP_SIZE, ZH_TITLE_ENHANCE, VECTOR_SEARCH_TOP_K, SCORE_THRESHOLD
 from xiaoapi.core import CustomException, logger
-from .file.knowledge_file import KnowledgeFile, files2docs_in_thread
+from .file.knowledge_file import KnowledgeFile
+from .ingest_pipeline import IngestPipeline
+from .kb_catalog import KBCatalog
+from .kb_registry import KBServiceRegistry
 from .vectordb.base import VectorDBFactory, VectorDB, VectorKB
 
 from .db import repository as db
@@ -16,7 +20,13 @@ from modules.fastsearch.utils import DocumentWithVSId
 
 
 class KBService(BaseModel):
-    services: ClassVar[dict] = {}
+    # 所有知识库的名称、类型与版本号，用于判断知识库是否存在
+    catalog: ClassVar[KBCatalog] = KBCatalog()
+    # 各知识库的服务缓存，有数量上限，并根据知识库目录中的版本号失效
+    services: ClassVar[KBServiceRegistry] = KBServiceRegistry(
+        lambda kb_name: KBService(kb_name=kb_name),
+        token_getter=lambda kb_name: KBService.catalog.get_token(kb_name),
+    )
 
     kb_name: str = Field()
     vs_type: str = Field(default=None)
@@ -28,10 +38,11 @@ class KBService(BaseModel):
 
     @root_validator()
     def validate_environment(cls, values: Dict) -> Dict:
-        kb_name, vs_type = db.load_kb_from_db(values["kb_name"])
-        if kb_name is None:
+        kb = cls.catalog.get(values["kb_name"])
+        if kb is None:
             raise CustomException(f"数据库中不存在知识库：{values['kb_name']}.")
 
+        vs_type = kb["vs_type"]
         values["vs_type"] = vs_type
 
         vector_db = VectorDBFactory.get_vector_db(vs_type)
@@ -52,16 +63,20 @@ class KBService(BaseModel):
     @staticmethod
     def exist_kb(kb_name: str):
         """
-        知识库是否存在
+        知识库是否存在，只查询缓存的知识库目录，不创建知识库服务
         """
-        if kb_name in KBService.services:
-            return True
+        return KBService.catalog.exists(kb_name)
 
-        try:
-            KBService.get_kb_service(kb_name)
-            return True
-        except CustomException as e:
-            return False
+    @staticmethod
+    async def aexist_kb(kb_name: str):
+        return await KBService.catalog.aexists(kb_name)
+
+    @staticmethod
+    def exist_kbs(kb_names: List[str]) -> Dict[str, bool]:
+        """
+        批量判断知识库是否存在，返回形式：{kb_name: bool}
+        """
+        return KBService.catalog.exist_many(kb_names)
 
     @staticmethod
     def create_kb(kb_name: str, vector_store_type: str):
@@ -77,6 +92,7 @@ class KBService(BaseModel):
 
         kb_info = f"关于{kb_name}的知识库"
         db.add_kb_to_db(kb_name, kb_info, vector_store_type)
+        KBService.catalog.invalidate()
 
     @staticmethod
     def delete_kb(kb_name: str):
@@ -89,25 +105,50 @@ class KBService(BaseModel):
         db.delete_files_from_db(kb_name)
         db.delete_kb_from_db(kb_name)
         file_manager.delete_kb(kb_name)
-        KBService.services.pop(kb_name, None)
+        KBService.catalog.invalidate()
+        KBService.services.invalidate(kb_name)
 
     @staticmethod
     def get_kb_service(kb_name: str):
-        if kb_name in KBService.services:
-            return KBService.services[kb_name]
-
-        kb_service = KBService(kb_name=kb_name)  # 知识库不存在这里会抛异常
-        KBService.services[kb_name] = kb_service
-        return kb_service
+        if not KBService.catalog.exists(kb_name):
+            raise CustomException(f"数据库中不存在知识库：{kb_name}.")
+        return KBService.services.get(kb_name)  # 向量库或文件目录中不存在知识库时这里会抛异常
 
     @staticmethod
     def get_all_kb_names():
         return db.list_kbs_from_db()
 
+    @staticmethod
+    async def aget_kb_service(kb_name: str):
+        """
+        异步获取知识库服务：先通过知识库目录判断知识库是否存在（需要刷新时使用异步查询），首次创建服务（需要访问向量库与文件目录）在线程池中执行
+        """
+        kb_service = KBService.services.peek(kb_name)
+        if kb_service is not None:
+            return kb_service
+
+        if not await KBService.catalog.aexists(kb_name):
+            raise CustomException(f"数据库中不存在知识库：{kb_name}.")
+        return await run_in_threadpool(KBService.get_kb_service, kb_name)
+
+    @staticmethod
+    async def aget_all_kb_names():
+        return await db.alist_kbs_from_db()
+
     @staticmethod
     def get_all_kb_details():
         kbs_in_folder = file_manager.list_kbs_from_folder()
-        kbs_in_db = db.list_kbs_from_db()
+        kbs_in_db = db.list_kb_details_from_db()
+        return KBService._merge_kb_details(kbs_in_folder, kbs_in_db)
+
+    @staticmethod
+    async def aget_all_kb_details():
+        kbs_in_folder = await run_in_threadpool(file_manager.list_kbs_from_folder)
+        kbs_in_db = await db.alist_kb_details_from_db()
+        return KBService._merge_kb_details(kbs_in_folder, kbs_in_db)
+
+    @staticmethod
+    def _merge_kb_details(kbs_in_folder: List[str], kbs_in_db: List[Dict]) -> List[Dict]:
         result = {}
 
         for kb in kbs_in_folder:
@@ -121,15 +162,14 @@ class KBService(BaseModel):
                 "in_db": False,
             }
 
-        for kb in kbs_in_db:
-            kb_detail = db.get_kb_detail(kb)
-            if kb_detail:
-                kb_detail["in_db"] = True
-                if kb in result:
-                    result[kb].update(kb_detail)
-                else:
-                    kb_detail["in_folder"] = False
-                    result[kb] = kb_detail
+        for kb_detail in kbs_in_db:
+            kb = kb_detail["kb_name"]
+            kb_detail["in_db"] = True
+            if kb in result:
+                result[kb].update(kb_detail)
+            else:
+                kb_detail["in_folder"] = False
+                result[kb] = kb_detail
 
         data = []
         for i, v in enumerate(result.values()):
@@ -145,37 +185,54 @@ class KBService(BaseModel):
     def clear_kb(self):
         self.vector_db.clear_kb(self.kb_name)
         db.delete_files_from_db(self.kb_name)
+        # 索引已重建，通知所有工作进程重新创建该知识库的服务
+        db.bump_kb_version(self.kb_name)
+        KBService.catalog.invalidate()
+        KBService.services.invalidate(self.kb_name)
 
     def search_docs(self,
                     query: str,
                     top_k: int = VECTOR_SEARCH_TOP_K,
                     score_threshold: float = SCORE_THRESHOLD,
+                    metadata: Dict = None,
                     ) -> List[Document]:
-        docs = self.vector_kb.search(query, top_k, score_threshold)
+        """
+        检索知识库，metadata 不为空时只在 metadata 匹配的文档中检索，过滤在向量库中执行
+        """
+        docs = self.vector_kb.search(query, top_k, score_threshold, metadata=metadata)
         return docs
 
+    async def asearch_docs(self,
+                           query: str,
+                           top_k: int = VECTOR_SEARCH_TOP_K,
+                           score_threshold: float = SCORE_THRESHOLD,
+                           metadata: Dict = None,
+                           ) -> List[Document]:
+        return await run_in_threadpool(self.search_docs, query, top_k, score_threshold, metadata)
+
     def list_file_docs(self, file_name: str = None, metadata: Dict = {}) -> List[DocumentWithVSId]:
         """
-        通过file_name或metadata检索Document
+        通过file_name或metadata检索Document，过滤条件在向量库中执行，file_name 支持 sql 通配符 %
         """
-        doc_infos = db.list_docs_from_db(kb_name=self.kb_name, file_name=file_name, metadata=metadata)
-        docs = []
-        for x in doc_infos:
-            doc_list = self.vector_kb.get_docs_by_ids([x["id"]])
-            if len(doc_list) > 0:
-                # 处理非空的情况
-                doc_info = doc_list[0]
-                doc_with_id = DocumentWithVSId(**doc_info.dict(), id=x["id"])
-                docs.append(doc_with_id)
-            else:
-                # 处理空的情况
-                # 可以选择跳过当前循环迭代或执行其他操作
-                pass
-        return docs
+        metadata = dict(metadata or {})
+        if file_name:
+            metadata["source"] = file_name
+        return [DocumentWithVSId(**doc.dict(), id=doc_id) for doc_id, doc in self.vector_kb.list_docs(metadata)]
+
+    async def alist_file_docs(self, file_name: str = None, metadata: Dict = {}) -> List[DocumentWithVSId]:
+        return await run_in_threadpool(self.list_file_docs, file_name, metadata)
 
     def list_kb_file_details(self) -> List[Dict]:
         files_in_folder = file_manager.list_files_from_folder(self.kb_name)
-        files_in_db = db.list_files_from_db(self.kb_name)
+        files_in_db = db.list_file_details_from_db(self.kb_name)
+        return self._merge_file_details(files_in_folder, files_in_db)
+
+    async def alist_kb_file_details(self) -> List[Dict]:
+        files_in_folder = await run_in_threadpool(file_manager.list_files_from_folder, self.kb_name)
+        files_in_db = await db.alist_file_details_from_db(self.kb_name)
+        return self._merge_file_details(files_in_folder, files_in_db)
+
+    def _merge_file_details(self, files_in_folder: List[str], files_in_db: List[Dict]) -> List[Dict]:
         result = {}
 
         for doc in files_in_folder:
@@ -192,15 +249,14 @@ class KBService(BaseModel):
                 "in_db": False,
             }
         lower_names = {x.lower(): x for x in result}
-        for doc in files_in_db:
-            doc_detail = db.get_file_detail(self.kb_name, doc)
-            if doc_detail:
-                doc_detail["in_db"] = True
-                if doc.lower() in lower_names:
-                    result[lower_names[doc.lower()]].update(doc_detail)
-                else:
-                    doc_detail["in_folder"] = False
-                    result[doc] = doc_detail
+        for doc_detail in files_in_db:
+            doc = doc_detail["file_name"]
+            doc_detail["in_db"] = True
+            if doc.lower() in lower_names:
+                result[lower_names[doc.lower()]].update(doc_detail)
+            else:
+                doc_detail["in_folder"] = False
+                result[doc] = doc_detail
 
         data = []
         for i, v in enumerate(result.values()):
@@ -208,6 +264,44 @@ class KBService(BaseModel):
             data.append(v)
         return data
 
+    def page_kb_file_details(
+            self,
+            page: int = 1,
+            page_size: int = 50,
+            sort_by: str = "No",
+            desc: bool = False,
+            keyword: str = None,
+    ) -> Dict:
+        """
+        分页获取知识库文件信息，可按文件名关键字过滤并按任意字段排序，空值排在最后。
+        返回形式：{"total": int, "data": [...]}，data 中每项与 list_kb_file_details 相同
+        """
+        return self._page_details(self.list_kb_file_details(), page, page_size, sort_by, desc, keyword)
+
+    async def apage_kb_file_details(
+            self,
+            page: int = 1,
+            page_size: int = 50,
+            sort_by: str = "No",
+            desc: bool = False,
+            keyword: str = None,
+    ) -> Dict:
+        return self._page_details(await self.alist_kb_file_details(), page, page_size, sort_by, desc, keyword)
+
+    @staticmethod
+    def _page_details(data: List[Dict], page: int, page_size: int, sort_by: str, desc: bool, keyword: str) -> Dict:
+        if keyword:
+            keyword = keyword.lower()
+            data = [x for x in data if keyword in x["file_name"].lower()]
+
+        with_value = [x for x in data if x.get(sort_by) is not None]
+        without_value = [x for x in data if x.get(sort_by) is None]
+        with_value.sort(key=lambda x: x[sort_by], reverse=desc)
+        data = with_value + without_value
+
+        start = (page - 1) * page_size
+        return {"total": len(data), "data": data[start:start + page_size]}
+
     def upload_files(self, files: List[UploadFile], override: bool = False):
         success_files = []
         failed_files = {}
@@ -243,6 +337,21 @@ class KBService(BaseModel):
     def update_files(self, filenames: List[str], chunk_size=CHUNK_SIZE, chunk_overlap=OVERLAP_SIZE,
                      zh_title_enhance=ZH_TITLE_ENHANCE):
         failed_files = {}
+        for status, file_name, msg in self.iter_update_files(filenames,
+                                                             chunk_size=chunk_size,
+                                                             chunk_overlap=chunk_overlap,
+                                                             zh_title_enhance=zh_title_enhance):
+            if not status:
+                failed_files[file_name] = msg
+
+        return failed_files
+
+    def iter_update_files(self, filenames: List[str], chunk_size=CHUNK_SIZE, chunk_overlap=OVERLAP_SIZE,
+                          zh_title_enhance=ZH_TITLE_ENHANCE) -> Generator:
+        '''
+        逐个文件更新到知识库，每处理完一个文件返回一次结果，便于调用方汇报进度或中途停止。
+        生成器返回值为 status, file_name, msg
+        '''
         kb_files = []
 
         for file_name in filenames:
@@ -251,31 +360,12 @@ class KBService(BaseModel):
             except Exception as e:
                 msg = f"加载文档 {file_name} 时出错：{e}"
                 logger.error(f'{e.__class__.__name__}: {msg}')
-                failed_files[file_name] = msg
+                yield False, file_name, msg
 
         # 从文件生成docs，并进行向量化。
-        # 这里利用了KnowledgeFile的缓存功能，在多线程中加载Document，然后传给KnowledgeFile
-        for status, result in files2docs_in_thread(
-                kb_files,
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                zh_title_enhance=zh_title_enhance
-        ):
-            if status:
-                kb_name, file_name, splited_docs = result
-                kb_file = KnowledgeFile(filename=file_name, knowledge_base_name=self.kb_name)
-                kb_file.splited_docs = splited_docs
-
-                self.delete_file(kb_file, delete_content=False)
-                self.add_file(kb_file)
-            else:
-                kb_name, file_name, error = result
-                failed_files[file_name] = error
-
-        return failed_files
-
-
-
-
-
-
+        # 加载切分、向量化、写入向量库、记录元数据在流水线的不同阶段中并发执行
+        pipeline = IngestPipeline(self.kb_name, self.vector_kb)
+        yield from pipeline.run(kb_files,
+                                chunk_size=chunk_size,
+                                chunk_overlap=chunk_overlap,
+                                zh_title_enhance=zh_title_enhance)
@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Union, List
+from typing import Union, List, Dict, Tuple
 from langchain_core.documents import Document
 
-from application.settings import EMBEDDINGS_MODEL_URL
+from application.settings import EMBEDDINGS_MODEL_URL, EMBEDDING_BATCH_SIZE
 from modules.fastsearch.langchain.embeddings import LangchainEmbeddings
 
 embeddings_model = LangchainEmbeddings(base_url=EMBEDDINGS_MODEL_URL)
@@ -18,14 +18,35 @@ class VectorKB(ABC):
         """添加文档到向量库"""
         raise NotImplemented
 
+    def embed_docs(self, docs: List[Document], batch_size: int = EMBEDDING_BATCH_SIZE) -> List[List[float]]:
+        """分批向量化文档"""
+        texts = [doc.page_content for doc in docs]
+        embeddings = []
+        for i in range(0, len(texts), batch_size):
+            embeddings.extend(self.embeddings_model.embed_documents(texts[i:i + batch_size]))
+        return embeddings
+
+    @abstractmethod
+    def add_embeddings(self, docs: List[Document], embeddings: List[List[float]], ids: List[str] = None, **kwargs):
+        """
+        添加已向量化的文档到向量库，返回形式：[{"id": str, "metadata": dict}, ...]
+        ids 不为空时使用指定的文档ID，已存在的同ID文档会被覆盖
+        """
+        raise NotImplemented
+
     @abstractmethod
     def delete_docs(self, kb_file, **kwargs):
-        """从向量库中删除文档"""
+        """从向量库中删除文件的所有文档，删除失败时抛出异常"""
+        raise NotImplemented
+
+    @abstractmethod
+    def search(self, query: str, top_k: int, score_threshold: float, metadata: Dict = None):
+        """从向量库中查询文档，metadata 不为空时只在 metadata 匹配的文档中查询"""
         raise NotImplemented
 
     @abstractmethod
-    def search(self, query: str, top_k: int, score_threshold: float):
-        """从向量库中查询文档"""
+    def list_docs(self, metadata: Dict) -> List[Tuple[str, Document]]:
+        """列出 metadata 匹配的所有文档，返回形式：[(id, Document), ...]"""
         raise NotImplemented
 
     @abstractmethod
@@ -34,29 +55,21 @@ class VectorKB(ABC):
 
 
 class VectorDB(ABC):
-    def __init__(self):
-        self.kbs = {}
+    """
+    向量库本身不缓存 VectorKB，VectorKB 由 KBService 持有，随知识库服务缓存一起淘汰与失效
+    """
 
     def create_kb(self, kb_name: str):
         """创建一个知识库"""
-        kb = self._create_kb(kb_name)
-        self.kbs[kb_name] = kb
-        return kb
+        return self._create_kb(kb_name)
 
     def delete_kb(self, kb_name: str):
         """删除一个知识库"""
         self._delete_kb(kb_name)
-        self.kbs.pop(kb_name, None)
 
     def get_kb(self, kb_name: str):
-        """获取知识库"""
-        if kb_name in self.kbs:
-            return self.kbs[kb_name]
-
-        kb = self._get_kb(kb_name)
-        if kb is not None:
-            self.kbs[kb_name] = kb
-        return kb
+        """获取知识库，不存在时返回 None"""
+        return self._get_kb(kb_name)
 
     # --- Custom methods ---
 
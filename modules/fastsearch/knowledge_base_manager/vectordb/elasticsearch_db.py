@@ -1,13 +1,14 @@
 import operator
 from enum import Enum
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from elasticsearch import Elasticsearch
+from elasticsearch.helpers import scan
 from langchain_elasticsearch import ElasticsearchStore
 from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_core.documents import Document
 
-from application.settings import VECTOR_DB
+from application.settings import VECTOR_DB, ES_KEYWORD_METADATA_FIELDS
 from xiaoapi.core import CustomException, logger
 from .base import VectorDB, VectorKB
 
@@ -93,65 +94,117 @@ class ElasticsearchKB(VectorKB):
 
         self.index_name = knowledge_base_name
         self.es_connection = es_connection
+        # metadata 字段名 -> 用于精确过滤的字段路径，从索引 mapping 中解析
+        self.metadata_fields = None
+        self.distance_strategy = distance_strategy
+        self._store = None
+
+    @property
+    def store(self) -> ElasticsearchStore:
+        """ElasticsearchStore 只在向量检索与写入时使用，首次使用时再创建"""
+        if self._store is None:
+            self._store = ElasticsearchStore(
+                index_name=self.index_name,
+                embedding=self.embeddings_model,
+                es_connection=self.es_connection,
+                query_field=Properties.CONTEXT.value,
+                vector_query_field=Properties.DENSE_VECTOR.value,
+                distance_strategy=self.distance_strategy
+            )
+        return self._store
 
-        self.store = ElasticsearchStore(
-            index_name=self.index_name,
-            embedding=self.embeddings_model,
-            es_connection=es_connection,
-            query_field=Properties.CONTEXT.value,
-            vector_query_field=Properties.DENSE_VECTOR.value,
-            distance_strategy=distance_strategy
+    def add_docs(self, docs: List[Document], **kwargs):
+        logger.info(f"写入 {len(docs)} 条文档到索引 {self.index_name}")
+        ids = self.store.add_documents(documents=docs)
+        return [{"id": doc_id, "metadata": doc.metadata} for doc_id, doc in zip(ids, docs)]
+
+    def add_embeddings(self, docs: List[Document], embeddings: List[List[float]], ids: List[str] = None, **kwargs):
+        if not docs:
+            return []
+        logger.info(f"写入 {len(docs)} 条已向量化的文档到索引 {self.index_name}")
+        ids = self.store.add_embeddings(
+            text_embeddings=zip([doc.page_content for doc in docs], embeddings),
+            metadatas=[doc.metadata for doc in docs],
+            ids=ids,
         )
+        return [{"id": doc_id, "metadata": doc.metadata} for doc_id, doc in zip(ids, docs)]
 
-    def add_docs(self, docs: List[Document], **kwargs):
-        print(f"ElasticsearchKB.print 输入的docs参数长度为:{len(docs)}")
-        print("*" * 100)
-        self.store.add_documents(documents=docs)
-
-        # 获取 id 和 source , 格式：[{"id": str, "metadata": dict}, ...]
-        print("写入数据成功.")
-        print("*" * 100)
-
-        if self.es_connection.indices.exists(index=self.index_name):
-            file_path = docs[0].metadata.get("source")
-            query = {
-                "query": {
-                    "term": {
-                        "metadata.source.keyword": file_path
-                    }
-                }
-            }
-            search_results = self.es_connection.search(index=self.index_name, body=query)
-            if len(search_results["hits"]["hits"]) == 0:
-                raise ValueError("召回元素个数为0")
-        info_docs = [{"id": hit["_id"], "metadata": hit["_source"]["metadata"]} for hit in search_results["hits"]["hits"]]
-        return info_docs
+    def get_metadata_field(self, key: str) -> str:
+        """
+        获取 metadata 字段用于精确过滤的路径：keyword、数值等类型直接使用 metadata.<key>，
+        动态映射的 text 类型使用其 keyword 子字段。索引中还没有该字段时重新读取 mapping。
+        """
+        if self.metadata_fields is None or key not in self.metadata_fields:
+            mapping = self.es_connection.indices.get_mapping(index=self.index_name)
+            properties = next(iter(mapping.values()))["mappings"].get("properties", {})
+            fields = {}
+            for name, prop in properties.get("metadata", {}).get("properties", {}).items():
+                if prop.get("type") == "text":
+                    keyword_fields = [k for k, v in prop.get("fields", {}).items() if v.get("type") == "keyword"]
+                    if keyword_fields:
+                        fields[name] = f"metadata.{name}.{keyword_fields[0]}"
+                elif "properties" not in prop:
+                    fields[name] = f"metadata.{name}"
+            self.metadata_fields = fields
+        return self.metadata_fields.get(key, f"metadata.{key}")
+
+    @staticmethod
+    def _source_clause(field: str, value) -> Dict:
+        """
+        source 的单个值转换为不区分大小写的 term 或 wildcard 子句。
+        与数据库中的 like 一致，% 匹配任意多个字符、_ 匹配单个字符，文件名中的 *、?、\\ 转义后按字面匹配
+        """
+        if not isinstance(value, str):
+            raise CustomException(f"metadata 中 source 的值必须是字符串：{value!r}")
+        if "%" not in value and "_" not in value:
+            return {"term": {field: {"value": value, "case_insensitive": True}}}
+        pattern = "".join("\\" + c if c in "*?\\" else c for c in value)
+        pattern = pattern.replace("%", "*").replace("_", "?")
+        return {"wildcard": {field: {"value": pattern, "case_insensitive": True}}}
+
+    def build_metadata_filter(self, metadata: Dict) -> List[Dict]:
+        """
+        将 metadata 转换为 ES filter 子句，值为列表时匹配其中任意一个。
+        source（文件名）与数据库中一样不区分大小写，并支持 sql 通配符 % 与 _
+        """
+        filters = []
+        for key, value in (metadata or {}).items():
+            field = self.get_metadata_field(key)
+            if key == "source" and isinstance(value, (list, tuple)):
+                filters.append({"bool": {"should": [self._source_clause(field, v) for v in value],
+                                         "minimum_should_match": 1}})
+            elif key == "source":
+                filters.append(self._source_clause(field, value))
+            elif isinstance(value, (list, tuple)):
+                filters.append({"terms": {field: list(value)}})
+            else:
+                filters.append({"term": {field: value}})
+        return filters
 
     def delete_docs(self, kb_file, **kwargs):
-        # 从向量数据库中删除索引(文档名称是Keyword)
+        # 从向量数据库中删除该文件的所有文档，文件名不区分大小写（同 build_metadata_filter 与数据库中的文件名查询）。
+        # 删除失败时抛出异常：调用方随后会重新写入该文件的文档，原有文档未删除会导致文档重复
         query = {
-            "query": {
-                "term": {
-                    "metadata.source.keyword": kb_file.filename
-                }
+            "term": {
+                self.get_metadata_field("source"): {"value": kb_file.filename, "case_insensitive": True}
             }
         }
-        # 注意设置size，默认返回10个。
-        search_results = self.es_connection.search(index=self.index_name, body=query, size=50)
-        delete_list = [hit["_id"] for hit in search_results['hits']['hits']]
-
-        if len(delete_list) == 0:
-            return None
-        else:
-            for doc_id in delete_list:
-                try:
-                    self.es_connection.delete(index=self.index_name, id=doc_id, refresh=True)
-                except Exception as e:
-                    logger.error(f"ES Docs Delete Error! {e}")
-
-    def search(self, query: str, top_k: int, score_threshold: float):
-        knn_docs = self.search_knn(query, top_k, score_threshold)
-        bm25_docs = self.search_bm25(query, top_k, score_threshold)
+        try:
+            resp = self.es_connection.delete_by_query(index=self.index_name, query=query, refresh=True,
+                                                      conflicts="proceed")
+        except Exception as e:
+            logger.error(f"ES Docs Delete Error! {e}")
+            raise
+        if resp.get("failures"):
+            msg = f"ES Docs Delete Error! {kb_file.filename}: {resp['failures'][:3]}"
+            logger.error(msg)
+            raise RuntimeError(msg)
+
+    def search(self, query: str, top_k: int, score_threshold: float, metadata: Dict = None):
+        # metadata 过滤条件同时作用于向量搜索（kNN 预过滤）与 BM25 搜索
+        filters = self.build_metadata_filter(metadata)
+        knn_docs = self.search_knn(query, top_k, score_threshold, filters)
+        bm25_docs = self.search_bm25(query, top_k, score_threshold, filters)
 
         logger.debug(f"knn_docs:{knn_docs}")
         logger.debug(f"bm25_docs:{bm25_docs}")
@@ -161,23 +214,28 @@ class ElasticsearchKB(VectorKB):
 
         return docs
 
-    def search_knn(self, query: str, top_k: int, score_threshold: float):
+    def search_knn(self, query: str, top_k: int, score_threshold: float, filters: List[Dict] = None):
         """向量搜索"""
-        docs = self.store.similarity_search_with_score(query=query, k=top_k)
+        docs = self.store.similarity_search_with_score(query=query, k=top_k, filter=filters)
         # docs = handle_score_threshold(score_threshold, top_k, docs) # 这里的分数范围比较小，不适合做阈值筛选，放在后面的reranker里做阈值筛选
         return docs
 
-    def search_bm25(self, query: str, top_k: int, score_threshold: float):
+    def search_bm25(self, query: str, top_k: int, score_threshold: float, filters: List[Dict] = None):
         query_dict = {
             "explain": False,
             "query": {
-                # "match": {
-                #     Properties.CONTEXT.value: query
-                # },
-                "multi_match": {
-                    "query": query,
-                    "type": "most_fields",
-                    "fields": [Properties.CONTEXT.value, "metadata.head1", "metadata.head2", "metadata.head3"]
+                "bool": {
+                    "must": {
+                        # "match": {
+                        #     Properties.CONTEXT.value: query
+                        # },
+                        "multi_match": {
+                            "query": query,
+                            "type": "most_fields",
+                            "fields": [Properties.CONTEXT.value, "metadata.head1", "metadata.head2", "metadata.head3"]
+                        }
+                    },
+                    "filter": filters or [],
                 }
             },
             "size": top_k
@@ -215,32 +273,41 @@ class ElasticsearchKB(VectorKB):
             )
         return docs_and_scores
 
+    def list_docs(self, metadata: Dict) -> List[Tuple[str, Document]]:
+        query = {
+            "query": {
+                "bool": {
+                    "filter": self.build_metadata_filter(metadata)
+                }
+            }
+        }
+        results = []
+        for hit in scan(self.es_connection, index=self.index_name, query=query,
+                        _source_includes=[Properties.CONTEXT.value, "metadata"]):
+            source = hit["_source"]
+            results.append((hit["_id"], Document(page_content=source.get(Properties.CONTEXT.value, ""),
+                                                 metadata=source.get("metadata", {}))))
+        return results
+
     def get_docs_by_ids(self, ids: List[str]) -> List[Document]:
+        if not ids:
+            return []
         results = []
-        for doc_id in ids:
-            try:
-                res = self.es_connection.get(
-                    index=self.index_name,
-                    id=doc_id,
-                    refresh=True
-                )
-                if "_source" in res:
-                    source = res["_source"]
-                    context = ""
-                    metadata = ""
-                    if Properties.CONTEXT.value in source:
-                        context = source[Properties.CONTEXT.value]
-                    if "metadata" in source:
-                        metadata = source["metadata"]
-                    results.append(Document(page_content=context, metadata=metadata))
-            except Exception as e:
-                logger.error(f"ES Docs get_doc_by_ids Error! {e}")
+        try:
+            res = self.es_connection.mget(index=self.index_name, ids=ids,
+                                          source_includes=[Properties.CONTEXT.value, "metadata"])
+            for doc in res["docs"]:
+                if doc.get("found"):
+                    source = doc["_source"]
+                    results.append(Document(page_content=source.get(Properties.CONTEXT.value, ""),
+                                            metadata=source.get("metadata", {})))
+        except Exception as e:
+            logger.error(f"ES Docs get_doc_by_ids Error! {e}")
         return results
 
 
 class ElasticsearchDB(VectorDB):
     def __init__(self, distance_strategy: DistanceStrategy = DistanceStrategy.EUCLIDEAN_DISTANCE):
-        super().__init__()
         self.distance_strategy = distance_strategy
 
         config = VECTOR_DB["es"]
@@ -386,6 +453,8 @@ class ElasticsearchDB(VectorDB):
                             "similarity": "custom_bm25",
                             "analyzer": "custom_analyzer"
                         },
+                        # 常用于过滤的字段映射为 keyword，见 ES_KEYWORD_METADATA_FIELDS
+                        **{field: {"type": "keyword"} for field in ES_KEYWORD_METADATA_FIELDS},
                         # "source": {
                         #     "type": "text",
                         #     "fields": {
@@ -2,6 +2,7 @@ import json
 import urllib
 from fastapi import APIRouter, File, Form, UploadFile, Body, Query
 from sse_starlette import EventSourceResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import FileResponse
 from typing import List
 
@@ -11,23 +12,29 @@ from xiaoapi.core import CustomException, logger
 from xiaoapi.response import SuccessResponse, ErrorResponse
 from .utils import validate_kb_name, DocumentWithVSId
 from .knowledge_base_manager.file import file_manager
-from .knowledge_base_manager.file.knowledge_file import files2docs_in_thread, KnowledgeFile
+from .knowledge_base_manager.file.knowledge_file import KnowledgeFile
 from .knowledge_base_manager.kb_service import KBService
+from .knowledge_base_manager.ingest_worker import asubmit_ingest_job
+from .knowledge_base_manager.db import repository as db
 from modules.fastsearch.langchain.reranker import LangchainReranker
 
 
 router = APIRouter()
 
+# 分页获取文件信息时可用的排序字段
+FILE_DETAIL_SORT_FIELDS = ["No", "file_name", "file_ext", "file_version", "document_loader", "text_splitter",
+                           "docs_count", "create_time", "file_mtime", "file_size"]
+
 
 @router.get("/list_knowledge_bases", summary="获取知识库列表")
 async def list_knowledge_bases():
-    names = KBService.get_all_kb_names()
+    names = await KBService.aget_all_kb_names()
     return SuccessResponse(data=names)
 
 
 @router.get("/list_knowledge_base_details", summary="获取所有知识库信息")
 async def list_knowledge_base_details():
-    details = KBService.get_all_kb_details()
+    details = await KBService.aget_all_kb_details()
     return SuccessResponse(data=details)
 
 
@@ -40,7 +47,7 @@ async def create_knowledge_base(
         return ErrorResponse(msg="Don't attack me")
     if knowledge_base_name is None or knowledge_base_name.strip() == "":
         return ErrorResponse(msg="知识库名称不能为空，请重新填写知识库名称")
-    if KBService.exist_kb(knowledge_base_name):
+    if await KBService.aexist_kb(knowledge_base_name):
         return ErrorResponse(msg=f"已存在知识库{knowledge_base_name}")
 
     try:
@@ -61,7 +68,7 @@ async def delete_knowledge_base(
         return ErrorResponse(msg="Don't attack me")
 
     knowledge_base_name = urllib.parse.unquote(knowledge_base_name)
-    if not KBService.exist_kb(knowledge_base_name):
+    if not await KBService.aexist_kb(knowledge_base_name):
         return ErrorResponse(msg=f"未找到知识库 {knowledge_base_name}")
 
     try:
@@ -82,7 +89,7 @@ async def update_kb_info(
         return ErrorResponse(code=403, msg="Don't attack me")
 
     try:
-        kb_service = KBService.get_kb_service(knowledge_base_name)
+        kb_service = await KBService.aget_kb_service(knowledge_base_name)
     except CustomException as e:
         return ErrorResponse(msg=e.msg)
 
@@ -109,18 +116,13 @@ async def recreate_vector_store(
 
         kb_service.clear_kb()
         files = file_manager.list_files_from_folder(knowledge_base_name)
-        kb_files = [(file, knowledge_base_name) for file in files]
-        i = 0
-        for status, result in files2docs_in_thread(
-                kb_files,
+        for i, (status, file_name, error) in enumerate(kb_service.iter_update_files(
+                files,
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
                 zh_title_enhance=zh_title_enhance
-        ):
+        )):
             if status:
-                kb_name, file_name, docs = result
-                kb_file = KnowledgeFile(filename=file_name, knowledge_base_name=kb_name)
-                kb_file.splited_docs = docs
                 yield json.dumps({
                     "code": 200,
                     "msg": f"({i + 1} / {len(files)}): {file_name}",
@@ -128,16 +130,13 @@ async def recreate_vector_store(
                     "finished": i + 1,
                     "doc": file_name,
                 }, ensure_ascii=False)
-                kb_service.add_file(kb_file)
             else:
-                kb_name, file_name, error = result
                 msg = f"添加文件‘{file_name}’到知识库‘{knowledge_base_name}’时出错：{error}。已跳过。"
                 logger.error(msg)
                 yield json.dumps({
                     "code": 500,
                     "msg": msg,
                 })
-            i += 1
 
     return EventSourceResponse(output())
 
@@ -152,21 +151,24 @@ async def search_docs(
                                                   "SCORE越小，相关度越高，"
                                                   "取到1相当于不筛选，建议设置在0.5左右",
                                       ge=0, le=2),
+        metadata: dict = Body({}, description="根据 metadata 进行过滤，仅支持一级键，值为列表时匹配其中任意一个",
+                              examples=[{"source": "test.pdf"}]),
 ):
     logger.debug(f"----------------> query:{query}")
     try:
-        kb_service = KBService.get_kb_service(knowledge_base_name)
+        kb_service = await KBService.aget_kb_service(knowledge_base_name)
     except CustomException as e:
         return ErrorResponse(msg=e.msg)
 
-    docs = kb_service.search_docs(query, top_k, score_threshold)
+    # 向量化请求与向量库的 kNN、BM25 查询都是同步调用，在线程池中执行，避免阻塞事件循环
+    docs = await kb_service.asearch_docs(query, top_k, score_threshold, metadata=metadata)
     data = [DocumentWithVSId(**x[0].dict(), score=x[1], id=x[0].metadata.get("id")) for x in docs]
 
     if USE_RERANKER:
         reranker_model = LangchainReranker(base_url=RERANKER_MODEL_URL, top_n=top_k, reranker_score=0.7)
         logger.debug("---------pre rerank------------------")
         logger.debug(data)
-        data = reranker_model.compress_documents(documents=data, query=query)
+        data = await reranker_model.acompress_documents(documents=data, query=query)
         logger.debug("---------after rerank------------------")
         logger.debug(data)
 
@@ -176,15 +178,37 @@ async def search_docs(
 @router.get("/list_kb_file_details", summary="获取某个知识库的所有文件信息")
 async def list_kb_file_details(knowledge_base_name: str = Query(..., description="知识库名称", examples=["samples"]),):
     try:
-        kb_service = KBService.get_kb_service(knowledge_base_name)
+        kb_service = await KBService.aget_kb_service(knowledge_base_name)
+    except CustomException as e:
+        return ErrorResponse(msg=e.msg)
+
+    details = await kb_service.alist_kb_file_details()
+    return SuccessResponse(data=details)
+
+
+@router.get("/page_kb_file_details", summary="分页获取某个知识库的文件信息")
+async def page_kb_file_details(
+        knowledge_base_name: str = Query(..., description="知识库名称", examples=["samples"]),
+        page: int = Query(1, description="页码，从1开始", ge=1),
+        page_size: int = Query(50, description="每页文件数", ge=1, le=500),
+        sort_by: str = Query("No", description="排序字段，如 No/file_name/docs_count/create_time/file_mtime/file_size"),
+        desc: bool = Query(False, description="是否倒序"),
+        keyword: str = Query(None, description="按文件名过滤的关键字"),
+):
+    if sort_by not in FILE_DETAIL_SORT_FIELDS:
+        return ErrorResponse(msg=f"不支持的排序字段：{sort_by}")
+
+    try:
+        kb_service = await KBService.aget_kb_service(knowledge_base_name)
     except CustomException as e:
         return ErrorResponse(msg=e.msg)
 
-    details = kb_service.list_kb_file_details()
+    details = await kb_service.apage_kb_file_details(page=page, page_size=page_size, sort_by=sort_by, desc=desc,
+                                                     keyword=keyword)
     return SuccessResponse(data=details)
 
 
-@router.post("/upload_files", summary="上传文件到知识库，并/或进行向量化")
+@router.post("/upload_files", summary="上传文件到知识库，并/或提交向量化任务")
 async def upload_files(
         files: List[UploadFile] = File(..., description="上传文件，支持多文件"),
         knowledge_base_name: str = Form(..., description="知识库名称", examples=["samples"]),
@@ -195,24 +219,25 @@ async def upload_files(
         zh_title_enhance: bool = Form(ZH_TITLE_ENHANCE, description="是否开启中文标题加强"),
 ):
     try:
-        kb_service = KBService.get_kb_service(knowledge_base_name)
+        kb_service = await KBService.aget_kb_service(knowledge_base_name)
     except CustomException as e:
         return ErrorResponse(msg=e.msg)
 
     failed_files = {}
 
-    success_files, failed = kb_service.upload_files(files, override=override)
+    success_files, failed = await run_in_threadpool(kb_service.upload_files, files, override=override)
     failed_files.update(failed)
 
-    if to_vector_store:
-        failed = kb_service.update_files(success_files, chunk_size=chunk_size, chunk_overlap=chunk_overlap,
-                                         zh_title_enhance=zh_title_enhance)
-        failed_files.update(failed)
+    job_id = None
+    if to_vector_store and success_files:
+        job_id = await asubmit_ingest_job(knowledge_base_name, success_files, chunk_size=chunk_size,
+                                          chunk_overlap=chunk_overlap, zh_title_enhance=zh_title_enhance)
 
-    return SuccessResponse(msg="文件上传与向量化完成", data={"failed_files": failed_files})
+    msg = "文件上传完成，已提交向量化任务" if job_id else "文件上传完成"
+    return SuccessResponse(msg=msg, data={"failed_files": failed_files, "job_id": job_id})
 
 
-@router.post("/update_files", summary="更新现有文件到知识库")
+@router.post("/update_files", summary="更新现有文件到知识库，向量化在后台任务中执行")
 async def update_files(
         knowledge_base_name: str = Body(..., description="知识库名称", examples=["samples"]),
         file_names: List[str] = Body(..., description="文件名称，支持多文件", examples=[["file_name1", "text.txt"]]),
@@ -221,15 +246,13 @@ async def update_files(
         zh_title_enhance: bool = Body(ZH_TITLE_ENHANCE, description="是否开启中文标题加强"),
 ):
     try:
-        kb_service = KBService.get_kb_service(knowledge_base_name)
+        kb_service = await KBService.aget_kb_service(knowledge_base_name)
     except CustomException as e:
         return ErrorResponse(msg=e.msg)
 
-    failed_files = {}
-    failed = kb_service.update_files(file_names, chunk_size=chunk_size, chunk_overlap=chunk_overlap,
-                                     zh_title_enhance=zh_title_enhance)
-    failed_files.update(failed)
-    return SuccessResponse(msg="更新文档完成", data={"failed_files": failed_files})
+    job_id = await asubmit_ingest_job(kb_service.kb_name, file_names, chunk_size=chunk_size,
+                                      chunk_overlap=chunk_overlap, zh_title_enhance=zh_title_enhance)
+    return SuccessResponse(msg="已提交向量化任务", data={"job_id": job_id})
 
 
 @router.post("/delete_files", summary="删除知识库内指定文件")
@@ -301,9 +324,35 @@ async def list_file_docs(
         metadata: dict = Body({}, description="根据 metadata 进行过滤，仅支持一级键"),
 ):
     try:
-        kb_service = KBService.get_kb_service(knowledge_base_name)
+        kb_service = await KBService.aget_kb_service(knowledge_base_name)
     except CustomException as e:
         return ErrorResponse(msg=e.msg)
 
-    data = kb_service.list_file_docs(file_name=file_name, metadata=metadata)
+    data = await kb_service.alist_file_docs(file_name=file_name, metadata=metadata)
     return data
+
+
+@router.get("/get_ingest_job", summary="获取向量化任务的状态与进度")
+async def get_ingest_job(job_id: str = Query(..., description="任务ID")):
+    job = await db.aget_job_detail(job_id)
+    if not job:
+        return ErrorResponse(msg=f"未找到任务 {job_id}")
+    return SuccessResponse(data=job)
+
+
+@router.get("/list_ingest_jobs", summary="获取向量化任务列表")
+async def list_ingest_jobs(
+        knowledge_base_name: str = Query(None, description="知识库名称", examples=["samples"]),
+        status: str = Query(None, description="任务状态：pending/running/succeeded/failed/cancelled"),
+        limit: int = Query(50, description="返回的任务数量", ge=1, le=500),
+):
+    jobs = await db.alist_jobs_from_db(kb_name=knowledge_base_name, status=status, limit=limit)
+    return SuccessResponse(data=jobs)
+
+
+@router.post("/cancel_ingest_job", summary="取消向量化任务")
+async def cancel_ingest_job(job_id: str = Body(..., embed=True, description="任务ID")):
+    status = await run_in_threadpool(db.cancel_job_in_db, job_id)
+    if status is None:
+        return ErrorResponse(msg=f"未找到任务 {job_id}")
+    return SuccessResponse(msg=f"已请求取消任务 {job_id}", data={"job_id": job_id, "status": status})
@@ -0,0 +1,3 @@
+import os
+
+os.environ.setdefault('XIAOAPI_SETTINGS_MODULE', 'application.settings')
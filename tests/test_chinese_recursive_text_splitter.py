@@ -0,0 +1,9 @@
+from modules.fastsearch.knowledge_base_manager.file.text_splitter.chinese_recursive_text_splitter import (
+    check_golden_output,
+)
+
+
+def test_golden_output():
+    """切分结果与原递归实现保存的结果（golden/chinese_recursive_text_splitter.json）一致"""
+    mismatches = check_golden_output()
+    assert not mismatches, "\n".join(mismatches)
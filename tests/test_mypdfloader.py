@@ -0,0 +1,38 @@
+import fitz
+
+from modules.fastsearch.knowledge_base_manager.file.document_loaders.mypdfloader import PDFOCRMetrics, plan_page_ocr
+
+
+def _background_png() -> bytes:
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 620, 877), 0)
+    pix.set_rect(pix.irect, (255, 255, 255))
+    return pix.tobytes("png")
+
+
+def _plan(page):
+    counts = dict.fromkeys(PDFOCRMetrics.FIELDS, 0)
+    return plan_page_ocr(page, page.get_text(""), counts), counts
+
+
+def test_scan_with_header_and_footer_is_ocred():
+    """整页扫描图上只有页眉、页脚文本层时仍然 OCR 该图片"""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_image(page.rect, stream=_background_png())
+    page.insert_text((40, 30), "CONFIDENTIAL - ACME CORP - BATES NO. ACME-000123 - Page 1 of 10", fontsize=9)
+    page.insert_text((40, 820), "Printed 2024-01-01 by records department, do not distribute further", fontsize=9)
+    images, counts = _plan(page)
+    assert len(images) == 1
+    assert counts["pages_ocr"] == 1 and counts["images_skipped"] == 0
+
+
+def test_text_over_background_is_skipped():
+    """文字铺满背景图的电子版页面跳过 OCR"""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_image(page.rect, stream=_background_png())
+    for y in range(50, 800, 15):
+        page.insert_text((40, y), "The quick brown fox jumps over the lazy dog, again and again and again.", fontsize=11)
+    images, counts = _plan(page)
+    assert images == []
+    assert counts["pages_skipped"] == 1 and counts["images_skipped"] == 1
@@ -314,6 +314,7 @@ class ApiRequest:
             query: str = "",
             top_k: int = VECTOR_SEARCH_TOP_K,
             score_threshold: int = SCORE_THRESHOLD,
+            metadata: Dict = {},
     ) -> List:
         """
         对应api.py/knowledge_base/search_docs接口
@@ -323,6 +324,7 @@ class ApiRequest:
             "knowledge_base_name": knowledge_base_name,
             "top_k": top_k,
             "score_threshold": score_threshold,
+            "metadata": metadata,
         }
 
         response = self.post(
@@ -342,6 +344,33 @@ class ApiRequest:
         response = self.get("/knowledge_base/list_kb_file_details", params=params)
         return self._get_response_value(response, as_json=True, value_func=lambda r: r.get("data", []))
 
+    def page_kb_file_details(
+            self,
+            kb_name: str,
+            page: int = 1,
+            page_size: int = 50,
+            sort_by: str = "No",
+            desc: bool = False,
+            keyword: str = None,
+    ):
+        """
+        对应api.py/knowledge_base/page_kb_file_details接口
+        返回形式：{"total": int, "data": [...]}
+        """
+        params = {
+            "knowledge_base_name": kb_name,
+            "page": page,
+            "page_size": page_size,
+            "sort_by": sort_by,
+            "desc": desc,
+        }
+        if keyword:
+            params["keyword"] = keyword
+
+        response = self.get("/knowledge_base/page_kb_file_details", params=params)
+        return self._get_response_value(response, as_json=True,
+                                        value_func=lambda r: r.get("data", {"total": 0, "data": []}))
+
     def upload_files(
             self,
             files: List[Union[str, Path, bytes]],
@@ -444,6 +473,48 @@ class ApiRequest:
         response = self.post("/knowledge_base/list_file_docs", json=data)
         return self._get_response_value(response, as_json=True)
 
+    def get_ingest_job(self, job_id: str):
+        """
+        对应api.py/knowledge_base/get_ingest_job接口
+        """
+        params = {
+            "job_id": job_id
+        }
+
+        response = self.get("/knowledge_base/get_ingest_job", params=params)
+        return self._get_response_value(response, as_json=True, value_func=lambda r: r.get("data", {}))
+
+    def list_ingest_jobs(
+            self,
+            knowledge_base_name: str = None,
+            status: str = None,
+            limit: int = 50,
+    ):
+        """
+        对应api.py/knowledge_base/list_ingest_jobs接口
+        """
+        params = {
+            "limit": limit,
+        }
+        if knowledge_base_name:
+            params["knowledge_base_name"] = knowledge_base_name
+        if status:
+            params["status"] = status
+
+        response = self.get("/knowledge_base/list_ingest_jobs", params=params)
+        return self._get_response_value(response, as_json=True, value_func=lambda r: r.get("data", []))
+
+    def cancel_ingest_job(self, job_id: str):
+        """
+        对应api.py/knowledge_base/cancel_ingest_job接口
+        """
+        data = {
+            "job_id": job_id,
+        }
+
+        response = self.post("/knowledge_base/cancel_ingest_job", json=data)
+        return self._get_response_value(response, as_json=True)
+
 
 class AsyncApiRequest(ApiRequest):
     def __init__(self, base_url: str = DEFAULT_BASE_URL, timeout: float = HTTPX_DEFAULT_TIMEOUT):
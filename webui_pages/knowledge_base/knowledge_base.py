@@ -3,6 +3,7 @@ from st_aggrid import AgGrid, JsCode
 from st_aggrid.grid_options_builder import GridOptionsBuilder
 import pandas as pd
 from typing import Literal, Dict, Tuple, List
+import math
 import time
 
 from application.settings import ZH_TITLE_ENHANCE, OVERLAP_SIZE, CHUNK_SIZE, VECTOR_DB, DEFAULT_VS_TYPE, LOADER_DICT
@@ -12,6 +13,16 @@ cell_renderer = JsCode("""function(params) {if(params.value==true){return '✓'}
 
 vs_types = [key for key in VECTOR_DB.keys()]
 
+# 文件列表可用的排序字段
+FILE_SORT_FIELDS = {
+    "No": "序号",
+    "file_name": "文档名称",
+    "docs_count": "文档数量",
+    "file_mtime": "修改时间",
+    "file_size": "文件大小",
+    "create_time": "创建时间",
+}
+
 
 def config_aggrid(
         df: pd.DataFrame,
@@ -156,16 +167,42 @@ def knowledge_base_page(api: ApiRequest):
             elif msg := check_error_msg(ret):
                 st.toast(msg, icon="✖")
 
+        # 向量化任务进度
+        jobs = api.list_ingest_jobs(knowledge_base_name=kb, limit=10)
+        if jobs:
+            running_jobs = [job for job in jobs if job["status"] in ["pending", "running"]]
+            with st.expander(f"向量化任务（进行中 {len(running_jobs)} 个）", expanded=bool(running_jobs)):
+                for job in jobs:
+                    cols = st.columns([5, 1])
+                    progress = job["finished"] / job["total"] if job["total"] else 1.0
+                    cols[0].progress(progress, f"{job['job_id'][:8]}  {job['status']}  ({job['finished']} / {job['total']})")
+                    if job in running_jobs and cols[1].button("取消", key=f"cancel_{job['job_id']}"):
+                        api.cancel_ingest_job(job["job_id"])
+                        st.rerun()
+                if st.button("刷新任务进度"):
+                    st.rerun()
+
         st.divider()
 
         # 知识库详情
         # st.info("请选择文件，点击按钮进行操作。")
-        doc_details = pd.DataFrame(api.list_kb_file_details(kb))
+        # 文件较多时分页获取，避免一次加载全部文件信息
+        cols = st.columns([3, 2, 1, 1, 1])
+        keyword = cols[0].text_input("按文件名过滤", key=f"file_keyword_{kb}")
+        sort_by = cols[1].selectbox("排序字段", FILE_SORT_FIELDS, format_func=lambda x: FILE_SORT_FIELDS[x],
+                                    key=f"file_sort_by_{kb}")
+        desc = cols[2].checkbox("倒序", key=f"file_sort_desc_{kb}")
+        page_size = cols[3].selectbox("每页", [20, 50, 100, 200], index=1, key=f"file_page_size_{kb}")
+        page = cols[4].number_input("页码", min_value=1, value=1, step=1, key=f"file_page_{kb}")
+        file_page = api.page_kb_file_details(kb, page=page, page_size=page_size, sort_by=sort_by, desc=desc,
+                                             keyword=keyword)
+        doc_details = pd.DataFrame(file_page["data"])
         selected_rows = []
         if not len(doc_details):
-            st.info(f"知识库 `{kb}` 中暂无文件")
+            st.info(f"知识库 `{kb}` 中暂无文件" if not file_page["total"] else "当前页没有文件")
         else:
-            st.write(f"知识库 `{kb}` 中已有文件:")
+            st.write(f"知识库 `{kb}` 中已有文件（共 {file_page['total']} 个，"
+                     f"第 {page} / {math.ceil(file_page['total'] / page_size)} 页）:")
             st.info("知识库中包含源文件与向量库，请从下表中选择文件后操作")
             doc_details.drop(columns=["kb_name"], inplace=True)
             doc_details = doc_details[[